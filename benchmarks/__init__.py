@@ -0,0 +1,7 @@
+"""
+Micro-benchmarks for the CPU-bound scoring paths
+
+Synthetic corpora (benchmarks.corpora), benchmark definitions
+(benchmarks.suite) and a runner that compares against tracked baselines and
+exits non-zero on regressions (python -m benchmarks.run).
+"""
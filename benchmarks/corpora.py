@@ -0,0 +1,123 @@
+"""
+Synthetic Corpora
+
+Deterministic inputs for the micro-benchmarks in three sizes. The same seed
+always yields the same text, so timings are comparable across runs and
+machines differ only in speed.
+"""
+
+import random
+from typing import Any, Dict, List
+
+SIZES = ('small', 'medium', 'large')
+
+SEED = 1729
+
+TECH_WORDS = [
+    'python', 'java', 'javascript', 'sql', 'aws', 'azure', 'docker', 'kubernetes', 'react', 'angular', 'node',
+    'machine learning', 'data analysis', 'agile', 'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch',
+    'api', 'backend', 'regression', 'classification', 'data pipeline', 'model deployment', 'flask', 'django',
+    'mongodb', 'redis', 'kafka', 'spark', 'airflow', 'terraform', 'git', 'linux', 'graphql', 'typescript'
+]
+FILLER_WORDS = [
+    'the', 'team', 'built', 'service', 'users', 'latency', 'improved', 'designed', 'owned', 'delivered',
+    'production', 'feature', 'customers', 'metrics', 'reduced', 'cost', 'reliable', 'scalable', 'worked',
+    'with', 'stakeholders', 'to', 'and', 'for', 'on', 'in', 'a', 'our', 'new', 'system', 'migration', 'release'
+]
+SOFT_WORDS = ['communication', 'leadership', 'teamwork', 'problem-solving', 'analytical']
+
+# Words per answer / job description, skills per profile, required skills per role, resume pages
+ANSWER_WORDS = {'small': 25, 'medium': 150, 'large': 600}
+JD_WORDS = {'small': 60, 'medium': 400, 'large': 2500}
+USER_SKILLS = {'small': 5, 'medium': 20, 'large': 80}
+REQUIRED_SKILLS = {'small': 10, 'medium': 100, 'large': 1000}
+RESUME_PAGES = {'small': 1, 'medium': 3, 'large': 12}
+DICTIONARY_KEYWORDS = {'small': 100, 'medium': 1000, 'large': 10000}
+COHORT_USERS = {'small': 10, 'medium': 100, 'large': 1000}
+COHORT_REQUIRED_SKILLS = {'small': 10, 'medium': 30, 'large': 60}
+JOBS_PER_SEARCH = 10
+
+
+def _rng(name: str, size: str) -> random.Random:
+    return random.Random(f"{SEED}:{name}:{size}")
+
+
+def _text(rng: random.Random, words: int, tech_ratio: float = 0.15) -> str:
+    out = []
+    for i in range(words):
+        pool = TECH_WORDS if rng.random() < tech_ratio else FILLER_WORDS
+        word = rng.choice(pool)
+        out.append(word + ('.' if i % 14 == 13 else ''))
+    return ' '.join(out)
+
+
+def interview_answers(size: str) -> List[Dict[str, Any]]:
+    """Answer / ideal answer / keyword triples for the answer scorers"""
+    rng = _rng('answers', size)
+    items = []
+    for _ in range(5):
+        items.append({
+            "answer": _text(rng, ANSWER_WORDS[size]),
+            "ideal_answer": _text(rng, max(40, ANSWER_WORDS[size] // 2)),
+            "keywords": rng.sample(TECH_WORDS, 6),
+            "similarity": rng.uniform(0.2, 0.9)
+        })
+    return items
+
+
+def job_snippets(size: str) -> Dict[str, Any]:
+    """One search result page of job snippets plus a user profile"""
+    rng = _rng('jobs', size)
+    return {
+        "snippets": [_text(rng, JD_WORDS[size] // 4, tech_ratio=0.25) for _ in range(JOBS_PER_SEARCH)],
+        "skills": [rng.choice(TECH_WORDS).title() for _ in range(USER_SKILLS[size])],
+        "domain": "backend"
+    }
+
+
+def skill_levels(size: str) -> Dict[str, Dict[str, int]]:
+    """User skill levels and a role's required levels (about half the required skills known)"""
+    rng = _rng('skills', size)
+    required = {f"skill_{i:04d}": rng.randint(1, 10) for i in range(REQUIRED_SKILLS[size])}
+    user = {name: rng.randint(0, 10) for name in required if rng.random() < 0.5}
+    return {"user_skills": user, "required_skills": required}
+
+
+def cohort(size: str) -> Dict[str, Any]:
+    """User documents of one role and the role's required levels (users know about half the skills)"""
+    rng = _rng('cohort', size)
+    required = {f"skill_{i:04d}": rng.randint(1, 10) for i in range(COHORT_REQUIRED_SKILLS[size])}
+    users = [
+        {"_id": f"user_{n}", "name": f"User {n}", "role": "Benchmark",
+         "skills": {name: rng.randint(0, 10) for name in required if rng.random() < 0.5}}
+        for n in range(COHORT_USERS[size])
+    ]
+    return {"users": users, "required_skills": required}
+
+
+def keyword_dictionary(size: str) -> List[str]:
+    """The known tech skills plus synthetic one- to three-word skill names"""
+    rng = _rng('dictionary', size)
+    words = [f"{rng.choice(TECH_WORDS)}{i}" for i in range(DICTIONARY_KEYWORDS[size])]
+    return TECH_WORDS + [' '.join(words[i:i + rng.randint(1, 3)]) for i in range(len(words))]
+
+
+def resume_text(size: str) -> str:
+    rng = _rng('resume', size)
+    sections = []
+    for heading in ('SUMMARY', 'SKILLS', 'EXPERIENCE', 'PROJECTS', 'EDUCATION'):
+        sections.append(heading)
+        sections.append(_text(rng, 40 * RESUME_PAGES[size], tech_ratio=0.3))
+    return '\n'.join(sections)
+
+
+def job_description(size: str) -> str:
+    rng = _rng('jd', size)
+    text = _text(rng, JD_WORDS[size], tech_ratio=0.2)
+    return f"Senior Backend Engineer. 5+ years. {' '.join(rng.sample(SOFT_WORDS, 2))}. {text}"
+
+
+def resume_pages(size: str) -> List[List[str]]:
+    """Lines per page for a synthetic resume PDF (about 45 lines of ~12 words per page)"""
+    rng = _rng('pdf', size)
+    return [[_text(rng, 12, tech_ratio=0.3) for _ in range(45)] for _ in range(RESUME_PAGES[size])]
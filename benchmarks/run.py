@@ -0,0 +1,211 @@
+"""
+Benchmark Runner
+
+Times every benchmark in benchmarks.suite at each corpus size and compares
+the result with the tracked baselines in benchmarks/baselines.json. The exit
+status is 1 when any benchmark is slower than its baseline by more than the
+threshold, so the run can gate a build (npm run bench). A benchmark that
+was skipped (missing dependency) or has no recorded baseline also fails the
+gate: an unmeasured path must not pass as "no regressions". --allow-missing
+downgrades those two to warnings for local exploration. --report-only prints
+regressions without failing on them, for a machine the baseline was not
+recorded on (drift correction only covers a uniform slowdown, not a runner
+whose paths are fast and slow in different proportions).
+
+Timing: the loop count is calibrated so one repeat takes at least
+--min-time seconds, then the fastest of --repeats repeats is kept (the
+minimum is the least noisy estimate of the code's own cost). As in timeit,
+the garbage collector is paused while timing, so collections triggered by
+objects left over from earlier benchmarks do not land in later ones. Output
+printed by the code under test is discarded while timing.
+
+Comparison: shared machines (CI runners, VMs) speed up and slow down as a
+whole by well over the threshold between runs, so when the run as a whole
+is slower than the baseline each benchmark is judged against that median
+slowdown ("drift") rather than the raw baseline. A faster machine is not
+corrected for, so unchanged code never turns into a regression. A benchmark over the threshold is measured --confirm more times
+and only fails if the best of those is still over it, which filters out
+one-off stalls. A uniform slowdown of every path does not fail the gate;
+the drift is printed so it can be spotted.
+
+Usage (from the repository root):
+    python -m benchmarks.run                          # gate: compare against baselines
+    python -m benchmarks.run --allow-missing --only skill_gap
+    python -m benchmarks.run --report-only            # print regressions, do not fail on them
+    python -m benchmarks.run --update-baseline        # record this machine's numbers
+"""
+
+import gc
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+from contextlib import redirect_stdout
+from datetime import datetime
+from statistics import median
+from typing import Any, Callable, Dict
+
+from benchmarks.suite import BENCHMARKS, SkipBenchmark, benchmark_ids
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+
+# Fewer compared benchmarks than this and the median says nothing about the machine
+MIN_DRIFT_SAMPLES = 5
+
+
+def _time_loops(func: Callable[[], None], loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        func()
+    return time.perf_counter() - start
+
+
+def measure(func: Callable[[], None], repeats: int, min_time: float) -> float:
+    """Seconds per call: best of `repeats`, each repeat long enough to swamp timer noise"""
+    with redirect_stdout(io.StringIO()):
+        func()  # warm-up (imports, caches, lazily compiled regexes)
+        gc.collect()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            loops = 1
+            elapsed = _time_loops(func, loops)
+            while elapsed < min_time:
+                loops = max(loops * 2, int(loops * min_time / max(elapsed, 1e-9) * 1.1))
+                elapsed = _time_loops(func, loops)
+
+            best = elapsed / loops
+            for _ in range(repeats - 1):
+                best = min(best, _time_loops(func, loops) / loops)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    return best
+
+
+def load_baselines(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {"machine": None, "benchmarks": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def machine_info() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "recordedAt": datetime.now().isoformat(timespec='seconds')
+    }
+
+
+def _format_time(seconds: float) -> str:
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for the CPU-bound scoring paths")
+    parser.add_argument('--only', action='append', help="Run benchmarks whose id contains this text (repeatable)")
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help="Minimum seconds per repeat")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Allowed slowdown over baseline before failing (0.25 = 25%%)")
+    parser.add_argument('--confirm', type=int, default=2,
+                        help="Re-measurements of a benchmark over the threshold before it counts as a regression")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true', help="Write the measured times as the new baseline")
+    parser.add_argument('--allow-missing', action='store_true',
+                        help="Only warn about skipped benchmarks and benchmarks without a baseline")
+    parser.add_argument('--report-only', action='store_true',
+                        help="Only warn about regressions (the baseline was recorded on another kind of machine)")
+    parser.add_argument('--json', help="Also write results to this file")
+    args = parser.parse_args()
+
+    baselines = load_baselines(args.baseline)
+    recorded = baselines.get("benchmarks", {})
+    results: Dict[str, Dict[str, Any]] = {}
+    funcs: Dict[str, Callable[[], None]] = {}
+    regressions, skipped, missing = [], [], []
+
+    print(f"{'benchmark':<62}{'time':>12}{'baseline':>12}{'change':>10}")
+    for bench_id in benchmark_ids(args.only):
+        name, size = bench_id[:-1].split('[')
+        try:
+            funcs[bench_id] = BENCHMARKS[name](size)
+        except SkipBenchmark as e:
+            skipped.append(bench_id)
+            print(f"{bench_id:<62}{'skipped':>12}   ({e})")
+            continue
+
+        seconds = measure(funcs[bench_id], args.repeats, args.min_time)
+        baseline = recorded.get(bench_id, {}).get("seconds")
+        if not baseline:
+            missing.append(bench_id)
+        results[bench_id] = {"seconds": seconds, "baseline": baseline}
+        change_str = f"{seconds / baseline - 1:+.1%}" if baseline else "new"
+        print(f"{bench_id:<62}{_format_time(seconds):>12}{_format_time(baseline) if baseline else '-':>12}{change_str:>10}")
+
+    ratios = [r["seconds"] / r["baseline"] for r in results.values() if r["baseline"]]
+    machine_change = median(ratios) if len(ratios) >= MIN_DRIFT_SAMPLES else 1.0
+    drift = max(1.0, machine_change)
+    if ratios:
+        print(f"\nMachine drift vs baseline: {machine_change - 1:+.1%} (median of {len(ratios)})")
+
+    for bench_id, result in results.items():
+        baseline = result["baseline"]
+        if not baseline:
+            result.update(change=None, status="new")
+            continue
+        change = result["seconds"] / (baseline * drift) - 1
+        for _ in range(args.confirm if change > args.threshold else 0):
+            result["seconds"] = min(result["seconds"], measure(funcs[bench_id], args.repeats, args.min_time))
+            change = result["seconds"] / (baseline * drift) - 1
+            if change <= args.threshold:
+                break
+        result.update(change=change, status="regression" if change > args.threshold else "ok")
+        if result["status"] == "regression":
+            regressions.append(bench_id)
+            print(f"  {'⚠️' if args.report_only else '❌'} {bench_id}: {_format_time(result['seconds'])} vs {_format_time(baseline)}, {change:+.1%} after drift")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({"machine": machine_info(), "threshold": args.threshold, "drift": drift, "results": results}, f, indent=2)
+
+    if args.update_baseline:
+        if skipped:
+            print(f"\n❌ Not updating the baseline: {len(skipped)} benchmark(s) skipped (install the missing dependencies)")
+            return 1
+        recorded.update({bench_id: {"seconds": r["seconds"]} for bench_id, r in results.items()})
+        with open(args.baseline, 'w') as f:
+            json.dump({"machine": machine_info(), "benchmarks": dict(sorted(recorded.items()))}, f, indent=2)
+            f.write('\n')
+        print(f"\n📄 Baseline updated: {args.baseline} ({len(results)} benchmarks)")
+        return 0
+
+    if baselines.get("machine"):
+        print(f"\nBaseline recorded on {baselines['machine'].get('processor')} / Python {baselines['machine'].get('python')}")
+    failed = False
+    if regressions:
+        print(f"{'⚠️' if args.report_only else '❌'} {len(regressions)} regression(s) over {args.threshold:.0%}: "
+              f"{', '.join(regressions)}")
+        failed = not args.report_only
+    for label, ids in (("skipped (missing dependencies)", skipped), ("without a baseline", missing)):
+        if ids:
+            print(f"{'⚠️' if args.allow_missing else '❌'} {len(ids)} benchmark(s) {label}")
+            failed = failed or not args.allow_missing
+    if failed:
+        return 1
+    if regressions:
+        print("Report only: regressions do not fail this run")
+        return 0
+    print("✅ No regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
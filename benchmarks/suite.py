@@ -0,0 +1,172 @@
+"""
+Benchmark Definitions
+
+Each benchmark is a setup function that takes a corpus size and returns a
+zero-argument callable running one operation. Imports happen inside setup so
+a missing optional dependency skips that benchmark instead of the suite.
+
+These are the scoring paths that run on every request once the LLMs are
+degraded: local answer evaluation, job matching, skill gaps, the keyword
+resume analysis and JD parsing, plus PDF text extraction.
+"""
+
+import os
+import sys
+from typing import Callable, Dict, List
+
+from benchmarks import corpora
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR = os.path.join(REPO_ROOT, 'skillgap-backend')
+INTERVIEW_BOT_DIR = os.path.join(REPO_ROOT, 'interview_bot-main')
+
+for path in (BACKEND_DIR, INTERVIEW_BOT_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+class SkipBenchmark(Exception):
+    """The code under test cannot be imported in this environment"""
+
+
+def _require(module: str):
+    try:
+        return __import__(module, fromlist=['_'])
+    except ImportError as e:
+        raise SkipBenchmark(f"{module}: {e}")
+
+
+def free_evaluator_score(size: str) -> Callable[[], None]:
+    """FreeAIEvaluator.evaluate_answer scoring, from a precomputed similarity (the encoder pass is the model's cost)"""
+    FreeAIEvaluator = _require('free_evaluator').FreeAIEvaluator
+    evaluator = FreeAIEvaluator.__new__(FreeAIEvaluator)  # skip loading the sentence model
+    items = corpora.interview_answers(size)
+
+    def run():
+        for item in items:
+            evaluator._score_answer(item["answer"], item["ideal_answer"], item["keywords"], item["similarity"])
+    return run
+
+
+def keyword_similarity_fallback(size: str) -> Callable[[], None]:
+    """SequenceMatcher fallback scoring of FreeAdaptiveSession.submit_answer"""
+    keyword_similarity_score = _require('free_adaptive_session').keyword_similarity_score
+    items = corpora.interview_answers(size)
+
+    def run():
+        for item in items:
+            keyword_similarity_score(item["answer"], item["ideal_answer"], item["keywords"])
+    return run
+
+
+def job_match_score(size: str) -> Callable[[], None]:
+    """GoogleJobSearchService.calculate_job_match_score over one page of results"""
+    service_cls = _require('services.google_search_service').GoogleJobSearchService
+    service = service_cls(api_key='benchmark', search_engine_id='benchmark')
+    corpus = corpora.job_snippets(size)
+
+    def run():
+        for snippet in corpus["snippets"]:
+            service.calculate_job_match_score(snippet, corpus["skills"], corpus["domain"])
+    return run
+
+
+def skill_gap_loop(size: str) -> Callable[[], None]:
+    """SkillGapService.calculate_skill_gap without the database reads"""
+    SkillGapService = _require('services.skill_gap_service').SkillGapService
+    corpus = corpora.skill_levels(size)
+
+    def run():
+        SkillGapService.compute_skill_gaps(corpus["user_skills"], corpus["required_skills"])
+    return run
+
+
+def cohort_skill_gaps(size: str) -> Callable[[], None]:
+    """CohortGaps: every user of a role in one vectorized pass, plus the aggregates"""
+    CohortGaps = _require('services.cohort_skill_gap_service').CohortGaps
+    corpus = corpora.cohort(size)
+
+    def run():
+        cohort = CohortGaps(corpus["users"], corpus["required_skills"])
+        cohort.summary()
+        cohort.histograms()
+        cohort.skill_breakdown()
+    return run
+
+
+def cohort_skill_gaps_loop(size: str) -> Callable[[], None]:
+    """The same cohort through SkillGapService.compute_skill_gaps one user at a time (reference)"""
+    SkillGapService = _require('services.skill_gap_service').SkillGapService
+    corpus = corpora.cohort(size)
+
+    def run():
+        for user in corpus["users"]:
+            SkillGapService.compute_skill_gaps(user["skills"], corpus["required_skills"])
+    return run
+
+
+def gemini_fallback_analysis(size: str) -> Callable[[], None]:
+    """GeminiService._generate_fallback_analysis (keyword resume analysis)"""
+    GeminiService = _require('services.gemini_service').GeminiService
+    service = GeminiService.__new__(GeminiService)  # no API keys or clients needed for the fallback
+    text = corpora.resume_text(size)
+
+    def run():
+        service._generate_fallback_analysis(text, "Software Engineering")
+    return run
+
+
+def parse_job_description(size: str) -> Callable[[], None]:
+    """LlamaInterviewAI.parse_job_description (keyword JD parsing)"""
+    LlamaInterviewAI = _require('free_ai_engine').LlamaInterviewAI
+    ai = LlamaInterviewAI.__new__(LlamaInterviewAI)  # no OpenRouter keys needed for local parsing
+    jd = corpora.job_description(size)
+
+    def run():
+        ai.parse_job_description(jd, "Benchmark Corp")
+    return run
+
+
+def keyword_scanner_find(size: str) -> Callable[[], None]:
+    """KeywordScanner.find over a job description, dictionary growing with the size"""
+    KeywordScanner = _require('services.keyword_scanner').KeywordScanner
+    scanner = KeywordScanner(corpora.keyword_dictionary(size))
+    jd = corpora.job_description(size)
+
+    def run():
+        scanner.find(jd)
+    return run
+
+
+def pdf_extraction(size: str) -> Callable[[], None]:
+    """ResumeTextExtractor.extract_bytes on a generated resume, single process"""
+    ResumeTextExtractor = _require('services.resume_text_extractor').ResumeTextExtractor
+    build_pdf = _require('loadtest.synthetic_pdf').build_pdf
+    extractor = ResumeTextExtractor(parallel_page_threshold=10 ** 6)  # time the parser, not process start-up
+    pdf_bytes = build_pdf(corpora.resume_pages(size))
+
+    def run():
+        extractor.extract_bytes(pdf_bytes)
+    return run
+
+
+BENCHMARKS: Dict[str, Callable[[str], Callable[[], None]]] = {
+    'free_evaluator.score_answer': free_evaluator_score,
+    'free_adaptive_session.keyword_similarity_score': keyword_similarity_fallback,
+    'google_search.calculate_job_match_score': job_match_score,
+    'skill_gap.compute_skill_gaps': skill_gap_loop,
+    'skill_gap.cohort_vectorized': cohort_skill_gaps,
+    'skill_gap.cohort_per_user_loop': cohort_skill_gaps_loop,
+    'gemini.generate_fallback_analysis': gemini_fallback_analysis,
+    'free_ai_engine.parse_job_description': parse_job_description,
+    'keyword_scanner.find': keyword_scanner_find,
+    'resume_text_extractor.extract_bytes': pdf_extraction,
+}
+
+
+def benchmark_ids(selected: List[str] = None) -> List[str]:
+    """'<benchmark>[<size>]' ids, optionally filtered by substring"""
+    ids = [f"{name}[{size}]" for name in BENCHMARKS for size in corpora.SIZES]
+    if selected:
+        ids = [i for i in ids if any(s in i for s in selected)]
+    return ids
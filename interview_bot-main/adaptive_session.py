@@ -4,6 +4,8 @@ Adaptive Interview Session - Stateful, continuous interview flow
 
 from datetime import datetime
 import json
+import uuid
+from question_prefetch import get_question_prefetcher
 
 # Try to import Gemini AI engine first, fallback to OpenAI if not available
 try:
@@ -17,23 +19,57 @@ except ImportError:
         raise ImportError("No AI engine available. Install google-generativeai or openai")
 
 class AdaptiveInterviewSession:
-    def __init__(self, mode, candidate_name, roles, company=None, jd_text=None):
+    def __init__(self, mode, candidate_name, roles, company=None, jd_text=None, ai=None, session_key=None):
         self.mode = mode  # "role_based" or "jd_based"
         self.candidate_name = candidate_name
         self.roles = roles if isinstance(roles, list) else [roles]
         self.company = company
         self.jd_text = jd_text
         
-        self.ai = InterviewAI()
+        self.ai = ai or InterviewAI()  # Engine is stateless, so API servers share one instance
         self.history = []
         self.question_count = 0
         self.start_time = datetime.now()
         self.jd_context = None
+        self.session_key = session_key or uuid.uuid4().hex  # Identifies this interview to the question prefetcher
+        self.prefetcher = get_question_prefetcher()
         
         # Parse JD if provided
         if jd_text and company:
             self.jd_context = self.ai.parse_job_description(jd_text, company)
     
+    def to_state(self):
+        """Serialize session state to a JSON-friendly dict (for session stores)"""
+        return {
+            "mode": self.mode,
+            "candidate_name": self.candidate_name,
+            "roles": self.roles,
+            "company": self.company,
+            "jd_text": self.jd_text,
+            "jd_context": self.jd_context,
+            "history": self.history,
+            "question_count": self.question_count,
+            "start_time": self.start_time.isoformat()
+        }
+    
+    @classmethod
+    def from_state(cls, state, ai=None, session_key=None):
+        """Rebuild a session from to_state() output without re-parsing the JD"""
+        session = cls.__new__(cls)
+        session.mode = state["mode"]
+        session.candidate_name = state["candidate_name"]
+        session.roles = state["roles"]
+        session.company = state.get("company")
+        session.jd_text = state.get("jd_text")
+        session.jd_context = state.get("jd_context")
+        session.history = state.get("history", [])
+        session.question_count = state.get("question_count", 0)
+        session.start_time = datetime.fromisoformat(state["start_time"])
+        session.ai = ai or InterviewAI()
+        session.session_key = session_key or uuid.uuid4().hex
+        session.prefetcher = get_question_prefetcher()
+        return session
+    
     def start_interview(self):
         """Initialize interview"""
         self.start_time = datetime.now()
@@ -51,31 +87,57 @@ class AdaptiveInterviewSession:
         }
     
     def get_next_question(self):
-        """Generate next adaptive question"""
+        """Generate next adaptive question (served from the speculative prefetch when it still fits)"""
         
-        # Build context for AI
-        context = {
-            "mode": self.mode,
-            "roles": self.roles,
-            "company": self.company,
-            "question_count": self.question_count,
-            "history": self.history,
-            "jd_context": json.dumps(self.jd_context) if self.jd_context else None,
-            "avg_score": self._calculate_avg_score(),
-            "performance_trend": self._get_performance_trend()
-        }
-        
-        # Generate question
-        question_data = self.ai.generate_next_question(context)
+        question_data = self.prefetcher.take(
+            self.session_key,
+            self.question_count + 1,
+            self._calculate_avg_score(),
+            asked=[h["question"] for h in self.history]
+        )
+        if question_data is None:
+            question_data = self.ai.generate_next_question(self._question_context(self.history, self.question_count))
         self.question_count += 1
         
-        return {
+        served = {
             "question_number": self.question_count,
             "question": question_data["question"],
             "category": question_data["category"],
             "difficulty": question_data.get("difficulty", "Medium"),
             "reasoning": question_data.get("reasoning", "")
         }
+        self._prefetch_next_question(served)
+        return served
+    
+    def _question_context(self, history, question_count):
+        """Build the question generation context for the given history"""
+        return {
+            "mode": self.mode,
+            "roles": self.roles,
+            "company": self.company,
+            "question_count": question_count,
+            "history": history,
+            "jd_context": json.dumps(self.jd_context) if self.jd_context else None,
+            "avg_score": self._calculate_avg_score(history),
+            "performance_trend": self._get_performance_trend(history)
+        }
+    
+    def _prefetch_next_question(self, served):
+        """Speculatively generate the following question while the candidate answers this one"""
+        predicted_score = self._calculate_avg_score() if self.history else 6.0
+        # Assume the pending answer scores at the current average
+        speculative_history = self.history + [{
+            **served,
+            "answer": "(answer in progress)",
+            "score": round(predicted_score, 1)
+        }]
+        context = self._question_context(speculative_history, self.question_count)
+        self.prefetcher.prefetch(
+            self.session_key,
+            self.question_count + 1,
+            predicted_score,
+            lambda: self.ai.generate_next_question(context)
+        )
     
     def submit_answer(self, question_data, answer):
         """Evaluate answer and provide feedback"""
@@ -134,6 +196,9 @@ class AdaptiveInterviewSession:
         end_time = datetime.now()
         duration = (end_time - self.start_time).total_seconds() / 60
         
+        # The interview is over: drop any speculative next question
+        self.prefetcher.cancel(self.session_key)
+        
         # Get AI-generated assessment
         session_data = {
             "candidate_name": self.candidate_name,
@@ -177,18 +242,20 @@ class AdaptiveInterviewSession:
             json.dump(report, f, indent=2)
         return filepath
     
-    def _calculate_avg_score(self):
+    def _calculate_avg_score(self, history=None):
         """Calculate average score"""
-        if not self.history:
+        history = self.history if history is None else history
+        if not history:
             return 0
-        return sum(h["score"] for h in self.history) / len(self.history)
+        return sum(h["score"] for h in history) / len(history)
     
-    def _get_performance_trend(self):
+    def _get_performance_trend(self, history=None):
         """Get performance trend"""
-        if len(self.history) < 2:
+        history = self.history if history is None else history
+        if len(history) < 2:
             return "Starting"
         
-        recent = [h["score"] for h in self.history[-3:]]
+        recent = [h["score"] for h in history[-3:]]
         avg_recent = sum(recent) / len(recent)
         
         if avg_recent >= 8:
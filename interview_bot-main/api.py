@@ -5,7 +5,10 @@ Exposes interview bot functionality to React frontend
 
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-from adaptive_session import AdaptiveInterviewSession
+from adaptive_session import AdaptiveInterviewSession, InterviewAI
+from session_store import create_session_store
+from question_prefetch import get_question_prefetcher
+from request_profiler import init_app as init_profiler
 import os
 import uuid
 from datetime import datetime
@@ -14,8 +17,30 @@ import json
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
 
-# Store active interview sessions in memory (use Redis/DB in production)
-sessions = {}
+# Per-request profiles on demand (PROFILE_ALL_REQUESTS or PROFILE_HEADER_TOKEN)
+init_profiler(app)
+
+# Interview session state (in-memory LRU by default, INTERVIEW_SESSION_STORE=mongodb to share across workers)
+sessions = create_session_store()
+
+# The AI engine holds no per-session state, so one instance serves every session
+_ai_engine = None
+
+
+def get_ai_engine():
+    """Get or create the shared AI engine"""
+    global _ai_engine
+    if _ai_engine is None:
+        _ai_engine = InterviewAI()
+    return _ai_engine
+
+
+def load_session(session_id):
+    """Rehydrate a session from the store, or None if missing/expired"""
+    state = sessions.get(session_id)
+    if state is None:
+        return None
+    return AdaptiveInterviewSession.from_state(state, ai=get_ai_engine(), session_key=session_id)
 
 # Video storage directory
 VIDEO_DIR = "interview_videos"
@@ -28,6 +53,12 @@ def health_check():
     return jsonify({"status": "healthy", "timestamp": datetime.now().isoformat()})
 
 
+@app.route('/api/interview/prefetch/stats', methods=['GET'])
+def prefetch_stats():
+    """Speculative next-question prefetch counters and hit rate"""
+    return jsonify({"success": True, "prefetch": get_question_prefetcher().stats()})
+
+
 @app.route('/api/interview/start', methods=['POST'])
 def start_interview():
     """
@@ -54,15 +85,17 @@ def start_interview():
             candidate_name=candidate_name,
             roles=[job_title],
             company=company,
-            jd_text=None
+            jd_text=None,
+            ai=get_ai_engine(),
+            session_key=session_id
         )
         
-        # Store session
-        sessions[session_id] = session
-        
         # Start interview
         start_info = session.start_interview()
         
+        # Store session
+        sessions.create(session_id, session.to_state())
+        
         return jsonify({
             "success": True,
             "session_id": session_id,
@@ -82,11 +115,12 @@ def get_next_question(session_id):
     Get the next interview question
     """
     try:
-        if session_id not in sessions:
+        session = load_session(session_id)
+        if session is None:
             return jsonify({"success": False, "error": "Session not found"}), 404
         
-        session = sessions[session_id]
         question_data = session.get_next_question()
+        sessions.update(session_id, {"question_count": session.question_count})
         
         return jsonify({
             "success": True,
@@ -108,7 +142,8 @@ def submit_answer(session_id):
     }
     """
     try:
-        if session_id not in sessions:
+        session = load_session(session_id)
+        if session is None:
             return jsonify({"success": False, "error": "Session not found"}), 404
         
         data = request.json
@@ -121,8 +156,9 @@ def submit_answer(session_id):
                 "error": "Answer cannot be empty"
             }), 400
         
-        session = sessions[session_id]
         result = session.submit_answer(question_data, answer)
+        # Persist only the new history entry (atomic append in every backend)
+        sessions.append(session_id, "history", session.history[-1])
         
         return jsonify({
             "success": True,
@@ -140,10 +176,10 @@ def get_final_report(session_id):
     Get final interview report
     """
     try:
-        if session_id not in sessions:
+        session = load_session(session_id)
+        if session is None:
             return jsonify({"success": False, "error": "Session not found"}), 404
         
-        session = sessions[session_id]
         report = session.get_final_report()
         
         # Save report to file
@@ -169,7 +205,8 @@ def upload_video(session_id):
     Upload interview video recording
     """
     try:
-        if session_id not in sessions:
+        state = sessions.get(session_id)
+        if state is None:
             return jsonify({"success": False, "error": "Session not found"}), 404
         
         if 'video' not in request.files:
@@ -180,10 +217,8 @@ def upload_video(session_id):
         if video_file.filename == '':
             return jsonify({"success": False, "error": "Empty filename"}), 400
         
-        session = sessions[session_id]
-        
         # Save video with session info
-        filename = f"interview_{session.candidate_name}_{session_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.webm"
+        filename = f"interview_{state['candidate_name']}_{session_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.webm"
         filepath = os.path.join(VIDEO_DIR, filename)
         
         video_file.save(filepath)
@@ -205,11 +240,10 @@ def get_session_status(session_id):
     Get current interview session status
     """
     try:
-        if session_id not in sessions:
+        session = load_session(session_id)
+        if session is None:
             return jsonify({"success": False, "error": "Session not found"}), 404
         
-        session = sessions[session_id]
-        
         return jsonify({
             "success": True,
             "session_id": session_id,
@@ -231,14 +265,12 @@ def end_interview(session_id):
     End interview session and clean up
     """
     try:
-        if session_id in sessions:
-            # Get final report before deleting session
-            session = sessions[session_id]
+        # Remove session from the store, keeping its last state for the report
+        state = sessions.delete(session_id)
+        if state is not None:
+            session = AdaptiveInterviewSession.from_state(state, ai=get_ai_engine(), session_key=session_id)
             report = session.get_final_report()
             
-            # Remove session from memory
-            del sessions[session_id]
-            
             return jsonify({
                 "success": True,
                 "message": "Interview session ended",
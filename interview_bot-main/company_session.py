@@ -6,14 +6,14 @@ from datetime import datetime
 import json
 from question_bank import get_questions_for_role, get_all_roles
 from company_questions import get_company_questions, get_available_companies
-from free_evaluator import FreeAIEvaluator
+from free_evaluator import get_evaluator
 
 class CompanyInterviewSession:
     def __init__(self, role, candidate_name, company=None):
         self.role = role
         self.candidate_name = candidate_name
         self.company = company
-        self.evaluator = FreeAIEvaluator()
+        self.evaluator = get_evaluator()
         
         # Get questions
         if company:
@@ -0,0 +1,106 @@
+"""
+Ideal Answer Embedding Index
+
+Precomputes sentence embeddings for every static ideal answer in
+question_bank.py and every generated company question, so answer
+evaluation never re-encodes them. Vectors are L2-normalized (cosine
+similarity is a dot product) and cached on disk as a memory-mapped .npy file.
+"""
+
+import os
+import json
+import hashlib
+import numpy as np
+from question_bank import QUESTION_BANK, get_all_roles
+from company_questions import COMPANY_PROFILES, get_company_questions
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".embedding_cache")
+
+
+def collect_ideal_answers():
+    """Return every distinct ideal answer from the question bank and company generator"""
+    answers = []
+    for categories in QUESTION_BANK.values():
+        for questions in categories.values():
+            answers.extend(q["ideal_answer"] for q in questions)
+
+    for company in COMPANY_PROFILES:
+        for role in get_all_roles():
+            answers.extend(q["ideal_answer"] for q in get_company_questions(company, role))
+
+    return list(dict.fromkeys(answers))
+
+
+class IdealAnswerIndex:
+    """Text -> normalized embedding lookup for static ideal answers"""
+
+    def __init__(self, acquire_model, model_name, texts=None, cache_dir=DEFAULT_CACHE_DIR):
+        """
+        Build or load the index
+
+        Args:
+            acquire_model: Zero-argument callable returning a context manager that
+                yields the SentenceTransformer for one encode call, e.g.
+                lambda: registry.use("sentence_transformer") - the index never
+                keeps the model itself, so the registry can unload it when idle
+            model_name: Model identifier (part of the cache key)
+            texts: Texts to index (defaults to collect_ideal_answers())
+            cache_dir: Directory for the .npy/.json cache (None disables disk caching)
+        """
+        self.acquire_model = acquire_model
+        self.texts = texts if texts is not None else collect_ideal_answers()
+        self.positions = {text: i for i, text in enumerate(self.texts)}
+
+        digest = hashlib.sha256(json.dumps([model_name] + self.texts).encode("utf-8")).hexdigest()[:16]
+        self.vectors = self._load(cache_dir, digest) if cache_dir else None
+
+        if self.vectors is None:
+            self.vectors = self.encode(self.texts)
+            if cache_dir:
+                self._save(cache_dir, digest)
+
+    def encode(self, texts):
+        """Encode texts in one batched forward pass as normalized float32 vectors"""
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        with self.acquire_model() as model:
+            return model.encode(
+                texts,
+                batch_size=64,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            ).astype(np.float32)
+
+    def get(self, text):
+        """Return the cached vector for text, or None if it is not indexed"""
+        position = self.positions.get(text)
+        return None if position is None else self.vectors[position]
+
+    def _paths(self, cache_dir, digest):
+        return (
+            os.path.join(cache_dir, f"ideal_answers_{digest}.npy"),
+            os.path.join(cache_dir, f"ideal_answers_{digest}.json")
+        )
+
+    def _load(self, cache_dir, digest):
+        npy_path, meta_path = self._paths(cache_dir, digest)
+        if not (os.path.exists(npy_path) and os.path.exists(meta_path)):
+            return None
+        try:
+            with open(meta_path) as f:
+                if json.load(f).get("count") != len(self.texts):
+                    return None
+            return np.load(npy_path, mmap_mode="r")
+        except Exception:
+            return None
+
+    def _save(self, cache_dir, digest):
+        npy_path, meta_path = self._paths(cache_dir, digest)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.save(npy_path, self.vectors)
+            with open(meta_path, "w") as f:
+                json.dump({"count": len(self.texts), "dim": int(self.vectors.shape[1])}, f)
+        except OSError as e:
+            print(f"⚠️ Could not cache ideal answer embeddings: {e}")
@@ -6,7 +6,11 @@ Uses open-source models for complete interview flow
 from datetime import datetime
 import json
 import random
+import uuid
+from difflib import SequenceMatcher
 from free_ai_engine import LlamaInterviewAI
+from question_prefetch import get_question_prefetcher
+from interview_context import InterviewContext
 from question_bank import get_questions_for_role
 
 """
@@ -19,8 +23,39 @@ keyword-matching evaluator to score answers. This keeps interviews
 running in text-only or speech modes without external API calls.
 """
 
+def keyword_similarity_score(answer, ideal_answer, keywords):
+    """
+    Offline answer score: keyword coverage plus difflib similarity to the ideal answer
+
+    Returns:
+        (score 0-10, keyword matches, similarity 0-1)
+    """
+    answer_lower = answer.lower()
+    matches = sum(1 for kw in keywords if kw.lower() in answer_lower)
+
+    # Fuzzy matching against the ideal answer using difflib
+    ideal_text = ideal_answer.lower()
+    similarity = 0.0
+    if ideal_text and answer_lower:
+        try:
+            similarity = SequenceMatcher(None, ideal_text, answer_lower).ratio()
+        except Exception:
+            similarity = 0.0
+
+    # Keyword coverage
+    kw_score = (matches / len(keywords)) if keywords else 0.0
+
+    # Combine signals into a 0..1 combined score
+    # Give more weight to semantic similarity, but keywords matter for technical questions
+    combined = 0.7 * similarity + 0.3 * kw_score
+
+    # Map combined to 0..10
+    score = round(combined * 10, 1)
+    return max(0, min(10, score)), matches, similarity
+
+
 class FreeAdaptiveSession:
-    def __init__(self, mode, candidate_name, roles, company=None, jd_text=None):
+    def __init__(self, mode, candidate_name, roles, company=None, jd_text=None, session_key=None):
         self.mode = mode
         self.candidate_name = candidate_name
         self.roles = roles if isinstance(roles, list) else [roles]
@@ -35,6 +70,8 @@ class FreeAdaptiveSession:
         self.start_time = datetime.now()
         self.jd_context = None
         self.role_research = None
+        self.session_key = session_key or uuid.uuid4().hex  # Identifies this interview to the question prefetcher
+        self.prefetcher = get_question_prefetcher()
 
         # Research roles in Mode 1
         if mode == "role_based" and roles:
@@ -56,6 +93,9 @@ class FreeAdaptiveSession:
                 print(f"⚠️ JD parsing failed (AI unavailable): {e}")
                 print("   JD context will not be available; using local prompts instead.")
                 self.ai_available = False
+
+        # Role research and JD are fixed from here on: serialize them once into the prompt prefix
+        self.conversation = InterviewContext(self.roles, company, self.role_research, self.jd_context)
     
     def start_interview(self):
         """Initialize interview"""
@@ -76,30 +116,25 @@ class FreeAdaptiveSession:
     def get_next_question(self):
         """Generate next adaptive question"""
         
-        context = {
-            "mode": self.mode,
-            "roles": self.roles,
-            "company": self.company,
-            "question_count": self.question_count,
-            "history": self.history,
-            "role_research": self.role_research,
-            "jd_context": json.dumps(self.jd_context) if self.jd_context else None,
-            "avg_score": self._calculate_avg_score(),
-            "performance_trend": self._get_performance_trend()
-        }
-        
-        # If AI is available, ask it to generate the next question. Otherwise
-        # fall back to the local `question_bank`.
+        # If AI is available, use the speculative prefetch when it still fits,
+        # otherwise ask it to generate the next question. Without AI fall back
+        # to the local `question_bank`.
+        question_data = None
         if self.ai_available:
+            question_data = self.prefetcher.take(
+                self.session_key,
+                self.question_count + 1,
+                self._calculate_avg_score(),
+                asked=[h["question"] for h in self.history]
+            )
+        if not question_data and self.ai_available:
             try:
-                question_data = self.ai.generate_next_question(context)
+                question_data = self.ai.generate_next_question(self._question_context(self.history, self.question_count))
             except Exception as e:
                 print(f"⚠️ AI question generation failed: {e}")
                 print("   Falling back to local question bank.")
                 self.ai_available = False
                 question_data = None
-        else:
-            question_data = None
 
         if not question_data:
             # Local fallback: pick a random role from provided roles and fetch
@@ -149,13 +184,48 @@ class FreeAdaptiveSession:
 
         self.question_count += 1
 
-        return {
+        served = {
             "question_number": self.question_count,
             "question": question_data["question"],
             "category": question_data.get("category", "General"),
             "difficulty": question_data.get("difficulty", "Medium"),
             "reasoning": question_data.get("reasoning", "")
         }
+        if self.ai_available:
+            self._prefetch_next_question(served)
+        return served
+    
+    def _question_context(self, history, question_count):
+        """Build the question generation context for the given history"""
+        return {
+            "mode": self.mode,
+            "roles": self.roles,
+            "company": self.company,
+            "question_count": question_count,
+            "history": history,
+            "role_research": self.role_research,
+            "jd_context": json.dumps(self.jd_context) if self.jd_context else None,
+            "conversation": self.conversation,
+            "avg_score": self._calculate_avg_score(history),
+            "performance_trend": self._get_performance_trend(history)
+        }
+    
+    def _prefetch_next_question(self, served):
+        """Speculatively generate the following question while the candidate answers this one"""
+        predicted_score = self._calculate_avg_score() if self.history else 6.0
+        # Assume the pending answer scores at the current average
+        speculative_history = self.history + [{
+            **served,
+            "answer": "(answer in progress)",
+            "score": round(predicted_score, 1)
+        }]
+        context = self._question_context(speculative_history, self.question_count)
+        self.prefetcher.prefetch(
+            self.session_key,
+            self.question_count + 1,
+            predicted_score,
+            lambda: self.ai.generate_next_question(context)
+        )
     
     def submit_answer(self, question_data, answer):
         """Evaluate answer and provide feedback"""
@@ -199,32 +269,7 @@ class FreeAdaptiveSession:
 
             if ideal:
                 keywords = ideal.get("keywords", [])
-                matches = 0
-                for kw in keywords:
-                    if kw.lower() in answer.lower():
-                        matches += 1
-
-                # Fuzzy matching against the ideal answer using difflib
-                from difflib import SequenceMatcher
-                ideal_text = ideal.get("ideal_answer", "").lower()
-                ans_text = answer.lower()
-                similarity = 0.0
-                if ideal_text and ans_text:
-                    try:
-                        similarity = SequenceMatcher(None, ideal_text, ans_text).ratio()
-                    except Exception:
-                        similarity = 0.0
-
-                # Keyword coverage
-                kw_score = (matches / len(keywords)) if keywords else 0.0
-
-                # Combine signals into a 0..1 combined score
-                # Give more weight to semantic similarity, but keywords matter for technical questions
-                combined = 0.7 * similarity + 0.3 * kw_score
-
-                # Map combined to 0..10
-                score = round(combined * 10, 1)
-                score = max(0, min(10, score))
+                score, matches, similarity = keyword_similarity_score(answer, ideal.get("ideal_answer", ""), keywords)
 
                 interviewer_assessment = f"Keyword matches: {matches}/{len(keywords)}. Similarity to model answer: {int(similarity*100)}%."
                 # Generate actionable suggestions
@@ -310,9 +355,13 @@ class FreeAdaptiveSession:
             "company": self.company,
             "question_count": self.question_count,
             "avg_score": self._calculate_avg_score(),
-            "history": self.history
+            "history": self.history,
+            "conversation": self.conversation
         }
         
+        # The interview is over: drop any speculative next question
+        self.prefetcher.cancel(self.session_key)
+
         ai_report = None
         if self.ai_available:
             try:
@@ -341,6 +390,7 @@ class FreeAdaptiveSession:
             "score_trend": self._get_score_trend(),
             "category_performance": {k: round(sum(v)/len(v), 2) for k, v in category_scores.items()},
             "ai_assessment": ai_report,
+            "prompt_metrics": self.conversation.stats(),
             "detailed_history": self.history
         }
     
@@ -351,18 +401,20 @@ class FreeAdaptiveSession:
             json.dump(report, f, indent=2)
         return filepath
     
-    def _calculate_avg_score(self):
+    def _calculate_avg_score(self, history=None):
         """Calculate average score"""
-        if not self.history:
+        history = self.history if history is None else history
+        if not history:
             return 0
-        return sum(h["score"] for h in self.history) / len(self.history)
+        return sum(h["score"] for h in history) / len(history)
     
-    def _get_performance_trend(self):
+    def _get_performance_trend(self, history=None):
         """Get performance trend"""
-        if len(self.history) < 2:
+        history = self.history if history is None else history
+        if len(history) < 2:
             return "Starting"
         
-        recent = [h["score"] for h in self.history[-3:]]
+        recent = [h["score"] for h in history[-3:]]
         avg_recent = sum(recent) / len(recent)
         
         if avg_recent >= 8:
@@ -8,9 +8,36 @@ from dotenv import load_dotenv
 import requests
 import json
 import random
+from provider_health import get_provider_health, parse_retry_after, ProviderUnavailableError
+from interview_context import InterviewContext, compact_json, question_fingerprint
+from skill_taxonomy import get_skill_taxonomy, TECH_CATEGORIES
+from keyword_scanner import KeywordScanner
 
 load_dotenv()
 
+PROVIDER = 'openrouter'
+
+# Role keyword -> skills to probe, for offline role research
+ROLE_SKILL_MAP = {
+    'machine learning': ['Python', 'TensorFlow', 'PyTorch', 'ML algorithms', 'statistics'],
+    'blockchain': ['Solidity', 'smart contracts', 'cryptography', 'distributed systems'],
+    'cloud': ['AWS/Azure/GCP', 'containerization', 'microservices', 'DevOps'],
+    'security': ['penetration testing', 'encryption', 'network security', 'compliance'],
+    'data': ['SQL', 'Python', 'data analysis', 'visualization', 'statistics'],
+    'frontend': ['JavaScript', 'React/Vue/Angular', 'CSS', 'responsive design'],
+    'backend': ['APIs', 'databases', 'server architecture', 'scalability'],
+    'mobile': ['iOS/Android', 'mobile UI/UX', 'app architecture', 'performance'],
+    'devops': ['CI/CD', 'Docker', 'Kubernetes', 'automation', 'monitoring'],
+    'ai': ['neural networks', 'NLP', 'computer vision', 'deep learning']
+}
+ROLE_KEYWORD_SCANNER = KeywordScanner(ROLE_SKILL_MAP.keys())
+
+# Seniority cues in a job description, checked Senior first
+JD_EXPERIENCE_SCANNER = KeywordScanner({
+    'senior': 'Senior', '5+ years': 'Senior', '7+ years': 'Senior',
+    'junior': 'Junior', 'entry': 'Junior', '0-2 years': 'Junior', 'early-career': 'Junior'
+})
+
 class LlamaInterviewAI:
     def __init__(self):
         self.api_keys = [
@@ -23,24 +50,34 @@ class LlamaInterviewAI:
             raise ValueError("No valid OpenRouter API keys found in .env file")
         
         self.current_key_index = 0
-        self.base_url = "https://openrouter.ai/api/v1/chat/completions"
+        self.base_url = f"{os.getenv('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1').rstrip('/')}/chat/completions"
         self.model = "meta-llama/llama-3.3-70b-instruct:free"
+        self.health = get_provider_health()
         print(f"✅ Llama 3.3 70B initialized with {len(self.api_keys)} API key(s)!")
     
-    def _get_next_api_key(self):
-        """Load balance between API keys"""
-        key = self.api_keys[self.current_key_index]
+    def _key_preference(self):
+        """Key labels in round-robin order, starting with the next key in rotation"""
+        start = self.current_key_index
         self.current_key_index = (self.current_key_index + 1) % len(self.api_keys)
-        return key
+        return [f"#{(start + i) % len(self.api_keys) + 1}" for i in range(len(self.api_keys))]
     
     def _call_llama(self, messages, temperature=0.7, max_retries=5):
-        """Call Llama via OpenRouter with load balancing and retry logic"""
+        """
+        Call Llama via OpenRouter with load balancing and per-key circuit breakers
+        
+        Rate-limited keys are skipped until the cooldown from the 429 response
+        ends instead of sleeping. Raises ProviderUnavailableError as soon as every
+        key is cooling down, so callers drop to their local fallbacks immediately.
+        """
         import time
         
+        last_error = None
         for attempt in range(max_retries):
+            label = self.health.acquire(PROVIDER, self._key_preference())
+            api_key = self.api_keys[int(label[1:]) - 1]
             try:
                 headers = {
-                    "Authorization": f"Bearer {self._get_next_api_key()}",
+                    "Authorization": f"Bearer {api_key}",
                     "Content-Type": "application/json",
                     "HTTP-Referer": "https://github.com/interview-bot",
                     "X-Title": "Free Voice Interview Bot"
@@ -55,28 +92,28 @@ class LlamaInterviewAI:
                 
                 response = requests.post(self.base_url, headers=headers, json=payload, timeout=30)
                 
-                # If rate limited, wait and retry
+                # If rate limited, cool this key down and move on to the next one
                 if response.status_code == 429:
-                    wait_time = (attempt + 1) * 3  # Exponential backoff: 3, 6, 9, 12, 15 seconds
-                    print(f"⏳ Rate limit hit. Waiting {wait_time} seconds (attempt {attempt + 1}/{max_retries})...")
-                    time.sleep(wait_time)
+                    retry_after = parse_retry_after(response.headers)
+                    self.health.record_failure(PROVIDER, label, retry_after=retry_after, rate_limited=True)
+                    print(f"⏳ Rate limit hit on API key {label} (attempt {attempt + 1}/{max_retries})")
+                    last_error = Exception("OpenRouter rate limit exceeded")
                     continue
                 
                 response.raise_for_status()
-                return response.json()["choices"][0]["message"]["content"]
+                content = response.json()["choices"][0]["message"]["content"]
+                self.health.record_success(PROVIDER, label)
+                return content
                 
-            except requests.exceptions.HTTPError as e:
-                if attempt == max_retries - 1:
-                    raise
-                print(f"⚠️ Request failed (attempt {attempt + 1}/{max_retries}). Retrying...")
-                time.sleep(2)
             except Exception as e:
+                self.health.record_failure(PROVIDER, label)
+                last_error = e
                 if attempt == max_retries - 1:
                     raise
-                print(f"⚠️ Error: {e}. Retrying...")
-                time.sleep(2)
+                print(f"⚠️ Request failed on API key {label} (attempt {attempt + 1}/{max_retries}): {e}. Retrying...")
+                time.sleep(1)
         
-        raise Exception("Max retries exceeded")
+        raise last_error or Exception("Max retries exceeded")
     
     def research_roles(self, roles):
         """Research interview expectations using Llama"""
@@ -107,25 +144,12 @@ Format as JSON with keys: key_skills (array), common_topics (array), interview_f
     
     def _extract_role_skills(self, role):
         """Extract key skills for role"""
-        skill_map = {
-            'machine learning': ['Python', 'TensorFlow', 'PyTorch', 'ML algorithms', 'statistics'],
-            'blockchain': ['Solidity', 'smart contracts', 'cryptography', 'distributed systems'],
-            'cloud': ['AWS/Azure/GCP', 'containerization', 'microservices', 'DevOps'],
-            'security': ['penetration testing', 'encryption', 'network security', 'compliance'],
-            'data': ['SQL', 'Python', 'data analysis', 'visualization', 'statistics'],
-            'frontend': ['JavaScript', 'React/Vue/Angular', 'CSS', 'responsive design'],
-            'backend': ['APIs', 'databases', 'server architecture', 'scalability'],
-            'mobile': ['iOS/Android', 'mobile UI/UX', 'app architecture', 'performance'],
-            'devops': ['CI/CD', 'Docker', 'Kubernetes', 'automation', 'monitoring'],
-            'ai': ['neural networks', 'NLP', 'computer vision', 'deep learning']
-        }
-        
+        # Whole-word match on the role ('ai' is not in 'maintenance'), one entry per taxonomy skill
         skills = []
-        for key, vals in skill_map.items():
-            if key in role:
-                skills.extend(vals)
+        for key in ROLE_KEYWORD_SCANNER.find(role):
+            skills.extend(ROLE_SKILL_MAP[key])
         
-        return skills if skills else ['problem solving', 'coding', 'system design', 'communication']
+        return get_skill_taxonomy().canonical(skills) if skills else ['problem solving', 'coding', 'system design', 'communication']
     
     def _extract_role_topics(self, role):
         """Extract common interview topics"""
@@ -275,22 +299,89 @@ Format as JSON with keys: key_skills (array), common_topics (array), interview_f
         avg_score = context.get('avg_score', 5)
         role_research = context.get('role_research', {})
         jd_context = context.get('jd_context')  # ✅ FIXED: Extract JD context
+        conversation = context.get('conversation') or InterviewContext(roles, company, role_research, jd_context)
         
-        # Extract all previously asked questions
+        # Full question list is only used locally for duplicate checks; the prompt gets fingerprints
         asked_questions = [h['question'].lower().strip() for h in history]
-        asked_questions_str = "\n".join([f"{i+1}. {q}" for i, q in enumerate(asked_questions)])
+        fingerprints = conversation.asked_fingerprints(history)
+        asked_questions_str = "\n".join(f"- {f}" for f in fingerprints)
         
-        # Build detailed history
+        # Recent turns verbatim, older ones as a rolling summary
         history_details = []
-        for i, h in enumerate(history[-3:]):
+        for h in conversation.recent(history):
             history_details.append(
-                f"Q{i+1}: {h['question']}\n"
+                f"Q{h.get('question_number', '?')}: {h['question']}\n"
                 f"Answer: {h['answer'][:150]}...\n"
                 f"Score: {h['score']}/10\n"
                 f"Issue: {h.get('improvements', ['N/A'])[0] if h.get('improvements') else 'N/A'}"
             )
         history_str = "\n\n".join(history_details)
+        earlier_summary = conversation.summary(history)
+        
+        # Role/JD context and rules never change within a session: one stable system prefix
+        prefix = conversation.prefix(
+            'question',
+            lambda: self._question_prefix(roles, company, role_research, jd_context)
+        )
         
+        prompt = f"""Interview Status:
+- Question Number: {question_count + 1}
+- Performance Score: {avg_score:.1f}/10
+
+Earlier Interview Summary:
+{earlier_summary if earlier_summary else 'None'}
+
+Recent Interview History:
+{history_str if history_str else 'Starting interview - ask about background and experience'}
+
+QUESTION TOPICS ALREADY COVERED (fingerprints, NEVER REPEAT OR REPHRASE):
+{asked_questions_str if asked_questions_str else 'None - this is the first question'}
+
+Generate the NEXT interview question now."""
+
+        messages = [
+            {"role": "system", "content": prefix},
+            {"role": "user", "content": prompt}
+        ]
+        conversation.record_prompt('question', messages)
+        
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                response = self._call_llama(messages, temperature=0.95)
+                # Clean response
+                response = response.strip()
+                if response.startswith('```'):
+                    response = response.split('```')[1]
+                    if response.startswith('json'):
+                        response = response[4:]
+                response = response.strip()
+                
+                result = json.loads(response)
+                new_question = result["question"].lower().strip()
+                
+                # Check if it's truly different
+                is_duplicate = any(
+                    self._similarity(new_question, asked) > 0.7 
+                    for asked in asked_questions
+                )
+                
+                if not is_duplicate:
+                    return result
+                    
+            except ProviderUnavailableError as e:
+                print(f"⏭️ {e} - using fallback question")
+                return self._get_fallback_question(question_count, roles, asked_questions)
+            except Exception as e:
+                if attempt == max_retries - 1:
+                    # Fallback with guaranteed unique question based on question count
+                    return self._get_fallback_question(question_count, roles, asked_questions)
+        
+        # Ultimate fallback
+        return self._get_fallback_question(question_count, roles, asked_questions)
+    
+    def _question_prefix(self, roles, company, role_research, jd_context):
+        """Static part of the question prompt: role/JD context, interview rules and output format"""
         # ✅ FIXED: Build job requirements section based on what's available
         if jd_context:
             # Mode 2: Use parsed job description
@@ -323,35 +414,25 @@ CRITICAL: Base questions on the JD content above."""
         elif role_research:
             # Mode 1: Use role research
             job_requirements = f"""Role-Specific Knowledge Required:
-{json.dumps(role_research, indent=2)}"""
+{compact_json(role_research)}"""
         else:
             # Fallback
             job_requirements = "Focus on general technical and behavioral competencies for the role"
         
-        prompt = f"""You are a STRICT, PROFESSIONAL interviewer conducting a high-fidelity interview simulation.
+        return f"""You are a STRICT, PROFESSIONAL interviewer conducting a high-fidelity interview simulation.
 
-Interview Status:
+Interview:
 - Role(s): {', '.join(roles)}
 - Company: {company or 'General'}
-- Question Number: {question_count + 1}
-- Performance Score: {avg_score:.1f}/10
 
 {job_requirements}
 
-Recent Interview History:
-{history_str if history_str else 'Starting interview - ask about background and experience'}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-QUESTIONS ALREADY ASKED (NEVER REPEAT):
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-{asked_questions_str if asked_questions_str else 'None - this is the first question'}
-
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 MANDATORY INTERVIEW RULES
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 1. NEVER REPEAT OR REPHRASE PREVIOUS QUESTIONS
-   - Check the list above carefully
+   - Check the list of topics already covered carefully
    - Ask about COMPLETELY different topics
    - No variations of previous questions
 
@@ -388,9 +469,7 @@ MANDATORY INTERVIEW RULES
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-Generate the NEXT interview question now.
-
-Return ONLY valid JSON (no markdown, no extra text):
+When asked for the next question, return ONLY valid JSON (no markdown, no extra text):
 {{
   "question": "<specific, non-generic, realistic question>",
   "category": "HR/Technical/Scenario",
@@ -399,40 +478,6 @@ Return ONLY valid JSON (no markdown, no extra text):
 }}
 
 REMEMBER: This is a HIGH-FIDELITY INTERVIEW SIMULATION, not a friendly chatbot."""
-
-        messages = [{"role": "user", "content": prompt}]
-        
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                response = self._call_llama(messages, temperature=0.95)
-                # Clean response
-                response = response.strip()
-                if response.startswith('```'):
-                    response = response.split('```')[1]
-                    if response.startswith('json'):
-                        response = response[4:]
-                response = response.strip()
-                
-                result = json.loads(response)
-                new_question = result["question"].lower().strip()
-                
-                # Check if it's truly different
-                is_duplicate = any(
-                    self._similarity(new_question, asked) > 0.7 
-                    for asked in asked_questions
-                )
-                
-                if not is_duplicate:
-                    return result
-                    
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    # Fallback with guaranteed unique question based on question count
-                    return self._get_fallback_question(question_count, roles, asked_questions)
-        
-        # Ultimate fallback
-        return self._get_fallback_question(question_count, roles, asked_questions)
     
     def _get_fallback_question(self, question_count, roles, asked_questions):
         """Generate fallback question based on interview stage"""
@@ -768,23 +813,17 @@ CRITICAL RULES:
     def parse_job_description(self, jd_text, company):
         """Parse JD using keyword extraction - KEEP ORIGINAL TEXT"""
         
-        jd_lower = jd_text.lower()
-        
-        # Common skill keywords
-        tech_skills = ['python', 'java', 'javascript', 'sql', 'aws', 'azure', 'docker', 'kubernetes', 
-                       'react', 'angular', 'node', 'machine learning', 'data analysis', 'agile',
-                       'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'api', 'backend',
-                       'regression', 'classification', 'data pipeline', 'model deployment']
-        
-        soft_skills = ['communication', 'leadership', 'teamwork', 'problem-solving', 'analytical']
-        
-        found_tech = [skill for skill in tech_skills if skill in jd_lower]
-        found_soft = [skill for skill in soft_skills if skill in jd_lower]
+        # Taxonomy skills mentioned in the JD, in order of first mention
+        taxonomy = get_skill_taxonomy()
+        found = taxonomy.find_in_text(jd_text)
+        found_tech = [taxonomy.name(i) for i in found if taxonomy.category(i) in TECH_CATEGORIES]
+        found_soft = [taxonomy.name(i) for i in found if taxonomy.category(i) == 'soft']
         
         # Determine experience level
-        if 'senior' in jd_lower or '5+ years' in jd_lower or '7+ years' in jd_lower:
+        levels = JD_EXPERIENCE_SCANNER.find(jd_text)
+        if 'Senior' in levels:
             exp_level = "Senior"
-        elif 'junior' in jd_lower or 'entry' in jd_lower or '0-2 years' in jd_lower or 'early-career' in jd_lower:
+        elif 'Junior' in levels:
             exp_level = "Junior"
         else:
             exp_level = "Mid"
@@ -808,19 +847,22 @@ CRITICAL RULES:
         candidate_name = session_data.get('candidate_name', 'Candidate')
         roles = session_data.get('roles', ['Professional'])
         
-        # Build complete history string
+        history = session_data['history']
+        conversation = session_data.get('conversation') or InterviewContext(roles, session_data.get('company'))
+        
+        # Older turns as the rolling summary, the recent window as one compact line per question
         history_summary = []
-        for i, item in enumerate(session_data['history'], 1):
+        for item in conversation.recent(history):
             history_summary.append(
-                f"Q{i}: {item['question']}\n"
-                f"Score: {item['score']}/10\n"
-                f"Key Issue: {item.get('improvements', ['N/A'])[0] if item.get('improvements') else 'N/A'}"
+                f"Q{item.get('question_number', '?')} [{question_fingerprint(item['question'])}]: "
+                f"{item['score']}/10, key issue: {item.get('improvements', ['N/A'])[0] if item.get('improvements') else 'N/A'}"
             )
-        history_str = "\n\n".join(history_summary)
+        earlier_summary = conversation.summary(history)
+        if earlier_summary:
+            history_summary.insert(0, f"Earlier: {earlier_summary}")
+        history_str = "\n".join(history_summary)
         
-        prompt = f"""You are an INTERVIEW PANEL providing final assessment after completing an interview.
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        prompt = f"""━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 INTERVIEW SUMMARY
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 Candidate: {candidate_name}
@@ -831,6 +873,10 @@ Average Score: {avg_score:.1f}/10
 Performance Record:
 {history_str}
 
+Provide the final panel assessment now."""
+
+        prefix = conversation.prefix('report', lambda: """You are an INTERVIEW PANEL providing final assessment after completing an interview.
+
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 PROVIDE HONEST PANEL FEEDBACK
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -879,7 +925,7 @@ As an interview panel, provide feedback DIRECTLY TO THE CANDIDATE (use "you", no
    - Use "you" not "candidate"
 
 Return ONLY valid JSON:
-{{
+{
   "overall_score": "<X/10 - justification>",
   "overall_assessment": "<2-3 honest paragraphs addressing candidate as 'you'>",
   "readiness_level": "Not Ready/Needs Practice/Interview Ready/Strong Candidate/Outstanding",
@@ -902,12 +948,16 @@ Return ONLY valid JSON:
   ],
   "estimated_success_probability": "<X% - reasoning>",
   "panel_verdict": "<final honest decision addressing candidate as 'you'>"
-}}
+}
 
-Be REALISTIC and HONEST like a real interview panel would be. Always use second person ("you") when addressing the candidate."""
+Be REALISTIC and HONEST like a real interview panel would be. Always use second person ("you") when addressing the candidate.""")
 
         try:
-            messages = [{"role": "user", "content": prompt}]
+            messages = [
+                {"role": "system", "content": prefix},
+                {"role": "user", "content": prompt}
+            ]
+            conversation.record_prompt('report', messages)
             response = self._call_llama(messages, temperature=0.5)
             
             # Clean response
@@ -2,27 +2,73 @@
 Free AI Evaluator - Uses Hugging Face models (no API key needed)
 """
 
-from sentence_transformers import SentenceTransformer, util
+import threading
+import numpy as np
 import re
+from embedding_index import IdealAnswerIndex
+from model_registry import registry, SENTENCE_MODEL_NAME
+
+MODEL_NAME = SENTENCE_MODEL_NAME
 
 class FreeAIEvaluator:
     def __init__(self):
         print("⏳ Loading AI models (first time may take a few minutes)...")
-        self.similarity_model = SentenceTransformer('all-MiniLM-L6-v2')
+        # Shared process-wide instance, leased per encode so idle unloading can free it
+        registry.get("sentence_transformer")
+        # Static ideal answers are encoded once (or loaded from the on-disk cache)
+        self.ideal_index = IdealAnswerIndex(lambda: registry.use("sentence_transformer"), MODEL_NAME)
         print("✅ Models loaded successfully!")
     
     def evaluate_answer(self, question, answer, ideal_answer, keywords, category):
         """Evaluate answer using free ML models"""
+        return self.evaluate_many([{
+            "question": question,
+            "answer": answer,
+            "ideal_answer": ideal_answer,
+            "keywords": keywords,
+            "category": category
+        }])[0]
+    
+    def evaluate_many(self, items):
+        """
+        Evaluate several answers with a single batched encoder pass
         
-        if not answer.strip():
-            return self._empty_evaluation()
+        Args:
+            items: List of dicts with question, answer, ideal_answer, keywords, category
         
-        # 1. Semantic Similarity Score
-        q_embedding = self.similarity_model.encode(question, convert_to_tensor=True)
-        a_embedding = self.similarity_model.encode(answer, convert_to_tensor=True)
-        ideal_embedding = self.similarity_model.encode(ideal_answer, convert_to_tensor=True)
+        Returns:
+            List of evaluation dicts, in the same order as items
+        """
+        pending = [i for i, item in enumerate(items) if item["answer"].strip()]
+        
+        # Encode every answer plus any ideal answer missing from the index in one forward pass
+        missing_ideals = list(dict.fromkeys(
+            items[i]["ideal_answer"] for i in pending
+            if self.ideal_index.get(items[i]["ideal_answer"]) is None
+        ))
+        vectors = self.ideal_index.encode([items[i]["answer"] for i in pending] + missing_ideals)
+        answer_vectors = vectors[:len(pending)]
+        extra_ideals = {text: vectors[len(pending) + j] for j, text in enumerate(missing_ideals)}
+        
+        results = [None] * len(items)
+        for row, i in enumerate(pending):
+            item = items[i]
+            ideal_vector = self.ideal_index.get(item["ideal_answer"])
+            if ideal_vector is None:
+                ideal_vector = extra_ideals[item["ideal_answer"]]
+            similarity_to_ideal = float(np.dot(answer_vectors[row], ideal_vector))
+            results[i] = self._score_answer(item["answer"], item["ideal_answer"], item["keywords"], similarity_to_ideal)
+        
+        for i, item in enumerate(items):
+            if results[i] is None:
+                results[i] = self._empty_evaluation()
         
-        similarity_to_ideal = util.cos_sim(a_embedding, ideal_embedding).item()
+        return results
+    
+    def _score_answer(self, answer, ideal_answer, keywords, similarity_to_ideal):
+        """Turn semantic similarity and text heuristics into the evaluation dict"""
+        
+        # 1. Semantic Similarity Score
         semantic_score = min(10, max(0, similarity_to_ideal * 10))
         
         # 2. Keyword Coverage
@@ -120,3 +166,16 @@ class FreeAIEvaluator:
             "feedback": "Please provide an answer.",
             "ideal_answer": ""
         }
+
+
+_evaluator = None
+_evaluator_lock = threading.Lock()
+
+def get_evaluator():
+    """Get or create the shared evaluator (model and ideal-answer index built once per process)"""
+    global _evaluator
+    if _evaluator is None:
+        with _evaluator_lock:
+            if _evaluator is None:
+                _evaluator = FreeAIEvaluator()
+    return _evaluator
@@ -9,7 +9,14 @@ import pyaudio
 import wave
 import tempfile
 import json
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from model_registry import registry, VOSK_MODEL_PATHS, find_vosk_model_path
+from streaming_stt import (
+    StreamingTranscriber, VoskStreamBackend, WhisperChunkBackend,
+    microphone_frames, wav_frames, wav_sample_rate
+)
 
 class FreeVoiceEngine:
     def __init__(self):
@@ -41,29 +48,21 @@ class FreeVoiceEngine:
             print(f"⚠️ TTS initialization failed: {e}")
             self.tts_engine = None
         
-        # Initialize STT engine
-        self.vosk_model = None
+        # Initialize STT engine (the Vosk model itself is leased from the registry per use)
+        self.vosk_available = False
+        self._enter_event = None
         self._init_vosk()
+        
+        # Load Whisper in the background so the first transcription does not wait for it
+        registry.warm_up_async(["whisper"])
     
     def _init_vosk(self):
         """Initialize Vosk speech recognition with better model"""
         try:
-            from vosk import Model, KaldiRecognizer, SetLogLevel
-            
-            # Suppress Vosk logs for cleaner output
-            SetLogLevel(-1)
+            import vosk  # noqa: F401 - fail early if Vosk is not installed
             
             # Try larger model for better accuracy first
-            model_paths = [
-                "vosk-model-en-us-0.22",  # Large model - better accuracy
-                "vosk-model-small-en-us-0.15"  # Small model - fallback
-            ]
-            
-            model_path = None
-            for path in model_paths:
-                if os.path.exists(path):
-                    model_path = path
-                    break
+            model_path = find_vosk_model_path()
             
             if not model_path:
                 print("⚠️ Vosk model not found. Downloading larger model for better accuracy...")
@@ -71,13 +70,15 @@ class FreeVoiceEngine:
                 print("   Or press Ctrl+C to use smaller model (40MB, lower accuracy)")
                 try:
                     self._download_vosk_model(use_large=True)
-                    model_path = "vosk-model-en-us-0.22"
+                    model_path = VOSK_MODEL_PATHS[0]
                 except KeyboardInterrupt:
                     print("\n⏩ Using smaller model instead...")
                     self._download_vosk_model(use_large=False)
-                    model_path = "vosk-model-small-en-us-0.15"
+                    model_path = VOSK_MODEL_PATHS[1]
             
-            self.vosk_model = Model(model_path)
+            # Shared process-wide model - every engine reuses the same instance
+            registry.get("vosk")
+            self.vosk_available = True
             accuracy = "high" if "0.22" in model_path else "medium"
             print(f"✅ FREE Speech Recognition initialized (Vosk - {accuracy} accuracy)")
             
@@ -171,18 +172,9 @@ class FreeVoiceEngine:
                 frames.append(data)
         else:
             # Record until Enter pressed
-            import queue
-            import threading
-            
-            stop_recording = queue.Queue()
-            
-            def wait_for_enter():
-                input()
-                stop_recording.put(True)
+            stop_recording = self._enter_pressed()
             
-            threading.Thread(target=wait_for_enter, daemon=True).start()
-            
-            while stop_recording.empty():
+            while not stop_recording.is_set():
                 try:
                     data = stream.read(self.CHUNK, exception_on_overflow=False)
                     frames.append(data)
@@ -206,6 +198,26 @@ class FreeVoiceEngine:
         
         return output_path
     
+    def _enter_pressed(self):
+        """
+        Event set when the user presses Enter
+        
+        Only one thread reads stdin at a time: if an earlier recording stopped
+        without consuming its Enter (e.g. streaming failed and we fell back to
+        record_audio), its pending reader and event are reused, so the user's
+        next Enter is not swallowed by an orphaned input() call.
+        """
+        if self._enter_event is None or self._enter_event.is_set():
+            event = threading.Event()
+            
+            def wait_for_enter():
+                input()
+                event.set()
+            
+            threading.Thread(target=wait_for_enter, daemon=True).start()
+            self._enter_event = event
+        return self._enter_event
+    
     def speech_to_text(self, audio_path):
         """
         Convert speech to text using Vosk (offline) - IMPROVED ACCURACY
@@ -218,12 +230,11 @@ class FreeVoiceEngine:
         """
         # Prefer faster-whisper (local Whisper) if installed — higher accuracy
         try:
-            from faster_whisper import WhisperModel
             print("🔄 Transcribing audio with faster-whisper (local Whisper model)...")
-            # Choose model size - uses automatically if already downloaded
-            model = WhisperModel("small", device="cpu", compute_type="int8_float16")
-            segments, info = model.transcribe(audio_path, beam_size=5)
-            text = " ".join([seg.text.strip() for seg in segments]).strip()
+            # Shared model from the registry - loaded once per process, not per utterance
+            with registry.use("whisper") as model:
+                segments, info = model.transcribe(audio_path, beam_size=5)
+                text = " ".join([seg.text.strip() for seg in segments]).strip()
             if text:
                 text = text[0].upper() + text[1:] if len(text) > 1 else text.upper()
                 print(f"✅ Transcription (whisper): \"{text}\"\n")
@@ -232,7 +243,7 @@ class FreeVoiceEngine:
             # faster-whisper not available or failed — fall back to Vosk
             pass
 
-        if not self.vosk_model:
+        if not self.vosk_available:
             print("❌ Speech recognition not available")
             return None
 
@@ -241,49 +252,50 @@ class FreeVoiceEngine:
         try:
             from vosk import KaldiRecognizer
 
-            wf = wave.open(audio_path, "rb")
+            with registry.use("vosk") as vosk_model:
+                wf = wave.open(audio_path, "rb")
 
-            if wf.getnchannels() != 1 or wf.getsampwidth() != 2:
-                print("❌ Audio file must be WAV format mono PCM.")
-                return None
+                if wf.getnchannels() != 1 or wf.getsampwidth() != 2:
+                    print("❌ Audio file must be WAV format mono PCM.")
+                    return None
 
-            # Create recognizer with larger frame rate for better accuracy
-            rec = KaldiRecognizer(self.vosk_model, wf.getframerate())
-            rec.SetWords(True)
-            rec.SetMaxAlternatives(0)  # Disable alternatives for cleaner output
-            rec.SetPartialWords(False)  # Only get final results
+                # Create recognizer with larger frame rate for better accuracy
+                rec = KaldiRecognizer(vosk_model, wf.getframerate())
+                rec.SetWords(True)
+                rec.SetMaxAlternatives(0)  # Disable alternatives for cleaner output
+                rec.SetPartialWords(False)  # Only get final results
 
-            # Process audio in larger chunks for better accuracy
-            results = []
+                # Process audio in larger chunks for better accuracy
+                results = []
 
-            while True:
-                data = wf.readframes(8000)  # Larger chunks (was 4000)
-                if len(data) == 0:
-                    break
-                if rec.AcceptWaveform(data):
-                    result = json.loads(rec.Result())
-                    if 'text' in result and result['text'].strip():
-                        results.append(result['text'].strip())
+                while True:
+                    data = wf.readframes(8000)  # Larger chunks (was 4000)
+                    if len(data) == 0:
+                        break
+                    if rec.AcceptWaveform(data):
+                        result = json.loads(rec.Result())
+                        if 'text' in result and result['text'].strip():
+                            results.append(result['text'].strip())
 
-            # Get final result
-            final_result = json.loads(rec.FinalResult())
-            if 'text' in final_result and final_result['text'].strip():
-                results.append(final_result['text'].strip())
+                # Get final result
+                final_result = json.loads(rec.FinalResult())
+                if 'text' in final_result and final_result['text'].strip():
+                    results.append(final_result['text'].strip())
 
-            # Join all results
-            text = ' '.join(results).strip()
+                # Join all results
+                text = ' '.join(results).strip()
 
-            # Post-processing: capitalize first letter, clean up spaces
-            if text:
-                text = text[0].upper() + text[1:] if len(text) > 1 else text.upper()
-                # Remove duplicate spaces
-                text = ' '.join(text.split())
+                # Post-processing: capitalize first letter, clean up spaces
+                if text:
+                    text = text[0].upper() + text[1:] if len(text) > 1 else text.upper()
+                    # Remove duplicate spaces
+                    text = ' '.join(text.split())
 
-                print(f"✅ Transcription: \"{text}\"\n")
-                return text
-            else:
-                print("⚠️ No speech detected. Please speak louder and clearer.")
-                return None
+                    print(f"✅ Transcription: \"{text}\"\n")
+                    return text
+                else:
+                    print("⚠️ No speech detected. Please speak louder and clearer.")
+                    return None
 
         except Exception as e:
             print(f"❌ Transcription error: {e}")
@@ -310,13 +322,94 @@ class FreeVoiceEngine:
         except Exception as e:
             print(f"❌ TTS error: {e}")
     
-    def record_and_transcribe(self):
+    @contextmanager
+    def _stream_backend(self, sample_rate):
+        """
+        Vosk recognizes incrementally; chunked Whisper is used when no Vosk model is loaded
+        
+        The model is leased from the registry for the whole stream.
+        """
+        if self.vosk_available:
+            with registry.use("vosk") as model:
+                yield VoskStreamBackend(model, sample_rate)
+        else:
+            with registry.use("whisper") as model:
+                yield WhisperChunkBackend(model, sample_rate)
+    
+    def _print_partial(self, text):
+        print(f"\r   📝 {text[-70:]}", end='', flush=True)
+    
+    def transcribe_stream(self, frames, sample_rate=None, on_partial=None):
+        """
+        Transcribe an iterable of PCM frames while they are produced
+        
+        Args:
+            frames: Iterable of 16-bit mono PCM byte chunks (microphone or WAV fixture)
+            sample_rate: Sample rate of the frames (default: self.RATE)
+            on_partial: Optional callback(text) for partial transcripts
+        
+        Returns:
+            Transcribed text
+        """
+        with self._stream_backend(sample_rate or self.RATE) as backend:
+            transcriber = StreamingTranscriber(
+                backend,
+                on_partial=on_partial or self._print_partial
+            ).start()
+            for frame in frames:
+                transcriber.feed(frame)
+            text = transcriber.finish()
+        if transcriber.dropped_frames:
+            print(f"\n⚠️ Recognition fell behind, dropped {transcriber.dropped_frames} audio frames")
+        return text
+    
+    def transcribe_wav_stream(self, audio_path, on_partial=None):
+        """Replay a WAV file through the streaming pipeline (used for prerecorded fixtures)"""
+        return self.transcribe_stream(wav_frames(audio_path), wav_sample_rate(audio_path), on_partial)
+    
+    def stream_and_transcribe(self, duration=None, on_partial=None):
+        """
+        Record from the microphone and transcribe while the candidate speaks - no temp file
+        
+        Args:
+            duration: Recording duration in seconds (None = record until Enter pressed)
+            on_partial: Optional callback(text) for partial transcripts
+        
+        Returns:
+            Transcribed text
+        """
+        stop_event = self._enter_pressed() if not duration else threading.Event()
+        
+        print("\n🎤 Recording... (Press Enter to stop)")
+        text = self.transcribe_stream(
+            microphone_frames(stop_event, rate=self.RATE, chunk=self.CHUNK, duration=duration),
+            self.RATE,
+            on_partial
+        )
+        print("\n🛑 Recording stopped")
+        
+        if text:
+            print(f"✅ Transcription: \"{text}\"\n")
+        else:
+            print("⚠️ No speech detected. Please speak louder and clearer.")
+        return text
+    
+    def record_and_transcribe(self, streaming=True):
         """
         Record audio from microphone and transcribe to text
         
+        Args:
+            streaming: Transcribe while recording (falls back to record-then-transcribe on failure)
+        
         Returns:
             Transcribed text
         """
+        if streaming:
+            try:
+                return self.stream_and_transcribe()
+            except Exception as e:
+                print(f"⚠️ Streaming transcription unavailable ({e}), recording to file instead")
+        
         audio_path = self.record_audio()
         text = self.speech_to_text(audio_path)
         
@@ -0,0 +1,189 @@
+"""
+Interview Conversation Context - keeps LLM prompts small as an interview grows
+
+Instead of re-sending every asked question, the full role research and the
+complete history on each call, prompts are built from:
+
+- a stable prefix (role/JD context, interview rules, output format) that is
+  serialized once per session and sent unchanged as the system message, so
+  the provider can reuse it between calls
+- a compact, deduplicated list of asked-question fingerprints
+- a rolling summary of turns older than the recent window, updated
+  incrementally as turns age out of it
+- the last few turns verbatim
+
+Every prompt is measured so per-call size can be tracked.
+"""
+
+import re
+import json
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+
+# Words that carry no topic information in a question
+STOPWORDS = {
+    'a', 'about', 'an', 'and', 'any', 'are', 'as', 'at', 'be', 'can', 'could', 'describe', 'did', 'do',
+    'does', 'explain', 'for', 'from', 'have', 'how', 'i', 'if', 'in', 'is', 'it', 'me', 'of', 'on', 'or',
+    'tell', 'that', 'the', 'this', 'time', 'to', 'walk', 'was', 'what', 'when', 'where', 'which', 'while',
+    'who', 'why', 'with', 'would', 'you', 'your', 'through', 'give', 'example', 'share', 'some'
+}
+
+FINGERPRINT_WORDS = 6
+CHARS_PER_TOKEN = 4  # rough estimate for English prompts
+
+
+def question_fingerprint(question: str) -> str:
+    """Topic fingerprint of a question: its first few distinct content words"""
+    words = []
+    for word in re.findall(r"[a-z0-9+#]+", question.lower()):
+        if len(word) > 2 and word not in STOPWORDS and word not in words:
+            words.append(word)
+        if len(words) == FINGERPRINT_WORDS:
+            break
+    return " ".join(words)
+
+
+def compact_json(value: Any) -> str:
+    """Deterministic, whitespace-free JSON (identical input gives an identical prefix)"""
+    return json.dumps(value, separators=(',', ':'), sort_keys=True, ensure_ascii=False)
+
+
+class _TurnSummary:
+    """Aggregates of the turns that have left the recent window"""
+
+    def __init__(self):
+        self.turns = 0
+        self.score_total = 0.0
+        self.min_score = None
+        self.max_score = None
+        self.categories = Counter()
+        self.issues = Counter()
+
+    def add(self, turn: Dict[str, Any]):
+        score = float(turn.get('score', 0) or 0)
+        self.turns += 1
+        self.score_total += score
+        self.min_score = score if self.min_score is None else min(self.min_score, score)
+        self.max_score = score if self.max_score is None else max(self.max_score, score)
+        self.categories[turn.get('category', 'General')] += 1
+        issue = (turn.get('improvements') or turn.get('specific_mistakes') or [None])[0]
+        if issue:
+            self.issues[issue] += 1
+
+    def render(self) -> str:
+        if not self.turns:
+            return ""
+        categories = ", ".join(f"{name} x{count}" for name, count in self.categories.most_common())
+        text = (
+            f"{self.turns} earlier questions ({categories}); "
+            f"avg score {self.score_total / self.turns:.1f}/10 (min {self.min_score:g}, max {self.max_score:g})"
+        )
+        recurring = [f"{issue} ({count}x)" for issue, count in self.issues.most_common(3)]
+        if recurring:
+            text += f"; recurring issues: {'; '.join(recurring)}"
+        return text
+
+
+class InterviewContext:
+    """Per-session prompt context: stable prefixes, rolling summary and prompt-size metrics"""
+
+    def __init__(self, roles: List[str], company: Optional[str] = None, role_research: Any = None,
+                 jd_context: Any = None, recent_turns: int = 3):
+        """
+        Args:
+            roles: Roles being interviewed for
+            company: Target company, if any
+            role_research: Role research from the AI engine (Mode 1)
+            jd_context: Parsed job description, dict or JSON string (Mode 2)
+            recent_turns: Turns kept verbatim; older ones are summarized
+        """
+        self.roles = roles
+        self.company = company
+        self.role_research = role_research
+        if isinstance(jd_context, str):
+            try:
+                jd_context = json.loads(jd_context)
+            except ValueError:
+                pass
+        self.jd_context = jd_context
+        self.recent_turns = recent_turns
+
+        self._prefixes: Dict[str, str] = {}
+        self._summary = _TurnSummary()
+        self._summarized: List[str] = []  # questions folded into _summary, in order
+        self._metrics: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    def prefix(self, kind: str, build: Callable[[], str]) -> str:
+        """Static prompt prefix for a call kind, built on first use and reused verbatim afterwards"""
+        with self._lock:
+            if kind not in self._prefixes:
+                self._prefixes[kind] = build()
+            return self._prefixes[kind]
+
+    def asked_fingerprints(self, history: List[Dict[str, Any]]) -> List[str]:
+        """Deduplicated fingerprints of every asked question, in order"""
+        fingerprints = []
+        for turn in history:
+            fingerprint = question_fingerprint(turn.get('question', ''))
+            if fingerprint and fingerprint not in fingerprints:
+                fingerprints.append(fingerprint)
+        return fingerprints
+
+    def summary(self, history: List[Dict[str, Any]]) -> str:
+        """Rolling summary of the turns older than the recent window"""
+        older = history[:-self.recent_turns] if self.recent_turns else history
+        with self._lock:
+            known = len(self._summarized)
+            if known > len(older) or [t.get('question') for t in older[:known]] != self._summarized:
+                # History diverged from what was summarized (e.g. a different snapshot): rebuild
+                self._summary = _TurnSummary()
+                self._summarized = []
+                known = 0
+            for turn in older[known:]:
+                self._summary.add(turn)
+                self._summarized.append(turn.get('question'))
+            return self._summary.render()
+
+    def recent(self, history: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Turns inside the recent window"""
+        return history[-self.recent_turns:] if self.recent_turns else []
+
+    def record_prompt(self, kind: str, messages: List[Dict[str, str]]) -> Dict[str, int]:
+        """
+        Measure a prompt before it is sent
+
+        Returns:
+            Size of this call: total and stable-prefix chars and estimated tokens
+        """
+        total_chars = sum(len(m['content']) for m in messages)
+        prefix_chars = sum(len(m['content']) for m in messages if m['role'] == 'system')
+        size = {
+            "chars": total_chars,
+            "tokens": total_chars // CHARS_PER_TOKEN,
+            "prefixTokens": prefix_chars // CHARS_PER_TOKEN
+        }
+        with self._lock:
+            metrics = self._metrics.setdefault(kind, Counter())
+            metrics['calls'] += 1
+            metrics['tokens'] += size['tokens']
+            metrics['prefixTokens'] += size['prefixTokens']
+            metrics['maxTokens'] = max(metrics['maxTokens'], size['tokens'])
+            metrics['lastTokens'] = size['tokens']
+        print(f"📏 {kind} prompt: ~{size['tokens']} tokens (~{size['prefixTokens']} in stable prefix)")
+        return size
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                kind: {
+                    "calls": metrics['calls'],
+                    "avgTokens": round(metrics['tokens'] / metrics['calls']) if metrics['calls'] else 0,
+                    "avgPrefixTokens": round(metrics['prefixTokens'] / metrics['calls']) if metrics['calls'] else 0,
+                    "maxTokens": metrics['maxTokens'],
+                    "lastTokens": metrics['lastTokens']
+                }
+                for kind, metrics in self._metrics.items()
+            }
@@ -6,6 +6,7 @@ MODE 2: JD + Company-Based
 
 from adaptive_session import AdaptiveInterviewSession
 from datetime import datetime
+from request_profiler import profile_cli
 
 def display_header():
     print("=" * 80)
@@ -269,13 +270,14 @@ def display_final_report(session):
     print("=" * 80)
 
 if __name__ == "__main__":
-    try:
-        session = run_interview()
-        if session:
-            display_final_report(session)
-    except KeyboardInterrupt:
-        print("\n\n🛑 Interview interrupted.")
-    except Exception as e:
-        print(f"\n\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+    with profile_cli("main"):
+        try:
+            session = run_interview()
+            if session:
+                display_final_report(session)
+        except KeyboardInterrupt:
+            print("\n\n🛑 Interview interrupted.")
+        except Exception as e:
+            print(f"\n\n❌ Error: {e}")
+            import traceback
+            traceback.print_exc()
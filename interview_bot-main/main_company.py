@@ -6,6 +6,7 @@ FREE - No API Key Required
 from company_session import CompanyInterviewSession
 from question_bank import get_all_roles
 from company_questions import get_available_companies
+from request_profiler import profile_cli
 
 def run_company_interview():
     print("=" * 80)
@@ -192,11 +193,12 @@ def run_company_interview():
     print("=" * 80)
 
 if __name__ == "__main__":
-    try:
-        run_company_interview()
-    except KeyboardInterrupt:
-        print("\n\nInterview interrupted.")
-    except Exception as e:
-        print(f"\n\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+    with profile_cli("main_company"):
+        try:
+            run_company_interview()
+        except KeyboardInterrupt:
+            print("\n\nInterview interrupted.")
+        except Exception as e:
+            print(f"\n\n❌ Error: {e}")
+            import traceback
+            traceback.print_exc()
@@ -7,6 +7,7 @@ MODE 2: JD + Company-Based Interview
 from adaptive_session import AdaptiveInterviewSession
 import os
 from datetime import datetime
+from request_profiler import profile_cli
 
 def print_header(text):
     print("\n" + "="*70)
@@ -293,4 +294,5 @@ def main():
         print(f"\n❌ Unexpected error: {e}")
 
 if __name__ == "__main__":
-    main()
+    with profile_cli("main_dual_mode"):
+        main()
@@ -6,6 +6,7 @@ MODE 2: JD + Company-Based Interview
 
 from free_adaptive_session import FreeAdaptiveSession
 from datetime import datetime
+from request_profiler import profile_cli
 
 def print_header(text):
     print("\n" + "="*70)
@@ -263,4 +264,5 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    main()
+    with profile_cli("main_free_dual_mode"):
+        main()
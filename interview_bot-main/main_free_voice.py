@@ -8,6 +8,7 @@ import sys
 from datetime import datetime
 from free_voice_engine import FreeVoiceEngine
 from free_adaptive_session import FreeAdaptiveSession
+from request_profiler import profile_cli
 
 def print_banner():
     print("\n" + "=" * 70)
@@ -304,4 +305,5 @@ def run_free_voice_interview():
 
 
 if __name__ == "__main__":
-    run_free_voice_interview()
+    with profile_cli("main_free_voice"):
+        run_free_voice_interview()
@@ -7,6 +7,7 @@ import sys
 from datetime import datetime
 from voice_engine import VoiceEngine
 from free_adaptive_session import FreeAdaptiveSession
+from request_profiler import profile_cli
 
 def print_banner():
     print("\n" + "=" * 70)
@@ -288,4 +289,5 @@ def run_voice_interview():
 
 
 if __name__ == "__main__":
-    run_voice_interview()
+    with profile_cli("main_voice"):
+        run_voice_interview()
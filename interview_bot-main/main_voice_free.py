@@ -7,6 +7,7 @@ import sys
 from datetime import datetime
 from free_voice_engine import FreeVoiceEngine
 from free_adaptive_session import FreeAdaptiveSession
+from request_profiler import profile_cli
 
 def print_banner():
     print("\n" + "=" * 70)
@@ -475,28 +476,29 @@ def run_free_voice_interview():
 
 
 if __name__ == "__main__":
-    # Support a non-interactive headless test mode for automated runs
-    if '--headless' in sys.argv:
-        # Minimal headless run: text-only, one question & answer cycle
-        print('Running headless test...')
-        # Use DummyVoice from the interactive function scope by re-creating minimal behavior
-        class _DummyVoice:
-            def speak(self, text):
-                print('[TTS]', text)
-
-        voice = _DummyVoice()
-        # Create a session and run one Q/A
-        session = FreeAdaptiveSession(mode='role_based', candidate_name='AutomatedTest', roles=['Software Developer'])
-        q = session.get_next_question()
-        print('\n[Headless] Question:', q['question'])
-        answer = 'I have experience with Python, SQL and REST APIs. I led projects and improved performance.'
-        print('\n[Headless] Answering:', answer)
-        fb = session.submit_answer(q, answer)
-        print('\n[Headless] Feedback:', fb)
-        report = session.get_final_report()
-        print('\n[Headless] Final report keys:', list(report.keys()))
-        fname = 'automated_headless_report.json'
-        session.export_report(fname)
-        print('\n[Headless] Report saved as', fname)
-    else:
-        run_free_voice_interview()
+    with profile_cli("main_voice_free"):
+        # Support a non-interactive headless test mode for automated runs
+        if '--headless' in sys.argv:
+            # Minimal headless run: text-only, one question & answer cycle
+            print('Running headless test...')
+            # Use DummyVoice from the interactive function scope by re-creating minimal behavior
+            class _DummyVoice:
+                def speak(self, text):
+                    print('[TTS]', text)
+
+            voice = _DummyVoice()
+            # Create a session and run one Q/A
+            session = FreeAdaptiveSession(mode='role_based', candidate_name='AutomatedTest', roles=['Software Developer'])
+            q = session.get_next_question()
+            print('\n[Headless] Question:', q['question'])
+            answer = 'I have experience with Python, SQL and REST APIs. I led projects and improved performance.'
+            print('\n[Headless] Answering:', answer)
+            fb = session.submit_answer(q, answer)
+            print('\n[Headless] Feedback:', fb)
+            report = session.get_final_report()
+            print('\n[Headless] Final report keys:', list(report.keys()))
+            fname = 'automated_headless_report.json'
+            session.export_report(fname)
+            print('\n[Headless] Report saved as', fname)
+        else:
+            run_free_voice_interview()
@@ -0,0 +1,290 @@
+"""
+Model Registry - Process-wide lazy model singletons
+
+Heavy local models (sentence-transformer, faster-whisper, Vosk) are loaded
+once per process on first use, shared by every session and engine, and can
+be warmed up in the background or unloaded after a period of inactivity.
+
+Consumers must not keep a model on themselves: hold a lease with use() for
+the duration of one operation (an encode, a transcription, a stream). Leased
+models are never unloaded, and an unloaded model has no other references
+left, so its memory is actually released.
+
+Usage:
+    from model_registry import registry
+    with registry.use("sentence_transformer") as model:
+        vectors = model.encode(texts)
+    registry.warm_up_async(["whisper"])
+    print(registry.stats())
+
+Environment:
+    WHISPER_MODEL_SIZE         faster-whisper model size (default: small)
+    MODEL_IDLE_UNLOAD_SECONDS  unload models unused for this long (default: 0 = never)
+"""
+
+import os
+import gc
+import time
+import threading
+from contextlib import contextmanager
+
+SENTENCE_MODEL_NAME = "all-MiniLM-L6-v2"
+
+VOSK_MODEL_PATHS = [
+    "vosk-model-en-us-0.22",  # Large model - better accuracy
+    "vosk-model-small-en-us-0.15"  # Small model - fallback
+]
+
+
+def _process_rss_bytes():
+    """Resident set size of this process, or None if it cannot be measured"""
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss
+    except Exception:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return None
+
+
+class _ModelEntry:
+    def __init__(self, name, loader, warmup=None, size_fn=None):
+        self.name = name
+        self.loader = loader
+        self.warmup = warmup
+        self.size_fn = size_fn
+        self.lock = threading.Lock()
+        self.instance = None
+        self.error = None
+        self.load_seconds = None
+        self.memory_bytes = None
+        self.last_used = None
+        self.in_use = 0
+        self.loads = 0
+        self.warmed_up = False
+
+
+class ModelRegistry:
+    def __init__(self, idle_unload_seconds=None):
+        self._entries = {}
+        self._registry_lock = threading.Lock()
+        self.idle_unload_seconds = (
+            idle_unload_seconds if idle_unload_seconds is not None
+            else int(os.getenv("MODEL_IDLE_UNLOAD_SECONDS", "0"))
+        )
+        self._reaper = None
+
+    def register(self, name, loader, warmup=None, size_fn=None):
+        """
+        Register a lazily loaded model
+
+        Args:
+            name: Registry key
+            loader: Zero-argument callable returning the model
+            warmup: Optional callable(model) run once after loading
+            size_fn: Optional callable(model) returning its size in bytes
+        """
+        with self._registry_lock:
+            if name not in self._entries:
+                self._entries[name] = _ModelEntry(name, loader, warmup, size_fn)
+
+    def get(self, name):
+        """Return the shared model instance, loading it on first use (thread-safe)"""
+        entry = self._entries[name]
+        entry.last_used = time.monotonic()
+        if entry.instance is not None:
+            return entry.instance
+
+        with entry.lock:
+            if entry.instance is not None:
+                return entry.instance
+            if entry.error is not None:
+                # Missing optional dependencies are not retried on every call
+                raise entry.error
+
+            print(f"⏳ Loading model '{name}'...")
+            rss_before = _process_rss_bytes()
+            start = time.perf_counter()
+            try:
+                instance = entry.loader()
+            except ImportError as e:
+                entry.error = e
+                raise
+            entry.load_seconds = round(time.perf_counter() - start, 2)
+
+            memory = None
+            if entry.size_fn:
+                try:
+                    memory = entry.size_fn(instance)
+                except Exception:
+                    memory = None
+            if memory is None and rss_before is not None:
+                rss_after = _process_rss_bytes()
+                memory = max(0, rss_after - rss_before) if rss_after is not None else None
+            entry.memory_bytes = memory
+
+            entry.instance = instance
+            entry.loads += 1
+            entry.last_used = time.monotonic()
+            print(f"✅ Model '{name}' loaded in {entry.load_seconds}s")
+
+        self._ensure_reaper()
+        return entry.instance
+
+    @contextmanager
+    def use(self, name):
+        """
+        Lease the shared model for one operation
+
+        The model is loaded if needed and cannot be unloaded until the lease is
+        released; the release counts as the last use for idle unloading.
+        """
+        entry = self._entries[name]
+        with entry.lock:
+            entry.in_use += 1
+        try:
+            yield self.get(name)
+        finally:
+            with entry.lock:
+                entry.in_use -= 1
+                entry.last_used = time.monotonic()
+
+    def is_loaded(self, name):
+        entry = self._entries.get(name)
+        return entry is not None and entry.instance is not None
+
+    def warm_up(self, names=None):
+        """Load the given models (default: all) and run their warm-up hooks"""
+        for name in names or list(self._entries):
+            entry = self._entries[name]
+            try:
+                model = self.get(name)
+                if entry.warmup and not entry.warmed_up:
+                    entry.warmup(model)
+                    entry.warmed_up = True
+            except Exception as e:
+                print(f"⚠️ Warm-up skipped for '{name}': {e}")
+
+    def warm_up_async(self, names=None):
+        """Warm models up on a background thread so the first real call does not pay the load"""
+        thread = threading.Thread(target=self.warm_up, args=(names,), name="model-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def unload(self, name):
+        """
+        Drop the registry's reference to a model so its memory can be reclaimed
+
+        Returns:
+            False if the model is not loaded or currently leased
+        """
+        entry = self._entries[name]
+        with entry.lock:
+            if entry.instance is None or entry.in_use:
+                return False
+            entry.instance = None
+            entry.warmed_up = False
+        gc.collect()
+        print(f"♻️ Unloaded idle model '{name}'")
+        return True
+
+    def unload_idle(self):
+        """Unload every model unused for longer than idle_unload_seconds"""
+        if not self.idle_unload_seconds:
+            return []
+        now = time.monotonic()
+        unloaded = []
+        for name, entry in list(self._entries.items()):
+            if (entry.instance is not None and not entry.in_use and entry.last_used
+                    and now - entry.last_used > self.idle_unload_seconds):
+                if self.unload(name):
+                    unloaded.append(name)
+        return unloaded
+
+    def _ensure_reaper(self):
+        if not self.idle_unload_seconds or self._reaper is not None:
+            return
+        with self._registry_lock:
+            if self._reaper is not None:
+                return
+            interval = max(5, min(60, self.idle_unload_seconds // 2))
+
+            def reap():
+                while True:
+                    time.sleep(interval)
+                    self.unload_idle()
+
+            self._reaper = threading.Thread(target=reap, name="model-idle-unloader", daemon=True)
+            self._reaper.start()
+
+    def stats(self):
+        """Per-model load state, load time and memory accounting"""
+        return {
+            name: {
+                "loaded": entry.instance is not None,
+                "in_use": entry.in_use,
+                "loads": entry.loads,
+                "load_seconds": entry.load_seconds,
+                "memory_mb": round(entry.memory_bytes / (1024 * 1024), 1) if entry.memory_bytes is not None else None,
+                "warmed_up": entry.warmed_up,
+                "idle_seconds": round(time.monotonic() - entry.last_used, 1) if entry.last_used else None,
+                "error": str(entry.error) if entry.error else None
+            }
+            for name, entry in self._entries.items()
+        }
+
+
+# ----------------------------------------------------------------------
+# Built-in models
+# ----------------------------------------------------------------------
+
+def _load_sentence_transformer():
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(SENTENCE_MODEL_NAME)
+
+
+def _torch_module_bytes(model):
+    return sum(p.numel() * p.element_size() for p in model.parameters())
+
+
+def _load_whisper():
+    from faster_whisper import WhisperModel
+    size = os.getenv("WHISPER_MODEL_SIZE", "small")
+    return WhisperModel(size, device="cpu", compute_type="int8_float16")
+
+
+def _warm_up_whisper(model):
+    import numpy as np
+    # One second of silence runs the full decode path once
+    list(model.transcribe(np.zeros(16000, dtype=np.float32), beam_size=1)[0])
+
+
+def find_vosk_model_path():
+    """Return the first Vosk model directory that exists, or None"""
+    for path in VOSK_MODEL_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _load_vosk():
+    from vosk import Model, SetLogLevel
+    SetLogLevel(-1)
+    model_path = find_vosk_model_path()
+    if not model_path:
+        raise FileNotFoundError("No Vosk model directory found")
+    return Model(model_path)
+
+
+registry = ModelRegistry()
+registry.register(
+    "sentence_transformer",
+    _load_sentence_transformer,
+    warmup=lambda model: model.encode(["warm up"], show_progress_bar=False),
+    size_fn=_torch_module_bytes
+)
+registry.register("whisper", _load_whisper, warmup=_warm_up_whisper)
+registry.register("vosk", _load_vosk)
@@ -0,0 +1,218 @@
+"""
+LLM Provider Health
+
+Per-key circuit breakers for the LLM providers (Gemini, OpenRouter). A key
+that is rate limited or keeps failing is opened for a cooldown - taken from
+the provider's Retry-After / rate-limit reset headers when present - and
+callers skip it instead of sleeping. Once every key of a provider is open,
+calls fail fast with ProviderUnavailableError so the caller can use its local
+fallback immediately. After the cooldown a single half-open probe decides
+whether the key closes again.
+"""
+
+import os
+import time
+import threading
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class ProviderUnavailableError(Exception):
+    """Raised when every key of a provider is cooling down"""
+
+    def __init__(self, provider: str, retry_in: float):
+        self.provider = provider
+        self.retry_in = retry_in
+        super().__init__(f"{provider} is cooling down (retry in {retry_in:.0f}s)")
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """
+    Cooldown in seconds advertised by a rate-limit response
+
+    Understands Retry-After (seconds or HTTP date) and X-RateLimit-Reset
+    (epoch seconds or milliseconds, as sent by OpenRouter).
+    """
+    if not headers:
+        return None
+
+    retry_after = headers.get('Retry-After') or headers.get('retry-after')
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    reset = headers.get('X-RateLimit-Reset') or headers.get('x-ratelimit-reset')
+    if reset:
+        try:
+            reset_at = float(reset)
+            if reset_at > 1e12:  # milliseconds
+                reset_at /= 1000
+            return max(0.0, reset_at - time.time())
+        except ValueError:
+            pass
+    return None
+
+
+class CircuitBreaker:
+    """closed -> open after repeated failures or a rate limit; open -> half_open after the cooldown"""
+
+    def __init__(self, name: str, failure_threshold: int, cooldown_seconds: float, max_cooldown_seconds: float, transitions: Counter):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.reopen_count = 0
+        self._probe_in_flight = False
+        self._transitions = transitions
+
+    def _transition(self, new_state: str):
+        if new_state != self.state:
+            self._transitions[f"{self.state}->{new_state}"] += 1
+            print(f"🔌 Circuit {self.name}: {self.state} -> {new_state}")
+            self.state = new_state
+
+    def _open(self, cooldown: float):
+        self.open_until = time.monotonic() + min(cooldown, self.max_cooldown_seconds)
+        self._probe_in_flight = False
+        self._transition(OPEN)
+
+    def allow_request(self) -> bool:
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            if time.monotonic() < self.open_until:
+                return False
+            self._transition(HALF_OPEN)
+        # Half-open: let exactly one probe through
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self.reopen_count = 0
+        self._probe_in_flight = False
+        self._transition(CLOSED)
+
+    def record_failure(self, retry_after: Optional[float] = None, rate_limited: bool = False):
+        self.consecutive_failures += 1
+        if rate_limited or retry_after is not None:
+            self._open(retry_after if retry_after is not None else self.cooldown_seconds)
+        elif self.state == HALF_OPEN:
+            # Failed probe: back off longer each time
+            self.reopen_count += 1
+            self._open(self.cooldown_seconds * (2 ** self.reopen_count))
+        elif self.consecutive_failures >= self.failure_threshold:
+            self._open(self.cooldown_seconds)
+
+    def release_probe(self):
+        """Give back a half-open probe that ended without a success/failure verdict"""
+        self._probe_in_flight = False
+
+    def retry_in(self) -> float:
+        return max(0.0, self.open_until - time.monotonic()) if self.state == OPEN else 0.0
+
+
+class ProviderHealth:
+    """Registry of circuit breakers keyed by (provider, key label)"""
+
+    def __init__(self, failure_threshold: int = None, cooldown_seconds: float = None, max_cooldown_seconds: float = None):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open a breaker (LLM_BREAKER_FAILURES, default 3)
+            cooldown_seconds: Default open period (LLM_BREAKER_COOLDOWN_SECONDS, default 30)
+            max_cooldown_seconds: Upper bound for any cooldown (LLM_BREAKER_MAX_COOLDOWN_SECONDS, default 600)
+        """
+        self.failure_threshold = failure_threshold or int(os.getenv('LLM_BREAKER_FAILURES', 3))
+        self.cooldown_seconds = cooldown_seconds or float(os.getenv('LLM_BREAKER_COOLDOWN_SECONDS', 30))
+        self.max_cooldown_seconds = max_cooldown_seconds or float(os.getenv('LLM_BREAKER_MAX_COOLDOWN_SECONDS', 600))
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self._transitions: Counter = Counter()
+        self._fast_failures: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def _breaker(self, provider: str, key: str) -> CircuitBreaker:
+        breaker = self._breakers.get((provider, key))
+        if breaker is None:
+            breaker = CircuitBreaker(
+                f"{provider}{key}",
+                self.failure_threshold,
+                self.cooldown_seconds,
+                self.max_cooldown_seconds,
+                self._transitions
+            )
+            self._breakers[(provider, key)] = breaker
+        return breaker
+
+    def acquire(self, provider: str, keys: List[str], exclude=()) -> str:
+        """
+        Pick the first key (in the given preference order) whose breaker admits a request
+
+        Raises:
+            ProviderUnavailableError: If every key is open (fail fast to the caller's fallback)
+        """
+        with self._lock:
+            for key in keys:
+                if key not in exclude and self._breaker(provider, key).allow_request():
+                    return key
+            retry_in = min((self._breaker(provider, key).retry_in() for key in keys), default=0.0)
+            self._fast_failures[provider] += 1
+        raise ProviderUnavailableError(provider, retry_in)
+
+    def record_success(self, provider: str, key: str):
+        with self._lock:
+            self._breaker(provider, key).record_success()
+
+    def record_failure(self, provider: str, key: str, retry_after: Optional[float] = None, rate_limited: bool = False):
+        with self._lock:
+            self._breaker(provider, key).record_failure(retry_after, rate_limited)
+
+    def release(self, provider: str, key: str):
+        with self._lock:
+            self._breaker(provider, key).release_probe()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "breakers": [
+                    {
+                        "provider": provider,
+                        "key": key,
+                        "state": breaker.state,
+                        "consecutiveFailures": breaker.consecutive_failures,
+                        "retryInSeconds": round(breaker.retry_in(), 1)
+                    }
+                    for (provider, key), breaker in self._breakers.items()
+                ],
+                "transitions": dict(self._transitions),
+                "fastFailures": dict(self._fast_failures)
+            }
+
+
+# Singleton instance
+_provider_health = None
+_provider_health_lock = threading.Lock()
+
+def get_provider_health() -> ProviderHealth:
+    """Get or create the provider health singleton"""
+    global _provider_health
+    if _provider_health is None:
+        with _provider_health_lock:
+            if _provider_health is None:
+                _provider_health = ProviderHealth()
+    return _provider_health
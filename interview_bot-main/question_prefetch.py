@@ -0,0 +1,215 @@
+"""
+Speculative Question Prefetch
+
+As soon as question N is served, question N+1 is generated in the background
+from the current history, assuming the candidate keeps their current average
+score. When the real evaluation arrives the speculative question is reused if
+the candidate is still in the same performance band, or if it moved one band
+but the prefetched question's difficulty still fits the new band (a cheap
+adjustment instead of a new LLM round trip). Otherwise it is discarded and the
+caller generates a fresh question. Pending prefetches are cancelled when an
+interview ends.
+
+Settings (environment):
+    QUESTION_PREFETCH               - "false" disables prefetching (default true)
+    QUESTION_PREFETCH_WORKERS       - background generation threads (default 4)
+    QUESTION_PREFETCH_WAIT_SECONDS  - how long take() waits for an in-flight prefetch (default 20)
+    QUESTION_PREFETCH_TTL_SECONDS   - unclaimed prefetches are dropped after this (default 900)
+"""
+
+import os
+import time
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+# Performance bands the question generators adapt to, lowest first
+BANDS = ('foundational', 'standard', 'advanced', 'expert')
+
+# Question difficulties that still suit a band
+BAND_DIFFICULTIES = {
+    'foundational': {'easy', 'medium'},
+    'standard': {'easy', 'medium'},
+    'advanced': {'medium', 'hard'},
+    'expert': {'hard'},
+}
+
+
+def score_band(score: Optional[float]) -> str:
+    """Map an average score (0-10) to the band that drives question difficulty"""
+    if not score:
+        return 'standard'
+    if score < 5:
+        return 'foundational'
+    if score < 7:
+        return 'standard'
+    if score < 9:
+        return 'advanced'
+    return 'expert'
+
+
+class _Prefetch:
+    def __init__(self, question_number: int, band: str, future):
+        self.question_number = question_number
+        self.band = band
+        self.future = future
+        self.created_at = time.monotonic()
+
+
+class QuestionPrefetcher:
+    """One speculative next question per interview, keyed by session"""
+
+    def __init__(self, max_workers: int = None, wait_seconds: float = None, ttl_seconds: float = None, enabled: bool = None):
+        self.enabled = enabled if enabled is not None else os.getenv('QUESTION_PREFETCH', 'true').lower() != 'false'
+        self.wait_seconds = wait_seconds if wait_seconds is not None else float(os.getenv('QUESTION_PREFETCH_WAIT_SECONDS', 20))
+        self.ttl_seconds = ttl_seconds or float(os.getenv('QUESTION_PREFETCH_TTL_SECONDS', 900))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or int(os.getenv('QUESTION_PREFETCH_WORKERS', 4)),
+            thread_name_prefix="question-prefetch"
+        )
+        self._pending: Dict[str, _Prefetch] = {}
+        self._lock = threading.Lock()
+        self._stats = Counter()
+
+    def prefetch(self, key: str, question_number: int, predicted_score: Optional[float], generate: Callable[[], Dict[str, Any]]):
+        """
+        Start generating the next question in the background
+
+        Args:
+            key: Session identifier
+            question_number: Number of the question being prefetched
+            predicted_score: Average score assumed for the speculation (usually the current average)
+            generate: Zero-argument callable returning question data; it must work on a
+                snapshot of the session context, not on live session state
+        """
+        if not self.enabled:
+            return
+        self._prune()
+        future = self._executor.submit(generate)
+        with self._lock:
+            previous = self._pending.pop(key, None)
+            self._pending[key] = _Prefetch(question_number, score_band(predicted_score), future)
+            self._stats['started'] += 1
+        if previous is not None:
+            self._discard(previous, 'superseded')
+
+    def take(
+        self,
+        key: str,
+        question_number: int,
+        actual_score: Optional[float],
+        asked: Iterable[str] = ()
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Claim the prefetched question if it still fits the real interview state
+
+        Args:
+            key: Session identifier
+            question_number: Number of the question about to be served
+            actual_score: Average score including the latest evaluation
+            asked: Questions already asked (a prefetched repeat is rejected)
+
+        Returns:
+            Question data, or None when the caller must generate the question itself
+        """
+        with self._lock:
+            pending = self._pending.pop(key, None)
+            if pending is None:
+                if self.enabled:
+                    self._stats['misses'] += 1
+                return None
+
+        band = score_band(actual_score)
+        if pending.question_number != question_number:
+            self._discard(pending, 'stale')
+            return None
+
+        try:
+            question_data = pending.future.result(timeout=self.wait_seconds)
+        except FutureTimeoutError:
+            self._discard(pending, 'timeouts')
+            return None
+        except Exception as e:
+            print(f"⚠️ Question prefetch failed: {e}")
+            self._count('errors')
+            return None
+
+        if not question_data or not question_data.get('question'):
+            self._count('errors')
+            return None
+        asked_normalized = {q.lower().strip() for q in asked}
+        if question_data['question'].lower().strip() in asked_normalized:
+            self._count('stale')
+            return None
+
+        if band == pending.band:
+            self._count('hits')
+            return question_data
+
+        # Performance moved to a neighbouring band: keep the question if its difficulty still fits
+        moved = abs(BANDS.index(band) - BANDS.index(pending.band))
+        difficulty = str(question_data.get('difficulty', 'medium')).lower()
+        if moved == 1 and difficulty in BAND_DIFFICULTIES[band]:
+            self._count('adjusted')
+            return question_data
+
+        self._count('stale')
+        return None
+
+    def cancel(self, key: str):
+        """Drop the pending prefetch of a session (interview ended or abandoned)"""
+        with self._lock:
+            pending = self._pending.pop(key, None)
+        if pending is not None:
+            self._discard(pending, 'cancelled')
+
+    def _discard(self, pending: _Prefetch, reason: str):
+        # A generation that already started cannot be interrupted; its result is simply dropped
+        pending.future.cancel()
+        self._count(reason)
+
+    def _prune(self):
+        cutoff = time.monotonic() - self.ttl_seconds
+        with self._lock:
+            expired = [key for key, pending in self._pending.items() if pending.created_at < cutoff]
+            dropped = [self._pending.pop(key) for key in expired]
+        for pending in dropped:
+            self._discard(pending, 'expired')
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            reused = self._stats['hits'] + self._stats['adjusted']
+            claims = reused + self._stats['stale'] + self._stats['timeouts'] + self._stats['errors'] + self._stats['misses']
+            return {
+                "enabled": self.enabled,
+                "started": self._stats['started'],
+                "hits": self._stats['hits'],
+                "adjusted": self._stats['adjusted'],
+                "stale": self._stats['stale'],
+                "misses": self._stats['misses'],
+                "timeouts": self._stats['timeouts'],
+                "errors": self._stats['errors'],
+                "cancelled": self._stats['cancelled'] + self._stats['superseded'] + self._stats['expired'],
+                "hitRate": round(reused / claims, 3) if claims else 0.0,
+                "pending": len(self._pending)
+            }
+
+
+# Singleton instance
+_question_prefetcher = None
+_question_prefetcher_lock = threading.Lock()
+
+def get_question_prefetcher() -> QuestionPrefetcher:
+    """Get or create the question prefetcher singleton"""
+    global _question_prefetcher
+    if _question_prefetcher is None:
+        with _question_prefetcher_lock:
+            if _question_prefetcher is None:
+                _question_prefetcher = QuestionPrefetcher()
+    return _question_prefetcher
@@ -0,0 +1,245 @@
+"""
+Opt-in Request Profiler
+
+Profiles individual Flask requests, background jobs or whole CLI runs and
+writes one file per profiled unit, named after what ran and how long it took:
+
+    profiles/20261018T031502_POST_api_ai_analyze-resume_20341ms.folded
+
+Two modes:
+    sample   - a background thread samples the profiled thread's stack every
+               few milliseconds and writes collapsed stacks (.folded), which
+               flamegraph.pl, speedscope or inferno turn into a flame graph.
+               Low overhead; wall-clock time, so I/O waits (PyPDF2, Gemini,
+               MongoDB) show up where they happen.
+    cprofile - deterministic cProfile of the profiled thread, written as
+               .pstats (python -m pstats, snakeviz). Exact call counts,
+               higher overhead.
+
+Triggers (environment):
+    PROFILE_ALL_REQUESTS=true       - profile every request
+    PROFILE_HEADER_TOKEN=<secret>   - profile requests sent with "X-Profile: <secret>"
+                                      (append ":cprofile" or ":sample" to pick the mode)
+    PROFILE_ANALYSIS_JOBS=true      - profile background resume analysis jobs
+    PROFILE_CLI=true                - profile interview bot CLI runs
+
+Settings (environment):
+    PROFILE_DIR                 - output directory (default ./profiles)
+    PROFILE_MODE                - sample or cprofile (default sample)
+    PROFILE_SAMPLE_INTERVAL_MS  - sampling period (default 5)
+    PROFILE_MIN_MS              - only keep profiles of units slower than this (default 0)
+"""
+
+import os
+import re
+import sys
+import hmac
+import time
+import cProfile
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, Optional
+
+MODES = ('sample', 'cprofile')
+PROFILE_HEADER = 'X-Profile'
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, 'false').lower() == 'true'
+
+
+class _StackSampler(threading.Thread):
+    """Samples one thread's Python stack at a fixed interval into collapsed-stack counts"""
+
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+class _Session:
+    """One running profile"""
+
+    def __init__(self, mode: str, interval: float):
+        self.mode = mode
+        self.start = time.perf_counter()
+        self._profile = None
+        self._sampler = None
+        if mode == 'cprofile':
+            try:
+                self._profile = cProfile.Profile()
+                self._profile.enable()
+            except ValueError:
+                # Python 3.12+ allows one active cProfile per process; concurrent units fall back to sampling
+                self._profile = None
+                self.mode = 'sample'
+        if self._profile is None:
+            self._sampler = _StackSampler(threading.get_ident(), interval)
+            self._sampler.start()
+
+    def stop(self) -> float:
+        """Stop profiling; returns elapsed milliseconds"""
+        if self._profile is not None:
+            self._profile.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+        return (time.perf_counter() - self.start) * 1000
+
+    def write(self, path_base: str) -> str:
+        if self._profile is not None:
+            path = f"{path_base}.pstats"
+            self._profile.dump_stats(path)
+        else:
+            path = f"{path_base}.folded"
+            with open(path, 'w', encoding='utf-8') as f:
+                for stack, count in self._sampler.stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+        return path
+
+
+class RequestProfiler:
+    """Starts and stops profiles and writes them to the profile directory"""
+
+    def __init__(self, output_dir: str = None, mode: str = None, interval_ms: float = None, min_ms: float = None):
+        """
+        Args:
+            output_dir: Where profiles are written (PROFILE_DIR, default ./profiles)
+            mode: "sample" or "cprofile" (PROFILE_MODE, default sample)
+            interval_ms: Sampling period in ms (PROFILE_SAMPLE_INTERVAL_MS, default 5)
+            min_ms: Discard profiles of units faster than this (PROFILE_MIN_MS, default 0)
+        """
+        self.output_dir = output_dir or os.getenv('PROFILE_DIR', 'profiles')
+        self.mode = mode or os.getenv('PROFILE_MODE', 'sample')
+        if self.mode not in MODES:
+            raise ValueError(f"PROFILE_MODE must be one of {MODES}, got {self.mode}")
+        self.interval = (interval_ms or float(os.getenv('PROFILE_SAMPLE_INTERVAL_MS', 5))) / 1000
+        self.min_ms = min_ms if min_ms is not None else float(os.getenv('PROFILE_MIN_MS', 0))
+
+    def start(self, mode: str = None) -> _Session:
+        """Start profiling the calling thread"""
+        return _Session(mode if mode in MODES else self.mode, self.interval)
+
+    def finish(self, session: _Session, tag: str) -> Optional[str]:
+        """
+        Stop a profile and write it, tagged with the unit name and latency
+
+        Returns:
+            Path of the written profile, or None when it was faster than min_ms
+        """
+        elapsed_ms = session.stop()
+        if elapsed_ms < self.min_ms:
+            return None
+        os.makedirs(self.output_dir, exist_ok=True)
+        slug = re.sub(r'[^A-Za-z0-9_.-]+', '_', tag).strip('_')[:120] or 'unnamed'
+        stamp = datetime.now().strftime('%Y%m%dT%H%M%S_%f')
+        path = session.write(os.path.join(self.output_dir, f"{stamp}_{slug}_{round(elapsed_ms)}ms"))
+        print(f"🔬 Profile of {tag} ({elapsed_ms:.0f} ms) written to {path}")
+        return path
+
+
+# Singleton instance
+_request_profiler = None
+_request_profiler_lock = threading.Lock()
+
+def get_request_profiler() -> RequestProfiler:
+    """Get or create the request profiler singleton"""
+    global _request_profiler
+    if _request_profiler is None:
+        with _request_profiler_lock:
+            if _request_profiler is None:
+                _request_profiler = RequestProfiler()
+    return _request_profiler
+
+
+@contextmanager
+def profile_block(tag: str, enabled: bool = True, mode: str = None) -> Iterator[None]:
+    """
+    Profile the with-block on the current thread when enabled
+
+    Example:
+        with profile_block(f"analysis_job_{job_id}", enabled=_env_flag('PROFILE_ANALYSIS_JOBS')):
+            run_job()
+    """
+    if not enabled:
+        yield
+        return
+    profiler = get_request_profiler()
+    session = profiler.start(mode)
+    try:
+        yield
+    finally:
+        profiler.finish(session, tag)
+
+
+def profile_cli(name: str):
+    """Profile a whole CLI run when PROFILE_CLI=true (use as a context manager)"""
+    return profile_block(name, enabled=_env_flag('PROFILE_CLI'))
+
+
+def _requested_mode(header_value: str, token: str) -> Optional[str]:
+    """Mode requested by an X-Profile header carrying the right token, else None"""
+    supplied, _, mode = header_value.partition(':')
+    if not token or not hmac.compare_digest(supplied.encode(), token.encode()):
+        return None
+    return mode or ''
+
+
+def init_app(app):
+    """
+    Profile Flask requests selected by PROFILE_ALL_REQUESTS or the X-Profile header
+
+    The handler is profiled up to the response headers (a streamed body is not
+    included). Profiled responses carry an X-Profile-File header with the
+    written file name.
+    """
+    profile_all = _env_flag('PROFILE_ALL_REQUESTS')
+    token = os.getenv('PROFILE_HEADER_TOKEN', '')
+    if not profile_all and not token:
+        return
+
+    from flask import g, request
+
+    @app.before_request
+    def _start_profile():
+        mode = _requested_mode(request.headers.get(PROFILE_HEADER, ''), token)
+        if profile_all or mode is not None:
+            g._profile_session = get_request_profiler().start(mode)
+
+    @app.after_request
+    def _finish_profile(response):
+        session = g.pop('_profile_session', None)
+        if session is not None:
+            rule = request.url_rule.rule if request.url_rule is not None else request.path
+            path = get_request_profiler().finish(session, f"{request.method} {rule} {response.status_code}")
+            if path:
+                response.headers['X-Profile-File'] = os.path.basename(path)
+        return response
+
+    @app.teardown_request
+    def _drop_profile(exc):
+        # after_request is skipped when a view raises: stop the sampler anyway
+        session = g.pop('_profile_session', None)
+        if session is not None:
+            get_request_profiler().finish(session, f"{request.method} {request.path} error")
+
+    print(f"🔬 Request profiling on ({'all requests' if profile_all else f'{PROFILE_HEADER} header'}, "
+          f"mode={get_request_profiler().mode}, dir={get_request_profiler().output_dir})")
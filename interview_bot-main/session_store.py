@@ -0,0 +1,250 @@
+"""
+Interview Session Store
+
+Pluggable storage for interview session state so the interview API (the
+backend's interview routes, or the interview bot's api.py, which stores
+AdaptiveInterviewSession.to_state() dicts) can run across multiple gunicorn
+workers and nodes. Two backends are provided:
+
+- MemorySessionStore: process-local LRU with idle-timeout expiry (single worker / dev)
+- MongoSessionStore: shared 'interviewSessions' collection with a TTL index
+
+Sessions are plain JSON-serializable dicts. Answers and questions are written
+with `append`, which is atomic per item in both backends.
+"""
+
+import os
+import copy
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+
+
+class SessionStore(ABC):
+    """Interface shared by all session store backends"""
+
+    def __init__(self, idle_timeout_seconds: int):
+        self.idle_timeout_seconds = idle_timeout_seconds
+
+    @abstractmethod
+    def create(self, session_id: str, data: Dict[str, Any]):
+        """Store a new session"""
+
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the session, or None if missing or expired. Refreshes the idle timer."""
+
+    @abstractmethod
+    def update(self, session_id: str, fields: Dict[str, Any]) -> bool:
+        """Set top-level fields on a session. Returns False if the session does not exist."""
+
+    @abstractmethod
+    def append(self, session_id: str, field: str, item: Any, fields: Dict[str, Any] = None) -> bool:
+        """Atomically append item to a list field (and optionally set other fields)"""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Remove a session and return its last state"""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of live sessions"""
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.get(session_id) is not None
+
+
+class MemorySessionStore(SessionStore):
+    """In-process LRU session store with idle-timeout expiry"""
+
+    def __init__(self, idle_timeout_seconds: int = 3600, max_sessions: int = 1000):
+        super().__init__(idle_timeout_seconds)
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._last_active: Dict[str, datetime] = {}
+        self._lock = threading.RLock()
+
+    def _expired(self, session_id: str, now: datetime) -> bool:
+        last_active = self._last_active.get(session_id)
+        return last_active is None or (now - last_active).total_seconds() > self.idle_timeout_seconds
+
+    def _touch(self, session_id: str, now: datetime):
+        self._last_active[session_id] = now
+        self._sessions.move_to_end(session_id)
+
+    def _evict(self, now: datetime):
+        # Drop expired sessions from the LRU end, then trim to capacity
+        while self._sessions:
+            oldest = next(iter(self._sessions))
+            if not self._expired(oldest, now) and len(self._sessions) <= self.max_sessions:
+                break
+            self._sessions.pop(oldest)
+            self._last_active.pop(oldest, None)
+
+    def _live(self, session_id: str, now: datetime) -> Optional[Dict[str, Any]]:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+        if self._expired(session_id, now):
+            self._sessions.pop(session_id)
+            self._last_active.pop(session_id, None)
+            return None
+        return session
+
+    def create(self, session_id: str, data: Dict[str, Any]):
+        now = datetime.utcnow()
+        with self._lock:
+            self._sessions[session_id] = copy.deepcopy(data)
+            self._touch(session_id, now)
+            self._evict(now)
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        now = datetime.utcnow()
+        with self._lock:
+            session = self._live(session_id, now)
+            if session is None:
+                return None
+            self._touch(session_id, now)
+            return copy.deepcopy(session)
+
+    def update(self, session_id: str, fields: Dict[str, Any]) -> bool:
+        now = datetime.utcnow()
+        with self._lock:
+            session = self._live(session_id, now)
+            if session is None:
+                return False
+            session.update(copy.deepcopy(fields))
+            self._touch(session_id, now)
+            return True
+
+    def append(self, session_id: str, field: str, item: Any, fields: Dict[str, Any] = None) -> bool:
+        now = datetime.utcnow()
+        with self._lock:
+            session = self._live(session_id, now)
+            if session is None:
+                return False
+            session.setdefault(field, []).append(copy.deepcopy(item))
+            if fields:
+                session.update(copy.deepcopy(fields))
+            self._touch(session_id, now)
+            return True
+
+    def delete(self, session_id: str) -> Optional[Dict[str, Any]]:
+        now = datetime.utcnow()
+        with self._lock:
+            session = self._live(session_id, now)
+            self._sessions.pop(session_id, None)
+            self._last_active.pop(session_id, None)
+            return session
+
+    def count(self) -> int:
+        with self._lock:
+            self._evict(datetime.utcnow())
+            return len(self._sessions)
+
+
+class MongoSessionStore(SessionStore):
+    """
+    MongoDB session store shared by every worker process
+
+    Each session is one document; `expiresAt` is pushed forward on every
+    access and a TTL index removes idle sessions.
+    """
+
+    RESERVED_FIELDS = ('_id', 'lastActiveAt', 'expiresAt')
+
+    def __init__(self, idle_timeout_seconds: int = 3600, collection_name: str = 'interviewSessions'):
+        super().__init__(idle_timeout_seconds)
+        self.collection_name = collection_name
+        self._collection = None
+        self._indexes_ready = False
+
+    @property
+    def collection(self):
+        if self._collection is None:
+            try:
+                from services.mongodb_service import get_db
+                db = get_db()
+            except ImportError:  # interview bot layout: no shared MongoDB service, connect from the environment
+                from pymongo import MongoClient
+                client = MongoClient(os.getenv("MONGODB_URI", "mongodb://localhost:27017/"))
+                db = client[os.getenv("MONGODB_DB_NAME", "skillbridge")]
+            self._collection = db[self.collection_name]
+        collection = self._collection
+        if not self._indexes_ready:
+            collection.create_index('expiresAt', expireAfterSeconds=0)
+            self._indexes_ready = True
+        return collection
+
+    def _expiry_fields(self) -> Dict[str, datetime]:
+        now = datetime.utcnow()
+        return {'lastActiveAt': now, 'expiresAt': now + timedelta(seconds=self.idle_timeout_seconds)}
+
+    def _live_filter(self, session_id: str) -> Dict[str, Any]:
+        # The TTL monitor only runs once a minute, so filter expired documents explicitly
+        return {'_id': session_id, 'expiresAt': {'$gt': datetime.utcnow()}}
+
+    def _strip(self, doc: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if doc is None:
+            return None
+        return {k: v for k, v in doc.items() if k not in self.RESERVED_FIELDS}
+
+    def create(self, session_id: str, data: Dict[str, Any]):
+        self.collection.replace_one(
+            {'_id': session_id},
+            {**data, '_id': session_id, **self._expiry_fields()},
+            upsert=True
+        )
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        from pymongo import ReturnDocument
+        doc = self.collection.find_one_and_update(
+            self._live_filter(session_id),
+            {'$set': self._expiry_fields()},
+            return_document=ReturnDocument.AFTER
+        )
+        return self._strip(doc)
+
+    def update(self, session_id: str, fields: Dict[str, Any]) -> bool:
+        result = self.collection.update_one(
+            self._live_filter(session_id),
+            {'$set': {**fields, **self._expiry_fields()}}
+        )
+        return result.matched_count == 1
+
+    def append(self, session_id: str, field: str, item: Any, fields: Dict[str, Any] = None) -> bool:
+        result = self.collection.update_one(
+            self._live_filter(session_id),
+            {
+                '$push': {field: item},
+                '$set': {**(fields or {}), **self._expiry_fields()}
+            }
+        )
+        return result.matched_count == 1
+
+    def delete(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return self._strip(self.collection.find_one_and_delete(self._live_filter(session_id)))
+
+    def count(self) -> int:
+        return self.collection.count_documents({'expiresAt': {'$gt': datetime.utcnow()}})
+
+
+def create_session_store(backend: str = None) -> SessionStore:
+    """
+    Build a session store from environment configuration
+
+    INTERVIEW_SESSION_STORE: "memory" (default) or "mongodb"
+    INTERVIEW_SESSION_TTL_SECONDS: idle timeout (default 3600)
+    INTERVIEW_SESSION_MAX: max sessions for the memory backend (default 1000)
+    """
+    backend = (backend or os.getenv('INTERVIEW_SESSION_STORE', 'memory')).lower()
+    idle_timeout = int(os.getenv('INTERVIEW_SESSION_TTL_SECONDS', 3600))
+
+    if backend in ('mongo', 'mongodb'):
+        print(f"✅ Interview sessions stored in MongoDB (idle timeout {idle_timeout}s)")
+        return MongoSessionStore(idle_timeout_seconds=idle_timeout)
+
+    max_sessions = int(os.getenv('INTERVIEW_SESSION_MAX', 1000))
+    return MemorySessionStore(idle_timeout_seconds=idle_timeout, max_sessions=max_sessions)
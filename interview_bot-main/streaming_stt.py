@@ -0,0 +1,235 @@
+"""
+Streaming Speech-to-Text
+
+Audio frames (16-bit mono PCM bytes) are pushed into a bounded queue and
+recognized on a worker thread while the candidate is still speaking, so the
+final transcript is ready almost immediately after recording stops.
+
+Frame sources:
+    microphone_frames() - live PyAudio capture until a stop event is set
+    wav_frames()        - prerecorded WAV fixtures, same frame interface
+
+Usage:
+    transcriber = StreamingTranscriber(VoskStreamBackend(model, 16000), on_partial=print)
+    transcriber.start()
+    for frame in wav_frames("answer.wav"):
+        transcriber.feed(frame)
+    text = transcriber.finish()
+"""
+
+import json
+import queue
+import threading
+import wave
+
+_END_OF_STREAM = object()
+
+
+def clean_transcript(text):
+    """Collapse whitespace and capitalize the first letter"""
+    text = ' '.join((text or '').split())
+    if not text:
+        return None
+    return text[0].upper() + text[1:] if len(text) > 1 else text.upper()
+
+
+class VoskStreamBackend:
+    """Incremental recognition with a Vosk KaldiRecognizer"""
+
+    def __init__(self, model, sample_rate):
+        from vosk import KaldiRecognizer
+        self.recognizer = KaldiRecognizer(model, sample_rate)
+        self.recognizer.SetWords(True)
+        self.recognizer.SetMaxAlternatives(0)
+        self.segments = []
+
+    def accept(self, frame):
+        """Feed one frame; returns the current partial transcript"""
+        if self.recognizer.AcceptWaveform(frame):
+            text = json.loads(self.recognizer.Result()).get('text', '').strip()
+            if text:
+                self.segments.append(text)
+            return ' '.join(self.segments)
+        partial = json.loads(self.recognizer.PartialResult()).get('partial', '').strip()
+        return ' '.join(self.segments + ([partial] if partial else []))
+
+    def finish(self):
+        text = json.loads(self.recognizer.FinalResult()).get('text', '').strip()
+        if text:
+            self.segments.append(text)
+        return ' '.join(self.segments)
+
+
+class WhisperChunkBackend:
+    """Chunked recognition with faster-whisper: each window is transcribed as soon as it fills"""
+
+    def __init__(self, model, sample_rate, chunk_seconds=4.0, beam_size=5):
+        self.model = model
+        self.sample_rate = sample_rate
+        self.chunk_bytes = int(sample_rate * chunk_seconds) * 2  # 16-bit samples
+        self.beam_size = beam_size
+        self.buffer = bytearray()
+        self.segments = []
+
+    def _transcribe(self, pcm):
+        import numpy as np
+        audio = np.frombuffer(bytes(pcm), dtype=np.int16).astype(np.float32) / 32768.0
+        segments, _ = self.model.transcribe(audio, beam_size=self.beam_size)
+        text = " ".join(seg.text.strip() for seg in segments).strip()
+        if text:
+            self.segments.append(text)
+
+    def accept(self, frame):
+        self.buffer.extend(frame)
+        if len(self.buffer) >= self.chunk_bytes:
+            self._transcribe(self.buffer)
+            self.buffer = bytearray()
+        return ' '.join(self.segments)
+
+    def finish(self):
+        # Ignore tails shorter than 0.25s - they are almost always silence
+        if len(self.buffer) >= self.sample_rate // 2:
+            self._transcribe(self.buffer)
+        self.buffer = bytearray()
+        return ' '.join(self.segments)
+
+
+class StreamingTranscriber:
+    """Runs a recognition backend on a worker thread fed through a bounded frame queue"""
+
+    def __init__(self, backend, on_partial=None, max_queued_frames=200):
+        """
+        Args:
+            backend: VoskStreamBackend or WhisperChunkBackend
+            on_partial: Optional callback(text) called when the partial transcript changes
+            max_queued_frames: Queue bound; feed() blocks briefly when recognition falls behind
+        """
+        self.backend = backend
+        self.on_partial = on_partial
+        self.frames = queue.Queue(maxsize=max_queued_frames)
+        self.dropped_frames = 0
+        self.partial = ''
+        self.error = None
+        self._result = None
+        self._worker = None
+
+    def start(self):
+        self._worker = threading.Thread(target=self._run, name="stt-stream", daemon=True)
+        self._worker.start()
+        return self
+
+    def feed(self, frame, timeout=1.0):
+        """
+        Queue one PCM frame for recognition
+
+        Raises:
+            The worker's exception (or RuntimeError) if recognition has stopped
+        """
+        self._raise_if_stopped()
+        try:
+            self.frames.put(frame, timeout=timeout)
+        except queue.Full:
+            self._raise_if_stopped()
+            self.dropped_frames += 1
+
+    def finish(self, timeout=30.0):
+        """
+        Signal end of audio and wait for the final transcript
+
+        Returns:
+            Cleaned transcript, or None if nothing was recognized
+
+        Raises:
+            The worker's exception if recognition failed, TimeoutError if it did not finish in time
+        """
+        self._raise_if_stopped()
+        try:
+            self.frames.put(_END_OF_STREAM, timeout=timeout)
+        except queue.Full:
+            self._raise_if_stopped()
+            raise TimeoutError(f"Streaming recognition fell {self.frames.qsize()} frames behind")
+        self._worker.join(timeout)
+        if self.error:
+            raise self.error
+        if self._worker.is_alive():
+            raise TimeoutError(f"Streaming recognition did not finish within {timeout}s")
+        return clean_transcript(self._result)
+
+    def _raise_if_stopped(self):
+        """Fail fast instead of queueing frames nobody will read"""
+        if self.error:
+            raise self.error
+        if self._worker is None or not self._worker.is_alive():
+            raise RuntimeError("Streaming recognition is not running")
+
+    def _run(self):
+        try:
+            while True:
+                frame = self.frames.get()
+                if frame is _END_OF_STREAM:
+                    break
+                partial = self.backend.accept(frame)
+                if partial != self.partial:
+                    self.partial = partial
+                    if self.on_partial:
+                        self.on_partial(clean_transcript(partial) or '')
+            self._result = self.backend.finish()
+        except Exception as e:
+            self.error = e
+
+
+def wav_frames(path, frames_per_chunk=1024):
+    """Yield PCM frames from a mono 16-bit WAV file (fixtures and offline replay)"""
+    wf = wave.open(path, "rb")
+    try:
+        if wf.getnchannels() != 1 or wf.getsampwidth() != 2:
+            raise ValueError("Audio file must be WAV format mono PCM.")
+        while True:
+            data = wf.readframes(frames_per_chunk)
+            if not data:
+                break
+            yield data
+    finally:
+        wf.close()
+
+
+def wav_sample_rate(path):
+    wf = wave.open(path, "rb")
+    try:
+        return wf.getframerate()
+    finally:
+        wf.close()
+
+
+def microphone_frames(stop_event, rate=16000, chunk=1024, duration=None):
+    """
+    Yield PCM frames from the default microphone
+
+    Args:
+        stop_event: threading.Event that ends the capture when set
+        rate: Sample rate
+        chunk: Frames per buffer
+        duration: Optional maximum duration in seconds
+    """
+    import pyaudio
+    audio = pyaudio.PyAudio()
+    stream = audio.open(
+        format=pyaudio.paInt16,
+        channels=1,
+        rate=rate,
+        input=True,
+        frames_per_buffer=chunk
+    )
+    max_reads = int(rate / chunk * duration) if duration else None
+    reads = 0
+    try:
+        while not stop_event.is_set() and (max_reads is None or reads < max_reads):
+            try:
+                yield stream.read(chunk, exception_on_overflow=False)
+            except IOError:
+                pass
+            reads += 1
+    finally:
+        stream.stop_stream()
+        stream.close()
+        audio.terminate()
@@ -29,7 +29,7 @@ def test_stt():
     
     engine = FreeVoiceEngine()
     
-    if engine.vosk_model is None:
+    if not engine.vosk_available:
         print("⚠️ Speech-to-text not available. Vosk model not loaded.")
         return
     
@@ -43,6 +43,22 @@ def test_stt():
     
     print(f"\n✅ You said: {text}")
 
+def test_stream_stt(wav_path=None):
+    """Test streaming speech-to-text (live microphone or a prerecorded WAV fixture)"""
+    print("\n" + "="*60)
+    print("⚡ TESTING STREAMING SPEECH-TO-TEXT")
+    print("="*60)
+    
+    engine = FreeVoiceEngine()
+    
+    if wav_path:
+        text = engine.transcribe_wav_stream(wav_path)
+    else:
+        print("\n🎙️ Speak now - partial transcripts appear as you talk. Press Enter when done...")
+        text = engine.stream_and_transcribe()
+    
+    print(f"\n✅ You said: {text}")
+
 def test_full_cycle():
     """Test complete voice cycle: TTS -> record -> STT"""
     print("\n" + "="*60)
@@ -82,9 +98,10 @@ if __name__ == "__main__":
         print("1. Text-to-Speech (TTS) only")
         print("2. Speech-to-Text (STT) only")
         print("3. Complete voice cycle (TTS + STT)")
-        print("4. Exit")
+        print("4. Streaming Speech-to-Text (microphone or WAV file)")
+        print("5. Exit")
         
-        choice = input("\nEnter choice (1-4): ").strip()
+        choice = input("\nEnter choice (1-5): ").strip()
         
         if choice == "1":
             test_tts()
@@ -93,7 +110,10 @@ if __name__ == "__main__":
         elif choice == "3":
             test_full_cycle()
         elif choice == "4":
+            wav_path = input("WAV file path (leave empty for microphone): ").strip()
+            test_stream_stt(wav_path or None)
+        elif choice == "5":
             print("\n👋 Goodbye!")
             break
         else:
-            print("❌ Invalid choice. Please enter 1-4.")
+            print("❌ Invalid choice. Please enter 1-5.")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Automated test of the streaming speech-to-text pipeline
+Replays a WAV fixture through StreamingTranscriber - no microphone or models needed
+
+Run with: python -m pytest test_streaming_stt.py (or python test_streaming_stt.py)
+"""
+
+import math
+import os
+import struct
+import tempfile
+import time
+import wave
+
+from streaming_stt import StreamingTranscriber, wav_frames, wav_sample_rate
+
+
+def write_wav_fixture(path, seconds=1.0, rate=16000):
+    """Write a mono 16-bit 440 Hz tone"""
+    samples = int(rate * seconds)
+    pcm = b''.join(
+        struct.pack('<h', int(8000 * math.sin(2 * math.pi * 440 * i / rate)))
+        for i in range(samples)
+    )
+    wf = wave.open(path, 'wb')
+    wf.setnchannels(1)
+    wf.setsampwidth(2)
+    wf.setframerate(rate)
+    wf.writeframes(pcm)
+    wf.close()
+    return pcm
+
+
+class RecordingBackend:
+    """Backend that keeps the audio it receives and 'recognizes' one word per frame"""
+
+    def __init__(self):
+        self.audio = bytearray()
+        self.words = []
+
+    def accept(self, frame):
+        self.audio.extend(frame)
+        self.words.append(f"word{len(self.words)}")
+        return ' '.join(self.words)
+
+    def finish(self):
+        return '  '.join(self.words)
+
+
+class FailingBackend:
+    """Backend whose recognizer breaks on the first frame"""
+
+    def accept(self, frame):
+        raise RuntimeError("recognizer crashed")
+
+    def finish(self):
+        return ''
+
+
+def test_wav_replay():
+    """Every frame of the fixture reaches the backend in order and the transcript is cleaned"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'answer.wav')
+        pcm = write_wav_fixture(path)
+        assert wav_sample_rate(path) == 16000
+
+        backend = RecordingBackend()
+        partials = []
+        transcriber = StreamingTranscriber(backend, on_partial=partials.append).start()
+        for frame in wav_frames(path, frames_per_chunk=1024):
+            transcriber.feed(frame)
+        text = transcriber.finish(timeout=5)
+
+    frame_count = math.ceil(len(pcm) / 2 / 1024)
+    assert bytes(backend.audio) == pcm
+    assert transcriber.dropped_frames == 0
+    assert len(partials) == frame_count
+    # Whitespace collapsed and first letter capitalized
+    assert text == ' '.join(f"word{i}" for i in range(frame_count)).capitalize()
+
+
+def test_backend_failure_does_not_hang():
+    """A crashed worker surfaces its error from feed()/finish() instead of blocking"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'answer.wav')
+        write_wav_fixture(path, seconds=3.0)
+
+        transcriber = StreamingTranscriber(FailingBackend(), max_queued_frames=2).start()
+        started = time.monotonic()
+        try:
+            for frame in wav_frames(path, frames_per_chunk=256):
+                transcriber.feed(frame)
+            transcriber.finish(timeout=5)
+        except RuntimeError as e:
+            assert str(e) == "recognizer crashed"
+        else:
+            raise AssertionError("expected the backend error to be raised")
+    assert time.monotonic() - started < 2
+
+
+if __name__ == "__main__":
+    test_wav_replay()
+    test_backend_failure_does_not_hang()
+    print("✅ Streaming STT tests passed")
@@ -4,7 +4,15 @@ from dotenv import load_dotenv
 import os
 
 from routes import api_bp
-from routes_interview import interview_bp
+from routes_interview import interview_bp, sessions, prefetcher
+from services import gemini_service
+from services.analysis_job_service import start_analysis_workers
+from services.mongo_index_service import ensure_indexes
+from services.metrics_service import get_metrics, init_app as init_metrics
+from services.request_profiler import init_app as init_profiler
+from services.llm_cache_service import get_llm_cache
+from services.search_cache_service import get_search_cache
+from services.job_ranking_service import get_job_ranker
 
 load_dotenv()
 
@@ -14,10 +22,57 @@ CORS(app)  # Enable CORS for all routes
 # Configure max file upload size (16MB)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
 
+# Request latency middleware and GET /metrics (METRICS_ENABLED=false to disable)
+init_metrics(app)
+
+# Per-request profiles on demand (PROFILE_ALL_REQUESTS or PROFILE_HEADER_TOKEN)
+init_profiler(app)
+
 # Register blueprints
 app.register_blueprint(api_bp, url_prefix='/api')
 app.register_blueprint(interview_bp, url_prefix='/api/interview')
 
+
+def _gemini_in_flight():
+    # Only report once the service exists; creating it here would need API keys
+    if gemini_service._gemini_service is None:
+        return None
+    return {(slot['key'],): slot['inFlight'] for slot in gemini_service._gemini_service.pool.stats()}
+
+
+# Gauges, read on every scrape
+metrics = get_metrics()
+metrics.gauge('interview_sessions_active', 'Interview sessions held by the session store', sessions.count)
+metrics.gauge('question_prefetch_pending', 'Speculative interview questions not yet claimed',
+              lambda: prefetcher.stats()['pending'])
+metrics.gauge('llm_cache_entries', 'Entries in the LLM response cache', lambda: get_llm_cache().size())
+metrics.gauge('search_cache_entries', 'Entries in the job/video search result cache',
+              lambda: get_search_cache().stats()['size'])
+metrics.gauge('gemini_requests_in_flight', 'Gemini requests in flight per API key', _gemini_in_flight, ('key',))
+
+# Create missing MongoDB indexes (idempotent; MONGODB_ENSURE_INDEXES=false to skip)
+if os.getenv('MONGODB_ENSURE_INDEXES', 'true').lower() == 'true':
+    try:
+        ensure_indexes()
+    except Exception as e:
+        print(f"⚠️ MongoDB index bootstrap skipped: {e}")
+
+# `python app.py` runs the debug server with the Werkzeug reloader: this module then executes in
+# a parent process that only watches files and again in the child that serves requests
+# (WERKZEUG_RUN_MAIN=true). Resume extraction pool processes also re-run it as __mp_main__.
+# Background threads start in the serving process only, so jobs are not claimed twice.
+SERVING_PROCESS = __name__ != '__mp_main__' and (
+    __name__ != '__main__' or os.environ.get('WERKZEUG_RUN_MAIN') == 'true'
+)
+
+if SERVING_PROCESS:
+    # Background resume analysis workers (ANALYSIS_WORKERS_IN_PROCESS=0 when using worker.py)
+    start_analysis_workers()
+
+    # Load the job ranking model now rather than on the first /jobs/search request
+    if os.getenv('JOB_RANKING', 'embedding').lower() == 'embedding':
+        get_job_ranker().warm_up_async()
+
 @app.route('/')
 def home():
     return {
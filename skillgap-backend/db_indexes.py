@@ -0,0 +1,53 @@
+"""
+MongoDB Index Bootstrap and Query Plan Audit
+
+Creates the indexes declared in services/mongo_index_service.py and, with
+--explain, runs explain() on every query shape the routes use:
+
+    python db_indexes.py             # create indexes
+    python db_indexes.py --explain   # create indexes, then report COLLSCANs
+
+Exits with status 1 when --explain finds a collection scan.
+"""
+
+import sys
+import argparse
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from services.mongodb_service import get_db
+from services.mongo_index_service import ensure_indexes, explain_query_shapes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SkillBridge MongoDB index bootstrap")
+    parser.add_argument('--explain', action='store_true', help="Audit query plans and flag COLLSCANs")
+    parser.add_argument('--skip-create', action='store_true', help="Only audit, do not create indexes")
+    args = parser.parse_args()
+
+    db = get_db()
+    if not args.skip_create:
+        ensure_indexes(db)
+
+    if not args.explain:
+        return 0
+
+    print("\n🔎 Query plan audit")
+    print("=" * 70)
+    collscans = 0
+    for entry in explain_query_shapes(db):
+        if entry.get('error'):
+            print(f"⚠️  {entry['name']:<40} explain failed: {entry['error']}")
+        elif entry['collscan']:
+            collscans += 1
+            print(f"❌ {entry['name']:<40} COLLSCAN on {entry['collection']} ({', '.join(entry['fields'])})")
+        else:
+            print(f"✅ {entry['name']:<40} {' -> '.join(entry['stages'])} [{', '.join(entry['indexes']) or '_id'}]")
+    print("=" * 70)
+    print(f"{collscans} query shape(s) scanning a full collection")
+    return 1 if collscans else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,6 @@
-import PyPDF2
 import sys
 import os
+from services.resume_text_extractor import get_resume_text_extractor
 
 resume_path = sys.argv[1] if len(sys.argv) > 1 else None
 
@@ -9,12 +9,10 @@ if not resume_path or not os.path.exists(resume_path):
     sys.exit(1)
 
 try:
-    with open(resume_path, 'rb') as file:
-        pdf = PyPDF2.PdfReader(file)
-        text = ''
-        for page in pdf.pages:
-            text += page.extract_text() + '\n'
-        print(text)
+    print(get_resume_text_extractor().extract_file(
+        resume_path,
+        root=os.path.dirname(os.path.abspath(resume_path))  # the command line names the file itself
+    )['text'])
 except Exception as e:
     print(f"Error: {e}")
     sys.exit(1)
@@ -0,0 +1,18 @@
+"""
+Offline Load Testing
+
+Measures backend throughput without touching paid or rate-limited APIs.
+
+- fake_upstream: local HTTP stand-in for Gemini (REST), OpenRouter, Google
+  Custom Search and YouTube with configurable latency, 429 injection and
+  canned JSON bodies
+- driver: concurrent virtual users replaying register -> upload -> analyze
+  -> jobs -> interview journeys against a running backend, reporting
+  throughput and latency percentiles per step
+
+Typical run (three terminals, from skillgap-backend/):
+
+    python -m loadtest.fake_upstream --port 8090 --latency gemini=lognormal:900:0.5 --error-rate gemini=0.05
+    eval "$(python -m loadtest.fake_upstream --port 8090 --print-env)" && python app.py
+    python -m loadtest.driver --base-url http://localhost:5000 --users 20 --journeys 200
+"""
@@ -0,0 +1,459 @@
+"""
+Fake Upstream Server
+
+One local HTTP server that stands in for every external API the backend and
+the interview bot call:
+
+    gemini      POST /v1beta/models/<model>:generateContent
+                POST /v1beta/models/<model>:streamGenerateContent
+    openrouter  POST /api/v1/chat/completions
+    search      GET  /customsearch/v1
+    youtube     GET  /youtube/v3/search
+
+Each upstream gets its own latency distribution and 429 rate. LLM responses
+are canned JSON bodies chosen by keywords in the prompt (resume analysis,
+job recommendations, answer evaluation, final report, otherwise a question);
+--responses overrides them from a JSON file. GET /__stats returns request
+and injected-error counts per upstream.
+
+Usage:
+    python -m loadtest.fake_upstream --port 8090 \\
+        --latency gemini=lognormal:900:0.5 --latency search=uniform:80:250 \\
+        --error-rate gemini=0.05 --error-rate openrouter=0.1
+
+    # Environment that points the services at this server
+    python -m loadtest.fake_upstream --port 8090 --print-env
+"""
+
+import re
+import json
+import math
+import random
+import argparse
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+
+UPSTREAMS = ('gemini', 'openrouter', 'search', 'youtube')
+
+# Roughly what the real APIs take from a nearby region
+DEFAULT_LATENCY = {
+    'gemini': 'lognormal:1200:0.4',
+    'openrouter': 'lognormal:1500:0.5',
+    'search': 'lognormal:250:0.3',
+    'youtube': 'lognormal:200:0.3',
+}
+
+
+# ---------------------------------------------------------------------------
+# Latency distributions
+# ---------------------------------------------------------------------------
+
+def parse_latency(spec: str) -> Callable[[], float]:
+    """
+    Build a sampler (seconds) from a spec in milliseconds
+
+    Specs:
+        fixed:MS
+        uniform:LOW:HIGH
+        normal:MEAN:STDDEV        (clipped at 0)
+        lognormal:MEDIAN:SIGMA    (heavy right tail, like real LLM latency)
+
+    Raises:
+        ValueError: On an unknown kind or wrong number of parameters
+    """
+    kind, _, rest = spec.partition(':')
+    try:
+        params = [float(p) for p in rest.split(':')] if rest else []
+    except ValueError:
+        raise ValueError(f"Invalid latency spec: {spec}")
+
+    arity = {'fixed': 1, 'uniform': 2, 'normal': 2, 'lognormal': 2}
+    if kind not in arity or len(params) != arity[kind]:
+        raise ValueError(f"Invalid latency spec: {spec} (expected one of fixed:MS, uniform:LOW:HIGH, "
+                         f"normal:MEAN:STDDEV, lognormal:MEDIAN:SIGMA)")
+
+    if kind == 'fixed':
+        return lambda: params[0] / 1000
+    if kind == 'uniform':
+        return lambda: random.uniform(params[0], params[1]) / 1000
+    if kind == 'normal':
+        return lambda: max(0.0, random.gauss(params[0], params[1])) / 1000
+    mu = math.log(max(params[0], 1e-3))
+    return lambda: random.lognormvariate(mu, params[1]) / 1000
+
+
+# ---------------------------------------------------------------------------
+# Canned bodies
+# ---------------------------------------------------------------------------
+
+CANNED_LLM_RESPONSES: Dict[str, Any] = {
+    'resume_analysis': {
+        "extractedSkills": [
+            {"skill": "Python", "proficiency": "Advanced", "yearsOfExperience": 3},
+            {"skill": "SQL", "proficiency": "Intermediate", "yearsOfExperience": 2},
+            {"skill": "React", "proficiency": "Intermediate", "yearsOfExperience": 2},
+            {"skill": "Docker", "proficiency": "Beginner", "yearsOfExperience": 1}
+        ],
+        "experienceLevel": "Mid-Level",
+        "totalYearsOfExperience": 3,
+        "education": [
+            {"degree": "Bachelor of Technology", "field": "Computer Science", "institution": "State University", "year": "2021"}
+        ],
+        "recommendedRoles": ["Backend Developer", "Full Stack Developer", "Data Engineer"],
+        "missingSkills": [
+            {"skill": "Kubernetes", "importance": "High", "reason": "Expected for backend roles at scale"},
+            {"skill": "System Design", "importance": "Medium", "reason": "Needed for senior interviews"}
+        ],
+        "strengths": ["Solid Python fundamentals", "Shipped production web apps"],
+        "improvements": ["Quantify project impact", "Add cloud deployment experience"],
+        "overallScore": 74,
+        "summary": "Mid-level engineer with strong Python and web experience."
+    },
+    'job_recommendations': {
+        "recommendations": [
+            {"jobTitle": "Backend Developer", "matchScore": 86, "reason": "Strong Python and SQL",
+             "requiredSkills": ["Python", "SQL", "REST APIs"], "salaryRange": "$80k - $110k", "experienceRequired": "2-4 years"},
+            {"jobTitle": "Data Engineer", "matchScore": 72, "reason": "Python and SQL transfer well",
+             "requiredSkills": ["Python", "SQL", "Airflow"], "salaryRange": "$85k - $120k", "experienceRequired": "2-5 years"}
+        ]
+    },
+    'evaluation': {
+        "score": 6.5,
+        "interviewer_assessment": "Reasonable answer with a concrete example, but light on trade-offs.",
+        "what_question_tested": "Practical problem solving",
+        "specific_mistakes": ["No measurable outcome given"],
+        "why_this_fails": "Interviewers cannot judge impact without numbers.",
+        "mentor_guidance": "Structure answers as situation, action, result.",
+        "how_to_improve": ["State the result with a metric", "Mention one alternative you rejected"],
+        "model_answer": "In my last project I cut API latency by 40% by adding a cache in front of the database...",
+        "feedback": "Decent, add measurable results.",
+        "strengths": ["Concrete example"],
+        "improvements": ["Quantify impact"]
+    },
+    'report': {
+        "overall_score": 6.8,
+        "summary": "Consistent answers with good fundamentals; needs more depth on trade-offs.",
+        "strengths": ["Clear communication", "Relevant examples"],
+        "areas_for_improvement": ["System design depth", "Quantified impact"],
+        "hiring_recommendation": "Maybe",
+        "detailed_analysis": "The candidate answered every question with relevant experience but rarely discussed alternatives."
+    },
+    'question': {
+        "question": "Walk me through how you would design a rate limiter for a public API.",
+        "category": "Technical",
+        "difficulty": "Medium",
+        "reasoning": "Tests system design fundamentals at the current performance level"
+    },
+}
+
+# Output-schema key requested by the prompt -> canned response, first match wins;
+# anything else (question generation, role research) gets a question
+PROMPT_RULES: List[Tuple[str, str]] = [
+    ('"extractedskills"', 'resume_analysis'),
+    ('"recommendations"', 'job_recommendations'),
+    ('"overall_score"', 'report'),
+    ('"interviewer_assessment"', 'evaluation'),
+]
+
+QUESTION_TOPICS = [
+    "design a rate limiter for a public API",
+    "debug a memory leak in a long-running service",
+    "choose between SQL and NoSQL for a new feature",
+    "roll out a risky database migration",
+    "handle a disagreement with a senior engineer",
+    "speed up a slow test suite",
+    "design a URL shortener",
+    "investigate a sudden rise in p99 latency",
+]
+
+
+def canned_llm_text(prompt: str, responses: Dict[str, Any]) -> str:
+    """Canned JSON text for a prompt"""
+    lowered = prompt.lower()
+    for keyword, name in PROMPT_RULES:
+        if keyword in lowered:
+            return json.dumps(responses[name])
+    # Vary questions so the interview flow does not reject them as repeats
+    question = dict(responses['question'])
+    question['question'] = f"Walk me through how you would {random.choice(QUESTION_TOPICS)}. (#{random.randint(1, 10 ** 6)})"
+    return json.dumps(question)
+
+
+def search_body(query: str, num: int) -> Dict[str, Any]:
+    boards = ['linkedin.com', 'indeed.com', 'naukri.com', 'glassdoor.com']
+    items = []
+    for i in range(num):
+        board = boards[i % len(boards)]
+        items.append({
+            "title": f"{query.split(' jobs ')[0][:60]} - Opening {i + 1}",
+            "link": f"https://www.{board}/jobs/view/{random.randint(10 ** 6, 10 ** 7)}",
+            "snippet": "Python, SQL, REST APIs, Docker. 2-4 years experience. Remote friendly.",
+            "displayLink": f"www.{board}"
+        })
+    return {"searchInformation": {"totalResults": str(num * 37)}, "items": items}
+
+
+def youtube_body(query: str, num: int) -> Dict[str, Any]:
+    items = []
+    for i in range(num):
+        video_id = f"lt{random.randint(10 ** 8, 10 ** 9)}"
+        items.append({
+            "id": {"kind": "youtube#video", "videoId": video_id},
+            "snippet": {
+                "title": f"{query[:50]} - Lesson {i + 1}",
+                "description": "Step-by-step tutorial with hands-on examples.",
+                "thumbnails": {"high": {"url": f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"}},
+                "channelTitle": "Load Test Academy",
+                "publishedAt": "2024-01-01T00:00:00Z"
+            }
+        })
+    return {"items": items}
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+GEMINI_PATH = re.compile(r'^/v1(?:beta)?/models/[^:/]+:(generateContent|streamGenerateContent)$')
+
+
+class FakeUpstream:
+    """Latency, error injection and counters shared by all request handlers"""
+
+    def __init__(
+        self,
+        latency: Dict[str, str] = None,
+        error_rates: Dict[str, float] = None,
+        retry_after: int = 2,
+        responses: Dict[str, Any] = None,
+        stream_chunks: int = 4
+    ):
+        specs = {**DEFAULT_LATENCY, **(latency or {})}
+        self.samplers = {name: parse_latency(spec) for name, spec in specs.items()}
+        self.latency_specs = specs
+        self.error_rates = {name: 0.0 for name in UPSTREAMS}
+        self.error_rates.update(error_rates or {})
+        self.retry_after = retry_after
+        self.responses = {**CANNED_LLM_RESPONSES, **(responses or {})}
+        self.stream_chunks = stream_chunks
+        self._lock = threading.Lock()
+        self._stats = {name: Counter() for name in UPSTREAMS}
+
+    def count(self, upstream: str, name: str):
+        with self._lock:
+            self._stats[upstream][name] += 1
+
+    def delay(self, upstream: str) -> float:
+        seconds = self.samplers[upstream]()
+        time.sleep(seconds)
+        return seconds
+
+    def inject_error(self, upstream: str) -> bool:
+        return random.random() < self.error_rates.get(upstream, 0.0)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                name: {
+                    "requests": counter['requests'],
+                    "rateLimited": counter['rate_limited'],
+                    "latency": self.latency_specs[name],
+                    "errorRate": self.error_rates[name]
+                }
+                for name, counter in self._stats.items()
+            }
+
+
+def _make_handler(upstream: FakeUpstream):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass  # One line per request would dominate a load test
+
+        def _send_json(self, status: int, body: Any, headers: Dict[str, str] = None):
+            payload = json.dumps(body).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=UTF-8')
+            self.send_header('Content-Length', str(len(payload)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _read_json(self) -> Dict[str, Any]:
+            length = int(self.headers.get('Content-Length') or 0)
+            if not length:
+                return {}
+            try:
+                return json.loads(self.rfile.read(length))
+            except ValueError:
+                return {}
+
+        def _begin(self, name: str) -> bool:
+            """Count, sleep for the sampled latency, and answer 429 if an error is injected"""
+            upstream.count(name, 'requests')
+            upstream.delay(name)
+            if upstream.inject_error(name):
+                upstream.count(name, 'rate_limited')
+                self._send_json(429, {"error": {"code": 429, "message": "Resource has been exhausted (e.g. check quota).",
+                                                "status": "RESOURCE_EXHAUSTED"}},
+                                {'Retry-After': str(upstream.retry_after)})
+                return False
+            return True
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            num = int(query.get('num') or query.get('maxResults') or 10)
+
+            if url.path == '/__stats':
+                self._send_json(200, upstream.stats())
+            elif url.path.endswith('/customsearch/v1'):
+                if self._begin('search'):
+                    self._send_json(200, search_body(query.get('q', 'Software Engineer'), min(num, 10)))
+            elif url.path.endswith('/youtube/v3/search'):
+                if self._begin('youtube'):
+                    self._send_json(200, youtube_body(query.get('q', 'programming tutorial'), min(num, 50)))
+            else:
+                self._send_json(404, {"error": f"No fake upstream at {url.path}"})
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            body = self._read_json()
+            gemini = GEMINI_PATH.match(url.path)
+
+            if gemini:
+                prompt = ' '.join(
+                    part.get('text', '')
+                    for content in body.get('contents', [])
+                    for part in content.get('parts', [])
+                )
+                if self._begin('gemini'):
+                    text = canned_llm_text(prompt, upstream.responses)
+                    if gemini.group(1) == 'streamGenerateContent':
+                        self._send_json(200, [self._gemini_response(chunk) for chunk in self._chunks(text)])
+                    else:
+                        self._send_json(200, self._gemini_response(text))
+            elif url.path.endswith('/chat/completions'):
+                prompt = ' '.join(str(m.get('content', '')) for m in body.get('messages', []))
+                if self._begin('openrouter'):
+                    text = canned_llm_text(prompt, upstream.responses)
+                    self._send_json(200, {
+                        "id": f"gen-{random.randint(10 ** 8, 10 ** 9)}",
+                        "model": body.get('model', 'fake'),
+                        "choices": [{"index": 0, "finish_reason": "stop",
+                                     "message": {"role": "assistant", "content": text}}]
+                    })
+            else:
+                self._send_json(404, {"error": f"No fake upstream at {url.path}"})
+
+        def _chunks(self, text: str) -> List[str]:
+            size = max(1, math.ceil(len(text) / upstream.stream_chunks))
+            return [text[i:i + size] for i in range(0, len(text), size)]
+
+        @staticmethod
+        def _gemini_response(text: str) -> Dict[str, Any]:
+            return {
+                "candidates": [{
+                    "content": {"parts": [{"text": text}], "role": "model"},
+                    "finishReason": "STOP",
+                    "index": 0
+                }],
+                "usageMetadata": {"promptTokenCount": 0, "candidatesTokenCount": len(text) // 4}
+            }
+
+    return Handler
+
+
+def service_env(base_url: str) -> Dict[str, str]:
+    """Environment that points GeminiService, InterviewAI, LlamaInterviewAI, job search and YouTube at the fake"""
+    base_url = base_url.rstrip('/')
+    return {
+        "GEMINI_API_ENDPOINT": base_url,
+        "GEMINI_API_KEY": "loadtest",
+        "OPENROUTER_BASE_URL": f"{base_url}/api/v1",
+        "OPENROUTER_API_KEY_1": "loadtest",
+        "GOOGLE_SEARCH_BASE_URL": f"{base_url}/customsearch/v1",
+        "GOOGLE_SEARCH_API_KEY": "loadtest",
+        "GOOGLE_SEARCH_ENGINE_ID": "loadtest",
+        "YOUTUBE_API_BASE_URL": f"{base_url}/youtube/v3",
+    }
+
+
+def serve(host: str, port: int, upstream: FakeUpstream) -> ThreadingHTTPServer:
+    """Start the server on a background thread and return it"""
+    server = ThreadingHTTPServer((host, port), _make_handler(upstream))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-upstream", daemon=True).start()
+    return server
+
+
+def _parse_pairs(values: Optional[List[str]], convert) -> Dict[str, Any]:
+    pairs = {}
+    for value in values or []:
+        name, sep, setting = value.partition('=')
+        if not sep or name not in UPSTREAMS:
+            raise argparse.ArgumentTypeError(f"Expected <upstream>=<value> with upstream in {UPSTREAMS}, got {value}")
+        pairs[name] = convert(setting)
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Gemini/OpenRouter/Google Search/YouTube server for load tests")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8090)
+    parser.add_argument('--latency', action='append', metavar='UPSTREAM=SPEC',
+                        help="e.g. gemini=lognormal:900:0.5, search=uniform:80:250, youtube=fixed:50 (ms)")
+    parser.add_argument('--error-rate', action='append', metavar='UPSTREAM=RATE',
+                        help="Fraction of requests answered with 429, e.g. gemini=0.05")
+    parser.add_argument('--retry-after', type=int, default=2, help="Retry-After seconds sent with injected 429s")
+    parser.add_argument('--responses', help="JSON file overriding canned LLM bodies (keys: resume_analysis, "
+                                            "job_recommendations, evaluation, report, question)")
+    parser.add_argument('--seed', type=int, help="Random seed for reproducible latency/error sequences")
+    parser.add_argument('--print-env', action='store_true',
+                        help="Print export lines that point the services at this server and exit")
+    args = parser.parse_args()
+
+    base_url = f"http://{args.host}:{args.port}"
+    if args.print_env:
+        for name, value in service_env(base_url).items():
+            print(f"export {name}={value}")
+        return
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    responses = None
+    if args.responses:
+        with open(args.responses) as f:
+            responses = json.load(f)
+
+    upstream = FakeUpstream(
+        latency=_parse_pairs(args.latency, str),
+        error_rates=_parse_pairs(args.error_rate, float),
+        retry_after=args.retry_after,
+        responses=responses
+    )
+    server = serve(args.host, args.port, upstream)
+
+    print("=" * 70)
+    print(f"Fake upstream listening on {base_url}")
+    for name in UPSTREAMS:
+        print(f"   {name:<11} latency={upstream.latency_specs[name]:<22} 429 rate={upstream.error_rates[name]:.0%}")
+    print(f"Stats: {base_url}/__stats")
+    print("=" * 70)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
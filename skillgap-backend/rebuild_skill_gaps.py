@@ -0,0 +1,39 @@
+"""
+Materialized Skill Gap Rebuild
+
+Recomputes the skillGapResults collection from users and requiredSkills, one
+vectorized pass per role:
+
+    python rebuild_skill_gaps.py                                # every role, drops orphaned results
+    python rebuild_skill_gaps.py --role "Software Developer"    # only these roles (repeatable)
+"""
+
+import sys
+import time
+import argparse
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from services.skill_gap_results_service import SkillGapResultsStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild materialized skill gap results")
+    parser.add_argument('--role', action='append', help="Rebuild only this role (repeatable)")
+    args = parser.parse_args()
+
+    print("📊 Rebuilding skill gap results")
+    print("=" * 70)
+    start = time.perf_counter()
+    report = SkillGapResultsStore(enabled=True).rebuild(args.role)
+    written = sum(counts['written'] for counts in report['roles'].values())
+    skipped = sum(counts['skipped'] for counts in report['roles'].values())
+    print("=" * 70)
+    print(f"✅ {written} result(s) across {len(report['roles'])} role(s) in {time.perf_counter() - start:.1f}s"
+          f" ({skipped} newer result(s) kept, {report['orphansRemoved']} orphan(s) removed)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,14 +4,21 @@ from services.opportunity_service import OpportunityService
 from services.reasoning_service import ReasoningService
 from services.mongodb_service import get_db
 from services.skill_gap_service import SkillGapService
+from services.cohort_skill_gap_service import CohortSkillGapService
+from services.skill_gap_results_service import get_skill_gap_results, bump_user_version, touches_user_inputs
 from services.gemini_service import get_gemini_service
 from services.google_search_service import get_job_search_service
 from services.youtube_service import get_youtube_service
+from services.llm_cache_service import get_llm_cache
+from services.search_cache_service import get_search_cache
+from services.provider_health import get_provider_health
+from services.prompt_budget import get_prompt_budget
+from services.analysis_job_service import AnalysisJobQueue, get_analysis_job_queue
 import uuid
 from datetime import datetime
 import os
 from werkzeug.utils import secure_filename
-import PyPDF2
+from pymongo.errors import DuplicateKeyError
 
 api_bp = Blueprint('api', __name__)
 
@@ -84,7 +91,12 @@ def register_user():
             "lastLogin": datetime.utcnow().isoformat()
         }
         
-        db.auth_users.insert_one(user_doc)
+        try:
+            db.auth_users.insert_one(user_doc)
+        except DuplicateKeyError as e:
+            # Concurrent registration slipped past the lookups above; the unique indexes catch it
+            field = "Aadhaar number" if 'aadhaar' in str(e) else "Email"
+            return jsonify({"error": f"{field} already registered"}), 400
         
         return jsonify({
             "message": "Registration successful!",
@@ -307,7 +319,7 @@ def get_all_users():
 @api_bp.route('/skill-gap/analysis/<user_id>', methods=['GET'])
 def get_skill_gap_analysis(user_id):
     """
-    Calculate and return comprehensive skill gap analysis for a user.
+    Return comprehensive skill gap analysis for a user (materialized in skillGapResults).
     
     Args:
         user_id: The user ID to analyze
@@ -316,7 +328,7 @@ def get_skill_gap_analysis(user_id):
         JSON with skill gaps, match percentage, readiness score
     """
     try:
-        analysis = SkillGapService.calculate_skill_gap(user_id)
+        analysis = get_skill_gap_results().get(user_id)
         return jsonify(analysis)
     except ValueError as e:
         return jsonify({"error": str(e)}), 404
@@ -324,6 +336,45 @@ def get_skill_gap_analysis(user_id):
         return jsonify({"error": str(e)}), 500
 
 
+@api_bp.route('/skill-gap/cohort', methods=['GET'])
+def get_cohort_skill_gap():
+    """
+    Skill gap distribution for every user of a role, with paginated per-user results.
+    
+    Query params:
+        role: Role whose users form the cohort (required)
+        page: 1-based page of per-user results (default 1)
+        page_size: Users per page (default 50, max 500)
+        sort: readiness_score (default, weakest first), match_percentage or name
+        order: asc (default) or desc
+        
+    Returns:
+        JSON with summary, histograms, per-skill breakdown, users and pagination
+    """
+    role = request.args.get('role', '').strip()
+    if not role:
+        return jsonify({"error": "role query parameter is required"}), 400
+    try:
+        page = int(request.args.get('page', 1))
+        page_size = int(request.args.get('page_size', 50))
+    except ValueError:
+        return jsonify({"error": "page and page_size must be integers"}), 400
+
+    try:
+        cohort = CohortSkillGapService.analyze_role(
+            role,
+            page=page,
+            page_size=page_size,
+            sort=request.args.get('sort', 'readiness_score'),
+            descending=request.args.get('order', 'asc').lower() == 'desc'
+        )
+        return jsonify(cohort)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @api_bp.route('/skill-gap/required-skills/<role>', methods=['GET'])
 def get_required_skills(role):
     """
@@ -431,7 +482,10 @@ def upload_resume():
 @api_bp.route('/ai/analyze-resume', methods=['POST'])
 def analyze_resume():
     """
-    Analyze resume using Gemini API
+    Queue a resume for Gemini analysis
+    
+    The analysis runs on a background worker; poll
+    GET /api/ai/analyze-resume/<job_id> for progress and the result.
     
     Request Body:
         {
@@ -440,7 +494,7 @@ def analyze_resume():
         }
     
     Returns:
-        Gemini analysis with skills, experience, recommendations
+        202 with {"success": true, "jobId": "...", "status": "queued"}
     """
     try:
         data = request.json
@@ -451,125 +505,15 @@ def analyze_resume():
         if not user_id or not resume_url:
             return jsonify({"error": "userId and resumeURL are required"}), 400
         
-        print(f"\n{'='*60}")
-        print(f"📄 Starting Resume Analysis")
-        print(f"User ID: {user_id}")
-        print(f"Resume URL: {resume_url}")
-        print(f"Target Domain: {target_domain}")
-        print(f"{'='*60}\n")
+        job_id = get_analysis_job_queue().enqueue(user_id, resume_url, target_domain)
+        print(f"📄 Queued resume analysis job {job_id} for user {user_id} ({target_domain})")
         
-        try:
-            # Initialize Gemini service
-            print("🔧 Initializing Gemini service...")
-            gemini_service = get_gemini_service()
-            print("✅ Gemini service initialized")
-            
-            # Extract text from PDF
-            print(f"📖 Extracting text from PDF: {resume_url}")
-            
-            # Check if it's a local file URL (localhost)
-            if 'localhost' in resume_url or '127.0.0.1' in resume_url:
-                # Convert localhost URL to local file path
-                # URL format: http://localhost:5000/api/files/resumes/{userId}/{filename}
-                url_parts = resume_url.split('/files/')
-                if len(url_parts) == 2:
-                    relative_path = url_parts[1]  # resumes/{userId}/{filename}
-                    local_file_path = os.path.join(UPLOAD_FOLDER, relative_path)
-                    print(f"📁 Converting localhost URL to file path: {local_file_path}")
-                    
-                    if os.path.exists(local_file_path):
-                        print(f"✅ File exists, reading directly from filesystem")
-                        # Read PDF directly from filesystem
-                        import PyPDF2
-                        with open(local_file_path, 'rb') as pdf_file:
-                            pdf_reader = PyPDF2.PdfReader(pdf_file)
-                            resume_text = ""
-                            for page in pdf_reader.pages:
-                                resume_text += page.extract_text() + "\n"
-                            resume_text = resume_text.strip()
-                    else:
-                        print(f"❌ File not found: {local_file_path}")
-                        raise FileNotFoundError(f"Resume file not found: {local_file_path}")
-                else:
-                    # Fallback to URL download if parsing fails
-                    resume_text = gemini_service.extract_text_from_pdf_url(resume_url)
-            else:
-                # External URL (e.g., Firebase Storage), use HTTP download
-                resume_text = gemini_service.extract_text_from_pdf_url(resume_url)
-            
-            print(f"✅ Extracted {len(resume_text)} characters from PDF")
-            
-            if len(resume_text) < 100:
-                print(f"⚠️ WARNING: Resume text is very short ({len(resume_text)} chars)")
-            
-            # Analyze resume
-            print(f"🤖 Starting Gemini AI analysis for user {user_id}")
-            analysis_result = gemini_service.analyze_resume(resume_text, target_domain)
-            print(f"📊 Analysis completed. Success: {analysis_result.get('success')}")
-            
-            if not analysis_result.get('success'):
-                # Analysis completely failed
-                error_msg = analysis_result.get('error', 'Unknown error')
-                print(f"❌ Analysis failed: {error_msg}")
-                return jsonify({
-                    "success": False,
-                    "error": f"AI analysis failed: {error_msg}",
-                    "analysis": None
-                }), 500
-            
-            # Store analysis in MongoDB (even if it's fallback analysis)
-            print("💾 Storing analysis in MongoDB...")
-            db = get_db()
-            db.users.update_one(
-                {'_id': user_id},
-                {'$set': {
-                    'geminiAnalysis': analysis_result['data'],
-                    'analysisDate': datetime.utcnow().isoformat(),
-                    'analysisFallback': 'warning' in analysis_result  # Flag if fallback was used
-                }},
-                upsert=True
-            )
-            print("✅ Analysis stored successfully in MongoDB")
-            
-            # Check if warning exists (fallback was used)
-            warning_msg = analysis_result.get('warning')
-            if warning_msg:
-                print(f"⚠️ {warning_msg}")
-            
-            print(f"\n{'='*60}")
-            print(f"✅ Resume Analysis Complete for User: {user_id}")
-            print(f"{'='*60}\n")
-            
-            response_data = {
-                "success": True,
-                "analysis": analysis_result['data']
-            }
-            
-            # Include warning if present
-            if warning_msg:
-                response_data['warning'] = warning_msg
-            
-            return jsonify(response_data)
-        
-        except Exception as analysis_error:
-            # Log the error with full details
-            error_msg = str(analysis_error)
-            print(f"\n{'='*60}")
-            print(f"❌ ANALYSIS ERROR")
-            print(f"Error Type: {type(analysis_error).__name__}")
-            print(f"Error Message: {error_msg}")
-            print(f"User ID: {user_id}")
-            print(f"Resume URL: {resume_url}")
-            print(f"{'='*60}\n")
-            
-            import traceback
-            traceback.print_exc()
-            
-            return jsonify({
-                "success": False,
-                "error": f"Resume analysis failed: {error_msg}",
-                "analysis": None
-            }), 500
+        return jsonify({
+            "success": True,
+            "jobId": job_id,
+            "status": "queued",
+            "statusURL": f"/api/ai/analyze-resume/{job_id}"
+        }), 202
         
     except Exception as e:
         print(f"\n❌ REQUEST ERROR: {str(e)}")
@@ -578,6 +522,27 @@ def analyze_resume():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@api_bp.route('/ai/analyze-resume/<job_id>', methods=['GET'])
+def get_analyze_resume_job(job_id):
+    """
+    Get progress of a queued resume analysis
+    
+    Returns:
+        Job status (queued/extracting/analyzing/storing/stored/failed),
+        per-stage timings in ms, and the analysis once stored
+    """
+    try:
+        job = get_analysis_job_queue().get_job(job_id)
+        
+        if job is None:
+            return jsonify({"success": False, "error": "Job not found"}), 404
+        
+        return jsonify(AnalysisJobQueue.to_response(job))
+        
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
 @api_bp.route('/ai/resume-analysis/<user_id>', methods=['GET'])
 def get_resume_analysis(user_id):
     """
@@ -619,6 +584,45 @@ def get_resume_analysis(user_id):
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@api_bp.route('/ai/cache/stats', methods=['GET'])
+def get_llm_cache_stats():
+    """
+    Get hit/miss counters for the resume analysis LLM cache and the search result cache
+    
+    Returns:
+        Cache statistics (hits, misses, evictions, hitRate, size)
+    """
+    try:
+        return jsonify({
+            "success": True,
+            "stats": get_llm_cache().stats(),
+            "searchCache": get_search_cache().stats()
+        })
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@api_bp.route('/ai/gemini/stats', methods=['GET'])
+def get_gemini_pool_stats():
+    """
+    Get per-key load counters for the Gemini client pool and LLM circuit breaker state
+    
+    Returns:
+        In-flight, request, error and cooldown counters for each API key,
+        plus breaker states and state-transition counters for every LLM provider,
+        and resume prompt budget usage (p50/p99 tokens per call)
+    """
+    try:
+        return jsonify({
+            "success": True,
+            "keys": get_gemini_service().pool.stats(),
+            "providerHealth": get_provider_health().stats(),
+            "promptBudget": get_prompt_budget().stats()
+        })
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
 @api_bp.route('/ai/job-recommendations', methods=['GET'])
 def get_job_recommendations_ai():
     """
@@ -816,7 +820,11 @@ def search_jobs():
                 user_profile['interestedDomain'] = recommended_roles[0]
             else:
                 user_profile['interestedDomain'] = 'Software Engineer'
-        
+        # Recommended roles enrich the profile embedding used for ranking
+        user_profile['recommendedRoles'] = [
+            role for role in gemini_analysis.get('recommendedRoles', []) if isinstance(role, str)
+        ]
+
         # Set location
         user_profile['location'] = location
         
@@ -915,10 +923,14 @@ def update_user_profile():
         
         # Update MongoDB
         db = get_db()
+        # Skill gap results only depend on skills, role and name, which profile fields do not include today
+        inputs_changed = touches_user_inputs(profile_updates)
         db.users.update_one(
             {'_id': user_id},
-            {'$set': profile_updates}
+            {'$set': profile_updates, **(bump_user_version() if inputs_changed else {})}
         )
+        if inputs_changed:
+            get_skill_gap_results().invalidate(user_id)
         
         return jsonify({
             "success": True,
@@ -3,7 +3,9 @@ Interview Bot API Routes
 Handles AI-powered interview sessions using Gemini AI
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from services.session_store import create_session_store
+from services.question_prefetch import get_question_prefetcher
 import os
 import uuid
 from datetime import datetime
@@ -25,8 +27,13 @@ except Exception as e:
 
 interview_bp = Blueprint('interview', __name__)
 
-# Store active interview sessions in memory (use Redis/DB in production)
-sessions = {}
+# Interview session state (in-memory LRU by default, INTERVIEW_SESSION_STORE=mongodb to share across workers)
+sessions = create_session_store()
+
+# Speculative next-question generation while the candidate is answering
+prefetcher = get_question_prefetcher()
+
+MAX_QUESTIONS = 10
 
 # Video storage directory
 VIDEO_DIR = os.path.join(os.path.dirname(__file__), "..", "interview_videos")
@@ -39,6 +46,12 @@ def health_check():
     return jsonify({"status": "healthy", "service": "interview-bot", "timestamp": datetime.now().isoformat()})
 
 
+@interview_bp.route('/prefetch/stats', methods=['GET'])
+def prefetch_stats():
+    """Speculative next-question prefetch counters and hit rate"""
+    return jsonify({"success": True, "prefetch": prefetcher.stats()})
+
+
 @interview_bp.route('/start', methods=['POST'])
 def start_interview():
     """
@@ -73,7 +86,7 @@ def start_interview():
         }
         
         # Store session
-        sessions[session_id] = session_data
+        sessions.create(session_id, session_data)
         
         return jsonify({
             "success": True,
@@ -92,14 +105,14 @@ def start_interview():
 def get_next_question(session_id):
     """Get the next interview question using Gemini AI"""
     try:
-        if session_id not in sessions:
+        session = sessions.get(session_id)
+        if session is None:
             return jsonify({"success": False, "error": "Session not found"}), 404
         
-        session = sessions[session_id]
         question_num = session["question_count"] + 1
         
         # Maximum 10 questions per interview
-        if question_num > 10:
+        if question_num > MAX_QUESTIONS:
             return jsonify({
                 "success": False,
                 "error": "Interview completed",
@@ -109,22 +122,9 @@ def get_next_question(session_id):
         # Generate question using Gemini AI
         if AI_AVAILABLE and ai_engine:
             try:
-                # Calculate average score from previous answers
-                answers = session.get("answers", [])
-                if answers:
-                    scores = [a.get('evaluation', {}).get('score', 6.0) for a in answers if 'evaluation' in a]
-                    avg_score = sum(scores) / len(scores) if scores else 6.0
-                else:
-                    avg_score = 6.0
-                
-                context = {
-                    "job_title": session["job_title"],
-                    "company": session["company"],
-                    "question_count": session["question_count"],
-                    "avg_score": avg_score
-                }
-                
-                question_data = ai_engine.generate_next_question(context)
+                question_data = take_prefetched_question(session_id, session, question_num)
+                if question_data is None:
+                    question_data = ai_engine.generate_next_question(question_context(session))
                 question_data["question_number"] = question_num
                 
             except Exception as e:
@@ -136,8 +136,8 @@ def get_next_question(session_id):
             question_data = get_fallback_question(session, question_num)
         
         # Store question in session
-        session["questions"].append(question_data)
-        session["question_count"] = question_num
+        sessions.append(session_id, "questions", question_data, {"question_count": question_num})
+        prefetch_next_question(session_id, session, question_num)
         
         return jsonify({
             "success": True,
@@ -148,6 +148,127 @@ def get_next_question(session_id):
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+def question_context(session):
+    """Context for question generation, including the average score of previous answers"""
+    answers = session.get("answers", [])
+    if answers:
+        scores = [a.get('evaluation', {}).get('score', 6.0) for a in answers if 'evaluation' in a]
+        avg_score = sum(scores) / len(scores) if scores else 6.0
+    else:
+        avg_score = 6.0
+    
+    return {
+        "job_title": session["job_title"],
+        "company": session["company"],
+        "question_count": session["question_count"],
+        "avg_score": avg_score
+    }
+
+
+def take_prefetched_question(session_id, session, question_num):
+    """The speculatively generated question, if it still fits the candidate's current average"""
+    if not (AI_AVAILABLE and ai_engine):
+        return None
+    return prefetcher.take(
+        session_id,
+        question_num,
+        question_context(session)["avg_score"],
+        asked=[q.get("question", "") for q in session.get("questions", [])]
+    )
+
+
+def prefetch_next_question(session_id, session, question_num):
+    """Start generating question N+1 in the background as soon as question N is served"""
+    if not (AI_AVAILABLE and ai_engine) or question_num >= MAX_QUESTIONS:
+        return
+    # Assume the pending answer scores at the current average
+    context = {**question_context(session), "question_count": question_num}
+    prefetcher.prefetch(
+        session_id,
+        question_num + 1,
+        context["avg_score"],
+        lambda: ai_engine.generate_next_question(context)
+    )
+
+
+def sse_event(event, data):
+    """Format one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def sse_response(events):
+    """Stream an event generator as text/event-stream, unbuffered by proxies"""
+    return Response(
+        stream_with_context(events),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@interview_bp.route('/<session_id>/question/stream', methods=['GET'])
+def stream_next_question(session_id):
+    """
+    Streaming variant of /question (server-sent events)
+    
+    Events:
+        start  - {"question_number": n}, sent immediately
+        token  - {"text": ...} raw model output as it is generated
+        field  - {"key": ..., "value": ...} each top-level field once complete
+                 ("question" arrives first)
+        done   - {"success": true, "question": {...}} after the question is stored
+    
+    Once a "question" field has been sent the stored question is always that
+    text, even if generation fails afterwards, so the candidate answers the
+    question that is evaluated.
+    """
+    session = sessions.get(session_id)
+    if session is None:
+        return jsonify({"success": False, "error": "Session not found"}), 404
+    
+    question_num = session["question_count"] + 1
+    if question_num > MAX_QUESTIONS:
+        return jsonify({
+            "success": False,
+            "error": "Interview completed",
+            "completed": True
+        }), 200
+    
+    def events():
+        yield sse_event("start", {"question_number": question_num})
+        
+        question_data = take_prefetched_question(session_id, session, question_num)
+        streamed = {}
+        if question_data is not None:
+            for key, value in question_data.items():
+                yield sse_event("field", {"key": key, "value": value})
+        elif AI_AVAILABLE and ai_engine:
+            try:
+                for event, payload in ai_engine.stream_next_question(question_context(session)):
+                    if event == "done":
+                        question_data = payload
+                    else:
+                        if event == "field":
+                            streamed[payload["key"]] = payload["value"]
+                        yield sse_event(event, payload)
+            except Exception as e:
+                print(f"AI streaming error: {e}")
+        
+        if question_data is None:
+            if "question" in streamed:
+                # The candidate is already reading the streamed question; keep it
+                question_data = {"category": "General", "difficulty": "Medium", **streamed}
+            else:
+                question_data = get_fallback_question(session, question_num)
+                yield sse_event("field", {"key": "question", "value": question_data["question"]})
+        question_data["question_number"] = question_num
+        
+        sessions.append(session_id, "questions", question_data, {"question_count": question_num})
+        prefetch_next_question(session_id, session, question_num)
+        yield sse_event("done", {"success": True, "question": question_data})
+    
+    return sse_response(events())
+
+
 def get_fallback_question(session, question_num):
     """Fallback questions when AI is not available"""
     questions = [
@@ -191,7 +312,8 @@ def get_fallback_question(session, question_num):
 def submit_answer(session_id):
     """Submit an answer and get AI evaluation from Gemini"""
     try:
-        if session_id not in sessions:
+        session = sessions.get(session_id)
+        if session is None:
             return jsonify({"success": False, "error": "Session not found"}), 404
         
         data = request.json
@@ -204,21 +326,13 @@ def submit_answer(session_id):
                 "error": "Answer cannot be empty"
             }), 400
         
-        session = sessions[session_id]
-        
         # Evaluate answer using Gemini AI
         if AI_AVAILABLE and ai_engine:
             try:
-                context = {
-                    "job_title": session["job_title"],
-                    "company": session["company"],
-                    "question_count": session["question_count"]
-                }
-                
                 evaluation = ai_engine.evaluate_answer(
                     question=question_data.get("question"),
                     answer=answer,
-                    context=context
+                    context=answer_context(session)
                 )
             except Exception as e:
                 print(f"AI evaluation error: {e}")
@@ -229,13 +343,7 @@ def submit_answer(session_id):
             evaluation = get_fallback_evaluation(answer)
         
         # Store answer with evaluation
-        session["answers"].append({
-            "question_number": question_data.get("question_number"),
-            "question": question_data.get("question"),
-            "answer": answer,
-            "evaluation": evaluation,
-            "timestamp": datetime.now().isoformat()
-        })
+        store_answer(session_id, question_data, answer, evaluation)
         
         return jsonify({
             "success": True,
@@ -247,6 +355,83 @@ def submit_answer(session_id):
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+def answer_context(session):
+    """Context for answer evaluation"""
+    return {
+        "job_title": session["job_title"],
+        "company": session["company"],
+        "question_count": session["question_count"]
+    }
+
+
+def store_answer(session_id, question_data, answer, evaluation):
+    """Append an evaluated answer to the session"""
+    sessions.append(session_id, "answers", {
+        "question_number": question_data.get("question_number"),
+        "question": question_data.get("question"),
+        "answer": answer,
+        "evaluation": evaluation,
+        "timestamp": datetime.now().isoformat()
+    })
+
+
+@interview_bp.route('/<session_id>/answer/stream', methods=['POST'])
+def stream_answer_evaluation(session_id):
+    """
+    Streaming variant of /answer (server-sent events)
+    
+    Events:
+        start  - {"question_number": n}, sent immediately
+        token  - {"text": ...} raw model output as it is generated
+        field  - {"key": ..., "value": ...} each top-level field once complete
+                 ("score" arrives first, then "interviewer_assessment")
+        done   - {"success": true, "evaluation": {...}, "question_number": n} after the answer is stored
+    """
+    session = sessions.get(session_id)
+    if session is None:
+        return jsonify({"success": False, "error": "Session not found"}), 404
+    
+    data = request.json or {}
+    question_data = data.get('question_data') or {}
+    answer = data.get('answer', '')
+    
+    if not answer.strip():
+        return jsonify({
+            "success": False,
+            "error": "Answer cannot be empty"
+        }), 400
+    
+    def events():
+        yield sse_event("start", {"question_number": question_data.get("question_number")})
+        
+        evaluation = None
+        if AI_AVAILABLE and ai_engine:
+            try:
+                for event, payload in ai_engine.stream_evaluation(
+                    question=question_data.get("question"),
+                    answer=answer,
+                    context=answer_context(session)
+                ):
+                    if event == "done":
+                        evaluation = payload
+                    else:
+                        yield sse_event(event, payload)
+            except Exception as e:
+                print(f"AI streaming error: {e}")
+        
+        if evaluation is None:
+            evaluation = get_fallback_evaluation(answer)
+        
+        store_answer(session_id, question_data, answer, evaluation)
+        yield sse_event("done", {
+            "success": True,
+            "evaluation": evaluation,
+            "question_number": question_data.get("question_number")
+        })
+    
+    return sse_response(events())
+
+
 def get_fallback_evaluation(answer):
     """Fallback evaluation when AI is not available"""
     word_count = len(answer.split())
@@ -280,11 +465,10 @@ def get_fallback_evaluation(answer):
 def get_final_report(session_id):
     """Get final interview report with AI-generated assessment"""
     try:
-        if session_id not in sessions:
+        session = sessions.get(session_id)
+        if session is None:
             return jsonify({"success": False, "error": "Session not found"}), 404
         
-        session = sessions[session_id]
-        
         # Calculate overall score from answers
         answers = session.get("answers", [])
         if answers:
@@ -293,6 +477,9 @@ def get_final_report(session_id):
         else:
             total_score = 6.0
         
+        # The interview is over: drop any speculative next question
+        prefetcher.cancel(session_id)
+        
         # Generate AI report if available
         ai_assessment = None
         if AI_AVAILABLE and ai_engine and answers:
@@ -357,7 +544,8 @@ def get_recommendation(score):
 def upload_video(session_id):
     """Upload interview video recording"""
     try:
-        if session_id not in sessions:
+        session = sessions.get(session_id)
+        if session is None:
             return jsonify({"success": False, "error": "Session not found"}), 404
         
         if 'video' not in request.files:
@@ -368,8 +556,6 @@ def upload_video(session_id):
         if video_file.filename == '':
             return jsonify({"success": False, "error": "Empty filename"}), 400
         
-        session = sessions[session_id]
-        
         # Save video with session info
         filename = f"interview_{session['candidate_name']}_{session_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.webm"
         filepath = os.path.join(VIDEO_DIR, filename)
@@ -391,11 +577,10 @@ def upload_video(session_id):
 def get_session_status(session_id):
     """Get current interview session status"""
     try:
-        if session_id not in sessions:
+        session = sessions.get(session_id)
+        if session is None:
             return jsonify({"success": False, "error": "Session not found"}), 404
         
-        session = sessions[session_id]
-        
         return jsonify({
             "success": True,
             "session_id": session_id,
@@ -414,10 +599,10 @@ def get_session_status(session_id):
 def end_interview(session_id):
     """End interview session and clean up"""
     try:
-        if session_id in sessions:
-            # Get final report before deleting session
-            session = sessions[session_id]
-            
+        # Remove session from the store, keeping its last state for the report
+        session = sessions.delete(session_id)
+        prefetcher.cancel(session_id)
+        if session is not None:
             report = {
                 "session_id": session_id,
                 "candidate_name": session["candidate_name"],
@@ -425,9 +610,6 @@ def end_interview(session_id):
                 "ended_at": datetime.now().isoformat()
             }
             
-            # Remove session from memory
-            del sessions[session_id]
-            
             return jsonify({
                 "success": True,
                 "message": "Interview session ended",
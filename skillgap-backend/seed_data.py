@@ -11,6 +11,7 @@ Run this script to populate MongoDB with demo data for the hackathon.
 import os
 from dotenv import load_dotenv
 from services.mongodb_service import get_db
+from services.skill_gap_results_service import get_skill_gap_results, bump_user_version, bump_required_version
 
 # Load environment variables
 load_dotenv()
@@ -93,7 +94,7 @@ def seed_synthetic_data():
     for skill_data in required_skills_data:
         db.requiredSkills.update_one(
             {'role': skill_data['role']},
-            {'$set': skill_data},
+            {'$set': skill_data, **bump_required_version()},
             upsert=True
         )
         print(f"   ✓ Added required skills for: {skill_data['role']}")
@@ -218,11 +219,14 @@ def seed_synthetic_data():
     for user in users_data:
         db.users.update_one(
             {'_id': user['_id']},
-            {'$set': user},
+            {'$set': user, **bump_user_version()},
             upsert=True
         )
         print(f"   ✓ Added user: {user['name']} ({user['role']})")
     
+    print("\n📊 Materializing skill gap results...")
+    get_skill_gap_results().rebuild([skill_data['role'] for skill_data in required_skills_data])
+    
     print("\n✅ Data seeding completed successfully!")
     print(f"   - {len(required_skills_data)} job roles with required skills")
     print(f"   - {len(users_data)} users with skill profiles")
@@ -0,0 +1,404 @@
+"""
+Resume Analysis Job Queue
+
+Persistent job queue for resume analysis backed by the MongoDB
+'analysisJobs' collection. The web server only enqueues jobs; worker threads
+(in-process or in separate `python worker.py` processes) claim them atomically,
+run the analysis pipeline and record per-stage progress and timings.
+"""
+
+import os
+import time
+import uuid
+import socket
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+from pymongo import ReturnDocument
+from services.mongodb_service import get_db
+from services.resume_analysis_service import ResumeAnalysisService
+from services.request_profiler import profile_block
+
+
+JOBS_COLLECTION = 'analysisJobs'
+
+# Job lifecycle: queued -> extracting -> analyzing -> storing -> stored (or failed)
+ACTIVE_STATUSES = ['extracting', 'analyzing', 'storing']
+TERMINAL_STATUSES = ['stored', 'failed']
+
+
+def _now() -> datetime:
+    return datetime.utcnow()
+
+
+class LeaseLostError(Exception):
+    """Raised when a worker's job was requeued or finished by someone else while it ran"""
+
+    def __init__(self, job_id: str):
+        super().__init__(f"Analysis job {job_id} is no longer held by this worker")
+        self.job_id = job_id
+
+
+class AnalysisJobQueue:
+    """MongoDB-backed queue of resume analysis jobs"""
+
+    def __init__(self, stale_after_seconds: int = None, max_attempts: int = None):
+        """
+        Args:
+            stale_after_seconds: Active jobs without a heartbeat for this long are requeued
+            max_attempts: Jobs are failed after this many claims
+        """
+        self.stale_after_seconds = stale_after_seconds or int(os.getenv('ANALYSIS_JOB_STALE_SECONDS', 300))
+        self.max_attempts = max_attempts or int(os.getenv('ANALYSIS_JOB_MAX_ATTEMPTS', 3))
+        # Wakes in-process workers immediately when a job is enqueued
+        self._job_available = threading.Event()
+
+    @property
+    def collection(self):
+        return get_db()[JOBS_COLLECTION]
+
+    def enqueue(self, user_id: str, resume_url: str, target_domain: str = "General") -> str:
+        """
+        Create a queued analysis job
+
+        Returns:
+            The new job ID
+        """
+        job_id = str(uuid.uuid4())
+        now = _now()
+        self.collection.insert_one({
+            "_id": job_id,
+            "userId": user_id,
+            "resumeURL": resume_url,
+            "targetDomain": target_domain,
+            "status": "queued",
+            "attempts": 0,
+            "workerId": None,
+            "createdAt": now,
+            "updatedAt": now,
+            "heartbeatAt": None,
+            "startedAt": None,
+            "finishedAt": None,
+            "timings": {},
+            "result": None,
+            "error": None
+        })
+        self._job_available.set()
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a job document by ID"""
+        return self.collection.find_one({'_id': job_id})
+
+    def claim_next(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Atomically claim the oldest queued job for a worker
+
+        Returns:
+            The claimed job document, or None if the queue is empty
+        """
+        now = _now()
+        return self.collection.find_one_and_update(
+            {'status': 'queued'},
+            {
+                '$set': {
+                    'status': 'extracting',
+                    'workerId': worker_id,
+                    'startedAt': now,
+                    'updatedAt': now,
+                    'heartbeatAt': now
+                },
+                '$inc': {'attempts': 1}
+            },
+            sort=[('createdAt', 1)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    @staticmethod
+    def _lease(job_id: str, worker_id: str) -> Dict[str, Any]:
+        """Filter matching a job only while this worker still runs it"""
+        return {'_id': job_id, 'workerId': worker_id, 'status': {'$in': ACTIVE_STATUSES}}
+
+    def set_stage(self, job_id: str, worker_id: str, stage: str, timings: Dict[str, float]) -> bool:
+        """
+        Record the job's current stage and stage timings so far
+
+        Returns:
+            False if the worker lost the job (it was requeued or finished meanwhile)
+        """
+        now = _now()
+        result = self.collection.update_one(
+            self._lease(job_id, worker_id),
+            {'$set': {'status': stage, 'timings': timings, 'updatedAt': now, 'heartbeatAt': now}}
+        )
+        return result.matched_count > 0
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """Mark a running job as alive (no-op, returning False, once the worker lost the job)"""
+        result = self.collection.update_one(self._lease(job_id, worker_id), {'$set': {'heartbeatAt': _now()}})
+        return result.matched_count > 0
+
+    def complete(self, job_id: str, worker_id: str, result: Dict[str, Any], timings: Dict[str, float]) -> bool:
+        """Mark a job as stored with its result (False if the worker lost the job)"""
+        now = _now()
+        update = self.collection.update_one(
+            self._lease(job_id, worker_id),
+            {'$set': {
+                'status': 'stored',
+                'result': result,
+                'timings': timings,
+                'finishedAt': now,
+                'updatedAt': now
+            }}
+        )
+        return update.matched_count > 0
+
+    def fail(self, job_id: str, worker_id: str, error: str, timings: Dict[str, float]) -> bool:
+        """Mark a job as failed (False if the worker lost the job)"""
+        now = _now()
+        update = self.collection.update_one(
+            self._lease(job_id, worker_id),
+            {'$set': {
+                'status': 'failed',
+                'error': error,
+                'timings': timings,
+                'finishedAt': now,
+                'updatedAt': now
+            }}
+        )
+        return update.matched_count > 0
+
+    def requeue_stale(self) -> int:
+        """
+        Return jobs abandoned by crashed workers to the queue
+
+        Jobs that already used up max_attempts are failed instead.
+
+        Returns:
+            Number of jobs requeued
+        """
+        cutoff = _now() - timedelta(seconds=self.stale_after_seconds)
+        stale_filter = {'status': {'$in': ACTIVE_STATUSES}, 'heartbeatAt': {'$lt': cutoff}}
+
+        self.collection.update_many(
+            {**stale_filter, 'attempts': {'$gte': self.max_attempts}},
+            {'$set': {'status': 'failed', 'error': 'Worker stopped responding', 'finishedAt': _now()}}
+        )
+        result = self.collection.update_many(
+            stale_filter,
+            {'$set': {'status': 'queued', 'workerId': None, 'updatedAt': _now()}}
+        )
+        if result.modified_count:
+            print(f"♻️ Requeued {result.modified_count} stale analysis job(s)")
+        return result.modified_count
+
+    def wait_for_job(self, timeout: float):
+        """Block until a job is enqueued in this process or the timeout passes"""
+        self._job_available.wait(timeout)
+        self._job_available.clear()
+
+    @staticmethod
+    def to_response(job: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a job document for the polling endpoint"""
+        response = {
+            "success": job['status'] != 'failed',
+            "jobId": job['_id'],
+            "status": job['status'],
+            "userId": job.get('userId'),
+            "timings": job.get('timings', {}),
+            "createdAt": job['createdAt'].isoformat() if job.get('createdAt') else None,
+            "finishedAt": job['finishedAt'].isoformat() if job.get('finishedAt') else None
+        }
+
+        if job['status'] == 'stored' and job.get('result'):
+            response['analysis'] = job['result'].get('analysis')
+            if job['result'].get('warning'):
+                response['warning'] = job['result']['warning']
+        elif job['status'] == 'failed':
+            response['error'] = job.get('error')
+
+        return response
+
+
+class AnalysisWorkerPool:
+    """Pool of worker threads that drain the analysis job queue"""
+
+    def __init__(self, queue: AnalysisJobQueue, concurrency: int = 2, poll_interval: float = 1.0):
+        """
+        Args:
+            queue: Job queue to consume
+            concurrency: Number of worker threads
+            poll_interval: Seconds to wait between polls when the queue is empty
+        """
+        self.queue = queue
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._last_stale_check = 0.0
+        self._stale_check_lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+        self.profile_jobs = os.getenv('PROFILE_ANALYSIS_JOBS', 'false').lower() == 'true'
+
+    def start(self):
+        """Start worker threads (daemon threads, safe to call from the web server)"""
+        if self._threads:
+            return
+        for i in range(self.concurrency):
+            thread = threading.Thread(
+                target=self._run,
+                args=(f"{self.worker_prefix}:{i}",),
+                name=f"analysis-worker-{i}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        print(f"✅ Started {self.concurrency} resume analysis worker(s)")
+
+    def stop(self, timeout: float = 5.0):
+        """Signal workers to stop and wait for them to finish the current job"""
+        self._stop.set()
+        self.queue._job_available.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def join(self):
+        """Block until the workers exit (used by the standalone worker process)"""
+        for thread in self._threads:
+            while thread.is_alive():
+                thread.join(1.0)
+
+    def _run(self, worker_id: str):
+        while not self._stop.is_set():
+            try:
+                self._maybe_requeue_stale()
+                job = self.queue.claim_next(worker_id)
+            except Exception as e:
+                print(f"⚠️ Analysis worker {worker_id} could not reach the job queue: {e}")
+                self._stop.wait(self.poll_interval * 5)
+                continue
+
+            if job is None:
+                self.queue.wait_for_job(self.poll_interval)
+                continue
+
+            with profile_block(f"analysis_job {job['_id']}", enabled=self.profile_jobs):
+                self.process(job)
+
+    def _maybe_requeue_stale(self):
+        """Sweep for abandoned jobs at most once every 30 seconds per process"""
+        with self._stale_check_lock:
+            if time.monotonic() - self._last_stale_check < 30:
+                return
+            self._last_stale_check = time.monotonic()
+        self.queue.requeue_stale()
+
+    @contextmanager
+    def _heartbeat(self, job: Dict[str, Any]):
+        """
+        Refresh the job's heartbeat on a timer while it runs
+
+        Stage changes alone leave long stages (a slow Gemini call while
+        analyzing) without a heartbeat past the stale threshold, so other
+        workers would requeue a job that is still running.
+        """
+        done = threading.Event()
+        interval = max(1.0, self.queue.stale_after_seconds / 3)
+
+        def beat():
+            while not done.wait(interval):
+                try:
+                    self.queue.heartbeat(job['_id'], job.get('workerId'))
+                except Exception as e:
+                    print(f"⚠️ Heartbeat for analysis job {job['_id']} failed: {e}")
+
+        thread = threading.Thread(target=beat, name=f"analysis-heartbeat-{job['_id']}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            done.set()
+            thread.join()
+
+    def process(self, job: Dict[str, Any]):
+        """
+        Run one claimed job through the pipeline, timing each stage
+
+        If the job is requeued while it runs (the worker stalled past the stale
+        threshold), the run stops at the next stage change and leaves the job
+        to its new worker.
+        """
+        job_id = job['_id']
+        worker_id = job.get('workerId')
+        timings: Dict[str, float] = {}
+        if job.get('createdAt') and job.get('startedAt'):
+            timings['queuedMs'] = round((job['startedAt'] - job['createdAt']).total_seconds() * 1000, 1)
+
+        job_start = time.perf_counter()
+        stage_state = {'name': 'extracting', 'start': job_start}
+
+        def on_stage(stage: str):
+            now = time.perf_counter()
+            if stage != stage_state['name']:
+                timings[f"{stage_state['name']}Ms"] = round((now - stage_state['start']) * 1000, 1)
+                stage_state['name'] = stage
+                stage_state['start'] = now
+                if not self.queue.set_stage(job_id, worker_id, stage, timings):
+                    raise LeaseLostError(job_id)
+
+        print(f"📄 Processing analysis job {job_id} for user {job['userId']}")
+        with self._heartbeat(job):
+            try:
+                result = ResumeAnalysisService.run(
+                    job['userId'],
+                    job['resumeURL'],
+                    job.get('targetDomain', 'General'),
+                    on_stage=on_stage
+                )
+                now = time.perf_counter()
+                timings[f"{stage_state['name']}Ms"] = round((now - stage_state['start']) * 1000, 1)
+                timings['totalMs'] = round((now - job_start) * 1000, 1)
+                if self.queue.complete(job_id, worker_id, result, timings):
+                    print(f"✅ Analysis job {job_id} stored in {timings['totalMs']} ms")
+                else:
+                    print(f"⚠️ Analysis job {job_id} finished after it was requeued; result discarded")
+            except LeaseLostError as e:
+                print(f"⚠️ {e}, stopping")
+            except Exception as e:
+                now = time.perf_counter()
+                timings[f"{stage_state['name']}Ms"] = round((now - stage_state['start']) * 1000, 1)
+                timings['totalMs'] = round((now - job_start) * 1000, 1)
+                print(f"❌ Analysis job {job_id} failed during {stage_state['name']}: {e}")
+                if not self.queue.fail(job_id, worker_id, f"Resume analysis failed: {str(e)}", timings):
+                    print(f"⚠️ Analysis job {job_id} was requeued meanwhile; failure not recorded")
+
+
+# Singleton instances
+_job_queue = None
+_worker_pool = None
+
+def get_analysis_job_queue() -> AnalysisJobQueue:
+    """Get or create the analysis job queue singleton"""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = AnalysisJobQueue()
+    return _job_queue
+
+
+def start_analysis_workers(concurrency: int = None) -> Optional[AnalysisWorkerPool]:
+    """
+    Start the in-process worker pool
+
+    Concurrency defaults to ANALYSIS_WORKERS_IN_PROCESS (2). Set it to 0 when
+    workers run as separate `python worker.py` processes.
+    """
+    global _worker_pool
+    if concurrency is None:
+        concurrency = int(os.getenv('ANALYSIS_WORKERS_IN_PROCESS', 2))
+    if concurrency <= 0 or _worker_pool is not None:
+        return _worker_pool
+    _worker_pool = AnalysisWorkerPool(get_analysis_job_queue(), concurrency=concurrency)
+    _worker_pool.start()
+    return _worker_pool
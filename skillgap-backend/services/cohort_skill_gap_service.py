@@ -0,0 +1,241 @@
+"""
+Cohort Skill Gap Service
+
+Skill gap analysis for every user of a role at once. Users and the role's
+required skills are loaded with one query each, user levels are laid out as
+a users x skills matrix and gaps, Critical/Moderate/Good statuses, match
+percentages and readiness scores are computed for the whole cohort in one
+vectorized pass. Per-user numbers are identical to
+SkillGapService.compute_skill_gaps.
+"""
+
+import math
+from typing import Dict, List, Any
+import numpy as np
+from services.mongodb_service import get_db
+from services.skill_taxonomy import get_skill_taxonomy, SkillKey
+
+# Same thresholds as SkillGapService.compute_skill_gaps
+CRITICAL_GAP = 5
+MODERATE_GAP = 3
+
+# Histogram buckets for match percentage and readiness score (0-10, 10-20, ..., 90-100)
+SCORE_BINS = np.linspace(0, 100, 11)
+
+SORT_FIELDS = ('readiness_score', 'match_percentage', 'name')
+MAX_PAGE_SIZE = 500
+
+
+class CohortGaps:
+    """Vectorized skill gap results for a cohort (rows are users, columns required skills)"""
+
+    def __init__(self, users: List[Dict[str, Any]], required_skills: Dict[str, int]):
+        """
+        Args:
+            users: User documents with '_id', 'name' and 'skills' (skill name -> level)
+            required_skills: Skill name -> level required by the role
+        """
+        taxonomy = get_skill_taxonomy()
+        self.users = users
+        self.skill_names = list(required_skills)
+        self.required = np.array([required_skills[name] for name in self.skill_names], dtype=float)
+
+        # Required skills by taxonomy key (two names for one skill share the user's level)
+        columns_by_key: Dict[SkillKey, List[int]] = {}
+        for column, name in enumerate(self.skill_names):
+            columns_by_key.setdefault(taxonomy.key(name), []).append(column)
+
+        # Skill names repeat across users, so each distinct name is resolved once
+        columns_by_name: Dict[str, List[int]] = {}
+        rows, cols, values = [], [], []
+        for row, user in enumerate(users):
+            for name, level in (user.get('skills') or {}).items():
+                columns = columns_by_name.get(name)
+                if columns is None:
+                    columns = columns_by_name[name] = columns_by_key.get(taxonomy.key(name), [])
+                for column in columns:
+                    rows.append(row)
+                    cols.append(column)
+                    values.append(level)
+
+        # Users without a skill stay at level 0; aliases of one skill keep the highest level
+        self.levels = np.zeros((len(users), len(self.skill_names)))
+        if rows:
+            np.maximum.at(self.levels, (np.array(rows), np.array(cols)), np.array(values, dtype=float))
+
+        self.raw_gaps = self.required - self.levels
+        self.gaps = np.maximum(self.raw_gaps, 0)
+        self.critical = self.raw_gaps >= CRITICAL_GAP
+        self.moderate = (self.raw_gaps >= MODERATE_GAP) & ~self.critical
+
+        total_required = self.required.sum()
+        if total_required > 0:
+            self.match_percentage = (total_required - self.gaps.sum(axis=1)) / total_required * 100
+        else:
+            self.match_percentage = np.full(len(users), 100.0)
+        self.critical_counts = self.critical.sum(axis=1)
+        self.moderate_counts = self.moderate.sum(axis=1)
+        penalty = self.critical_counts * 10 + self.moderate_counts * 5
+        self.readiness_score = np.clip(np.round(self.match_percentage, 2) - penalty, 0, 100)
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def order(self, sort: str = 'readiness_score', descending: bool = False) -> np.ndarray:
+        """Row indices in the requested order (stable, so ties keep the load order)"""
+        if sort == 'name':
+            keys = np.array([str(user.get('name') or '') for user in self.users], dtype=object)
+        elif sort == 'match_percentage':
+            keys = self.match_percentage
+        else:
+            keys = self.readiness_score
+        order = np.argsort(keys, kind='stable')
+        return order[::-1] if descending else order
+
+    def user_result(self, row: int) -> Dict[str, Any]:
+        """One user's analysis, in the shape returned by SkillGapService.calculate_skill_gap"""
+        user = self.users[row]
+        skill_gaps = [
+            {
+                'skill_name': name,
+                'required_level': _number(self.required[column]),
+                'user_level': _number(self.levels[row, column]),
+                'gap': _number(self.gaps[row, column]),
+                'status': 'Critical' if self.critical[row, column] else 'Moderate' if self.moderate[row, column] else 'Good'
+            }
+            for column, name in enumerate(self.skill_names)
+        ]
+        critical_count = int(self.critical_counts[row])
+        moderate_count = int(self.moderate_counts[row])
+        # Rounded like compute_skill_gaps (Python round) so both endpoints agree to the digit
+        match_percentage = round(float(self.match_percentage[row]), 2)
+        readiness_score = max(0, min(100, match_percentage - (critical_count * 10 + moderate_count * 5)))
+        return {
+            'user_info': {
+                'user_id': str(user.get('_id')),
+                'name': user.get('name'),
+                'role': user.get('role')
+            },
+            'skill_gaps': sorted(skill_gaps, key=lambda x: x['gap'], reverse=True),
+            'match_percentage': match_percentage,
+            'readiness_score': round(readiness_score, 2),
+            'summary': {
+                'total_skills_required': len(self.skill_names),
+                'critical_gaps': critical_count,
+                'moderate_gaps': moderate_count,
+                'good_skills': len(self.skill_names) - critical_count - moderate_count
+            }
+        }
+
+    def skill_breakdown(self) -> List[Dict[str, Any]]:
+        """Per required skill: average level and how many users fall in each status"""
+        if not len(self.users):
+            return []
+        average_levels = self.levels.mean(axis=0)
+        average_gaps = self.gaps.mean(axis=0)
+        critical = self.critical.sum(axis=0)
+        moderate = self.moderate.sum(axis=0)
+        breakdown = [
+            {
+                'skill_name': name,
+                'required_level': _number(self.required[column]),
+                'average_user_level': round(float(average_levels[column]), 2),
+                'average_gap': round(float(average_gaps[column]), 2),
+                'critical_users': int(critical[column]),
+                'moderate_users': int(moderate[column]),
+                'good_users': len(self.users) - int(critical[column]) - int(moderate[column])
+            }
+            for column, name in enumerate(self.skill_names)
+        ]
+        return sorted(breakdown, key=lambda x: x['average_gap'], reverse=True)
+
+    def histograms(self) -> Dict[str, Any]:
+        """Distribution of match percentage and readiness score over SCORE_BINS"""
+        return {
+            'bins': SCORE_BINS.tolist(),
+            'match_percentage': np.histogram(self.match_percentage, bins=SCORE_BINS)[0].tolist(),
+            'readiness_score': np.histogram(self.readiness_score, bins=SCORE_BINS)[0].tolist()
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        if not len(self.users):
+            return {'users': 0}
+        return {
+            'users': len(self.users),
+            'average_match_percentage': round(float(self.match_percentage.mean()), 2),
+            'average_readiness_score': round(float(self.readiness_score.mean()), 2),
+            'median_readiness_score': round(float(np.median(self.readiness_score)), 2),
+            'users_without_critical_gaps': int((self.critical_counts == 0).sum()),
+            'total_critical_gaps': int(self.critical_counts.sum()),
+            'total_moderate_gaps': int(self.moderate_counts.sum())
+        }
+
+
+def _number(value: float):
+    """Levels are stored as ints; keep them ints in the response when they are whole"""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+class CohortSkillGapService:
+    """Service for skill gap analysis of a whole role cohort"""
+
+    @staticmethod
+    def load_cohort(role: str) -> CohortGaps:
+        """
+        Load every user of a role and the role's required skills (one query each)
+
+        Raises:
+            ValueError: If the role has no required skills document
+        """
+        db = get_db()
+        required_data = db.requiredSkills.find_one({'role': role})
+        if not required_data:
+            raise ValueError(f"Required skills for role {role} not found")
+
+        users = list(db.users.find({'role': role}, {'_id': 1, 'name': 1, 'role': 1, 'skills': 1}))
+        return CohortGaps(users, required_data.get('skills', {}))
+
+    @staticmethod
+    def analyze_role(
+        role: str,
+        page: int = 1,
+        page_size: int = 50,
+        sort: str = 'readiness_score',
+        descending: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Cohort-wide skill gap analysis with one page of per-user results
+
+        Args:
+            role: Role whose users form the cohort
+            page: 1-based page of per-user results
+            page_size: Users per page (capped at MAX_PAGE_SIZE)
+            sort: readiness_score (default, weakest first), match_percentage or name
+            descending: Reverse the sort order
+
+        Returns:
+            Dictionary containing summary, histograms, per-skill breakdown,
+            the page of per-user analyses and pagination info
+        """
+        cohort = CohortSkillGapService.load_cohort(role)
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        total_pages = max(1, math.ceil(len(cohort) / page_size))
+        page = max(1, min(page, total_pages))
+
+        rows = cohort.order(sort if sort in SORT_FIELDS else 'readiness_score', descending)
+        page_rows = rows[(page - 1) * page_size:page * page_size]
+
+        return {
+            'role': role,
+            'summary': cohort.summary(),
+            'histograms': cohort.histograms(),
+            'skills': cohort.skill_breakdown(),
+            'users': [cohort.user_result(int(row)) for row in page_rows],
+            'pagination': {
+                'page': page,
+                'page_size': page_size,
+                'total_users': len(cohort),
+                'total_pages': total_pages
+            }
+        }
@@ -0,0 +1,216 @@
+"""
+Gemini Client Pool
+
+One isolated Gemini client per API key, so concurrent requests never share
+or clobber the process-global `genai.configure()` key. Requests are
+dispatched to the least-loaded key (fewest in-flight calls, then fewest
+total calls). Key health is tracked by per-key circuit breakers: a key that
+hits its quota is skipped until its cooldown ends, and once every key is
+cooling down calls fail fast with ProviderUnavailableError.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Set
+import google.generativeai as genai
+from google.ai import generativelanguage as glm
+from google.api_core import exceptions as api_exceptions
+from services.provider_health import get_provider_health, ProviderUnavailableError
+from services.metrics_service import track_dependency
+
+
+PROVIDER = 'gemini'
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """HTTP status of an API error (google.api_core errors carry it as .code), if any"""
+    code = getattr(error, 'code', None)
+    return code if isinstance(code, int) else None
+
+
+def is_quota_error(error: Exception) -> bool:
+    """True for 429 / RESOURCE_EXHAUSTED responses"""
+    if isinstance(error, api_exceptions.TooManyRequests):  # ResourceExhausted included
+        return True
+    code = _status_code(error)
+    if code is not None:
+        return code == 429
+    # Last resort for errors without a status: the API's own wording, or a message led by the status
+    message = str(error)
+    return message.startswith("429 ") or "RESOURCE_EXHAUSTED" in message or "quota" in message.lower()
+
+
+def gemini_transport_overrides() -> Dict[str, Any]:
+    """
+    Transport settings for a non-Google Gemini endpoint
+
+    GEMINI_API_ENDPOINT (e.g. http://127.0.0.1:8090 for the load-test fake
+    upstream) switches the SDK to its REST transport against that host.
+    Empty when unset, so the default gRPC transport is used.
+    """
+    endpoint = os.getenv('GEMINI_API_ENDPOINT')
+    if not endpoint:
+        return {}
+    return {"transport": "rest", "client_options": {"api_endpoint": endpoint}}
+
+
+def is_request_error(error: Exception) -> bool:
+    """True for errors caused by the request itself (bad prompt/arguments) rather than the key or service"""
+    if isinstance(error, (api_exceptions.BadRequest, genai.types.BlockedPromptException, genai.types.StopCandidateException)):
+        return True
+    code = _status_code(error)
+    if code is not None:
+        return code == 400
+    return str(error).startswith("400 ")
+
+
+class QuotaExhaustedError(ProviderUnavailableError):
+    """Raised when every API key in the pool is over quota"""
+
+    def __init__(self, retry_in: float = 0.0):
+        super().__init__(PROVIDER, retry_in)
+        self.args = ("All API keys have exceeded their quota. Please try again later or upgrade your plan.",)
+
+
+class GeminiKeySlot:
+    """One API key with its own transport client and load counters"""
+
+    def __init__(self, index: int, api_key: str):
+        self.index = index
+        self.api_key = api_key
+        # Per-key transport client: genai.configure() is process-global and not safe to switch per request
+        overrides = gemini_transport_overrides()
+        self.client = glm.GenerativeServiceClient(
+            client_options={"api_key": api_key, **overrides.get("client_options", {})},
+            transport=overrides.get("transport")
+        )
+        self.in_flight = 0
+        self.total_requests = 0
+        self.errors = 0
+        self.quota_errors = 0
+
+    def generate_content(self, prompt: str, model_name: str) -> genai.types.GenerateContentResponse:
+        """Send one prompt through this key's client (the public GenerativeServiceClient API)"""
+        if '/' not in model_name:
+            model_name = f"models/{model_name}"
+        response = self.client.generate_content(
+            model=model_name,
+            contents=[glm.Content(role="user", parts=[glm.Part(text=prompt)])]
+        )
+        return genai.types.GenerateContentResponse.from_response(response)
+
+    @property
+    def label(self) -> str:
+        return f"#{self.index + 1}"
+
+
+class GeminiClientPool:
+    """Least-loaded dispatch across all configured Gemini API keys"""
+
+    def __init__(self, api_keys: List[str], model_name: str, quota_cooldown_seconds: float = None):
+        """
+        Args:
+            api_keys: API keys to spread requests over
+            model_name: Default Gemini model
+            quota_cooldown_seconds: How long a key that returned 429 is skipped
+                (GEMINI_QUOTA_COOLDOWN_SECONDS, default 60)
+        """
+        if not api_keys:
+            raise ValueError("No Gemini API keys found. Set GEMINI_API_KEY environment variable.")
+        self.model_name = model_name
+        self.quota_cooldown_seconds = quota_cooldown_seconds or float(os.getenv('GEMINI_QUOTA_COOLDOWN_SECONDS', 60))
+        self.slots = [GeminiKeySlot(i, key) for i, key in enumerate(api_keys)]
+        self.health = get_provider_health()
+        self._lock = threading.Lock()
+
+    def _acquire(self, exclude: Set[str]) -> GeminiKeySlot:
+        with self._lock:
+            by_load = sorted(self.slots, key=lambda s: (s.in_flight, s.total_requests))
+            # The health registry returns the least-loaded key whose breaker admits a request
+            label = self.health.acquire(PROVIDER, [slot.label for slot in by_load], exclude)
+            slot = next(s for s in self.slots if s.label == label)
+            slot.in_flight += 1
+            slot.total_requests += 1
+            return slot
+
+    def _release(self, slot: GeminiKeySlot, error: Exception = None):
+        with self._lock:
+            slot.in_flight -= 1
+            if error is not None:
+                slot.errors += 1
+
+        if error is None:
+            self.health.record_success(PROVIDER, slot.label)
+        elif is_quota_error(error):
+            slot.quota_errors += 1
+            self.health.record_failure(PROVIDER, slot.label, retry_after=self.quota_cooldown_seconds, rate_limited=True)
+        elif is_request_error(error):
+            self.health.release(PROVIDER, slot.label)
+        else:
+            self.health.record_failure(PROVIDER, slot.label)
+
+    @contextmanager
+    def lease(self, exclude: Set[str] = None):
+        """
+        Borrow the least-loaded healthy key slot for one call
+
+        Raises:
+            ProviderUnavailableError: If every key is cooling down
+        """
+        slot = self._acquire(exclude or set())
+        error = None
+        try:
+            yield slot
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._release(slot, error)
+
+    def generate(self, prompt: str, model_name: str = None) -> str:
+        """
+        Generate content on the least-loaded key, failing over to other keys on quota errors
+
+        Returns:
+            Response text
+
+        Raises:
+            QuotaExhaustedError: If every key is over quota or cooling down
+            Exception: Non-quota API errors are raised immediately
+        """
+        tried: Set[str] = set()
+        while len(tried) < len(self.slots):
+            try:
+                with self.lease(tried) as slot:
+                    tried.add(slot.label)
+                    print(f"🔑 Gemini request on API key {slot.label} ({slot.in_flight} in flight)")
+                    with track_dependency('gemini', 'generate_content'):
+                        response = slot.generate_content(prompt, model_name or self.model_name)
+                        return response.text
+            except ProviderUnavailableError as e:
+                print(f"⏭️ Gemini keys cooling down, failing fast ({e})")
+                raise QuotaExhaustedError(e.retry_in)
+            except Exception as e:
+                if not is_quota_error(e):
+                    raise
+                print(f"⚠️ API key {slot.label} quota exceeded")
+
+        print(f"❌ All {len(self.slots)} API keys exhausted")
+        raise QuotaExhaustedError()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        breakers = {b['key']: b for b in self.health.stats()['breakers'] if b['provider'] == PROVIDER}
+        with self._lock:
+            return [
+                {
+                    "key": slot.label,
+                    "inFlight": slot.in_flight,
+                    "requests": slot.total_requests,
+                    "errors": slot.errors,
+                    "quotaErrors": slot.quota_errors,
+                    "state": breakers.get(slot.label, {}).get('state', 'closed'),
+                    "coolingDownSeconds": breakers.get(slot.label, {}).get('retryInSeconds', 0.0)
+                }
+                for slot in self.slots
+            ]
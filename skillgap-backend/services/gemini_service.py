@@ -4,13 +4,39 @@ This service handles all AI-powered resume analysis using Google's Gemini API
 """
 
 import os
-import google.generativeai as genai
 from typing import Dict, Any, List
+import re
 import json
-import PyPDF2
-import requests
-from io import BytesIO
-import time
+from services.llm_cache_service import get_llm_cache
+from services.gemini_client_pool import GeminiClientPool
+from services.provider_health import ProviderUnavailableError
+from services.resume_text_extractor import get_resume_text_extractor
+from services.prompt_budget import get_prompt_budget
+from services.skill_taxonomy import get_skill_taxonomy
+from services.keyword_scanner import KeywordScanner
+
+# Bump when the analyze_resume prompt changes so stale cached analyses are not reused
+RESUME_PROMPT_VERSION = "v2"
+
+# Skills reported by the keyword fallback, each covering these taxonomy skills
+FALLBACK_SKILL_GROUPS = {
+    'Python': ['Python', 'Django', 'Flask', 'FastAPI'],
+    'JavaScript': ['JavaScript', 'TypeScript', 'React', 'Angular', 'Vue', 'Node.js'],
+    'Java': ['Java', 'Spring', 'Hibernate'],
+    'C++': ['C++'],
+    'SQL': ['SQL', 'MySQL', 'PostgreSQL', 'Databases'],
+    'Machine Learning': ['Machine Learning', 'Artificial Intelligence', 'Neural Networks', 'Deep Learning'],
+    'Data Science': ['Data Science', 'Data Analysis', 'Pandas', 'NumPy'],
+    'Cloud': ['Cloud Computing', 'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes'],
+    'Web Development': ['HTML', 'CSS', 'Web Development', 'Frontend Development', 'Backend Development'],
+    'Git': ['Git'],
+}
+
+# Seniority cues for the keyword fallback (whole words: 'intern' is not 'internal')
+EXPERIENCE_LEVEL_SCANNER = KeywordScanner({
+    'senior': 'Senior', 'lead': 'Senior',
+    'junior': 'Junior', 'intern': 'Junior', 'internship': 'Junior', 'fresher': 'Junior'
+})
 
 class GeminiService:
     """Service class for Gemini API integration with automatic key rotation"""
@@ -27,10 +53,14 @@ class GeminiService:
         if api_key:
             self.api_keys.append(api_key)
         else:
-            # Load all API keys from environment
-            for key_name in ['GEMINI_API_KEY', 'GEMINI_API_KEY_1', 'GEMINI_API_KEY_2']:
+            # Load all API keys from environment: GEMINI_API_KEY, GEMINI_API_KEY_1, GEMINI_API_KEY_2, ...
+            numbered = sorted(
+                (name for name in os.environ if re.fullmatch(r'GEMINI_API_KEY_\d+', name)),
+                key=lambda name: int(name.rsplit('_', 1)[1])
+            )
+            for key_name in ['GEMINI_API_KEY'] + numbered:
                 key = os.getenv(key_name)
-                if key:
+                if key and key not in self.api_keys:
                     self.api_keys.append(key)
         
         if not self.api_keys:
@@ -38,65 +68,25 @@ class GeminiService:
         
         print(f"✅ Loaded {len(self.api_keys)} Gemini API key(s)")
         
-        self.current_key_index = 0
-        self.api_key = self.api_keys[self.current_key_index]
-        
-        genai.configure(api_key=self.api_key)
         # Use gemini-2.5-flash (latest stable Flash model)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
+        self.model_name = 'gemini-2.5-flash'
+        # One isolated client per key; requests go to the least-loaded key
+        self.pool = GeminiClientPool(self.api_keys, self.model_name)
+        self.cache = get_llm_cache()
+        self.budget = get_prompt_budget()
         print(f"✅ Using Gemini 2.5 Flash model for resume analysis")
     
-    def _rotate_api_key(self):
-        """Rotate to the next API key"""
-        self.current_key_index = (self.current_key_index + 1) % len(self.api_keys)
-        self.api_key = self.api_keys[self.current_key_index]
-        print(f"🔄 Rotating to API key #{self.current_key_index + 1}")
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
-    
-    def _call_with_retry(self, prompt: str, max_retries: int = None) -> str:
+    def _call_with_retry(self, prompt: str) -> str:
         """
-        Call Gemini API with automatic retry and key rotation on quota errors
+        Call Gemini API on the least-loaded key, failing over to other keys on quota errors
         
         Args:
             prompt: The prompt to send to Gemini
-            max_retries: Maximum number of retries (defaults to number of API keys)
         
         Returns:
             Response text from Gemini
         """
-        if max_retries is None:
-            max_retries = len(self.api_keys)
-        
-        last_error = None
-        
-        for attempt in range(max_retries):
-            try:
-                print(f"🔑 Attempt {attempt + 1}/{max_retries} with API key #{self.current_key_index + 1}")
-                response = self.model.generate_content(prompt)
-                return response.text
-            except Exception as e:
-                error_msg = str(e)
-                last_error = e
-                
-                # Check if it's a quota error (429)
-                if "429" in error_msg or "quota" in error_msg.lower() or "RESOURCE_EXHAUSTED" in error_msg:
-                    print(f"⚠️ API key #{self.current_key_index + 1} quota exceeded")
-                    
-                    if attempt < max_retries - 1:
-                        # Try next API key
-                        self._rotate_api_key()
-                        time.sleep(1)  # Brief pause before retry
-                        continue
-                    else:
-                        print(f"❌ All {len(self.api_keys)} API keys exhausted")
-                        raise Exception(f"All API keys have exceeded their quota. Please try again later or upgrade your plan.")
-                else:
-                    # Non-quota error, don't retry
-                    raise e
-        
-        # If we get here, all retries failed
-        raise last_error
+        return self.pool.generate(prompt)
     
     def extract_text_from_pdf_url(self, pdf_url: str) -> str:
         """
@@ -109,20 +99,7 @@ class GeminiService:
             Extracted text content
         """
         try:
-            # Download PDF from URL
-            response = requests.get(pdf_url)
-            response.raise_for_status()
-            
-            # Read PDF content
-            pdf_file = BytesIO(response.content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            # Extract text from all pages
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            
-            return text.strip()
+            return get_resume_text_extractor().extract_url(pdf_url)['text']
         
         except Exception as e:
             raise Exception(f"Failed to extract text from PDF: {str(e)}")
@@ -140,33 +117,19 @@ class GeminiService:
         """
         print("🔄 Using fallback keyword-based analysis (Gemini API unavailable)")
         
-        # Common skill keywords to extract
-        skill_keywords = {
-            'Python': ['python', 'django', 'flask', 'fastapi'],
-            'JavaScript': ['javascript', 'js', 'react', 'angular', 'vue', 'node'],
-            'Java': ['java', 'spring', 'hibernate'],
-            'C++': ['c++', 'cpp'],
-            'SQL': ['sql', 'mysql', 'postgresql', 'database'],
-            'Machine Learning': ['machine learning', 'ml', 'ai', 'neural network'],
-            'Data Science': ['data science', 'data analysis', 'pandas', 'numpy'],
-            'Cloud': ['aws', 'azure', 'gcp', 'cloud', 'docker', 'kubernetes'],
-            'Web Development': ['html', 'css', 'web development', 'frontend', 'backend'],
-            'Git': ['git', 'github', 'version control'],
-        }
-        
-        text_lower = resume_text.lower()
+        taxonomy = get_skill_taxonomy()
+        resume_mask = taxonomy.text_mask(resume_text)
         extracted_skills = []
         
-        # Extract skills from resume text
-        for skill, keywords in skill_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    extracted_skills.append({
-                        "skill": skill,
-                        "proficiency": "Intermediate",
-                        "yearsOfExperience": 2
-                    })
-                    break
+        # Extract skill groups with any member skill (or a related tool, e.g. GitHub for Git) mentioned in the resume
+        for skill, members in FALLBACK_SKILL_GROUPS.items():
+            group_mask = taxonomy.mask_of(members)
+            if resume_mask & (group_mask | taxonomy.related_mask(group_mask)):
+                extracted_skills.append({
+                    "skill": skill,
+                    "proficiency": "Intermediate",
+                    "yearsOfExperience": 2
+                })
         
         # If no skills found, provide defaults
         if not extracted_skills:
@@ -175,10 +138,11 @@ class GeminiService:
             ]
         
         # Determine experience level based on text length and content
-        if 'senior' in text_lower or 'lead' in text_lower:
+        levels = EXPERIENCE_LEVEL_SCANNER.find(resume_text)
+        if 'Senior' in levels:
             exp_level = "Senior"
             years = 7
-        elif 'junior' in text_lower or 'intern' in text_lower or 'fresher' in text_lower:
+        elif 'Junior' in levels:
             exp_level = "Junior"
             years = 1
         else:
@@ -232,13 +196,30 @@ class GeminiService:
         Returns:
             Dictionary containing extracted skills, experience, recommendations, etc.
         """
+        # Bound the prompt: normalized resume text, highest-value sections first, cut to the token budget
+        fitted = self.budget.fit_resume(resume_text)
+        if fitted.truncated:
+            print(f"✂️ Resume text trimmed to prompt budget ({fitted.original_tokens} -> {fitted.used_tokens} tokens)")
+        
+        # Repeat analyses of the same resume are served from the local cache
+        cache_key = self.cache.make_key(self.model_name, RESUME_PROMPT_VERSION, fitted.text, target_domain)
+        cached_analysis = self.cache.get(cache_key)
+        if cached_analysis is not None:
+            print(f"⚡ Resume analysis cache hit ({cache_key[:12]})")
+            return {
+                "success": True,
+                "data": cached_analysis,
+                "cached": True,
+                "promptBudget": fitted.usage()
+            }
+        
         prompt = f"""
         You are an expert career counselor and technical recruiter. Analyze the following resume carefully and provide a comprehensive analysis.
         
         Target Domain: {target_domain}
         
         Resume Content:
-        {resume_text}
+        {fitted.text}
         
         Please provide a detailed analysis in the following JSON format:
         {{
@@ -304,9 +285,13 @@ class GeminiService:
             # Parse JSON response
             analysis = json.loads(result_text)
             
+            # Only genuine Gemini analyses are cached; fallbacks should be retried next time
+            self.cache.set(cache_key, analysis)
+            
             return {
                 "success": True,
-                "data": analysis
+                "data": analysis,
+                "promptBudget": fitted.usage()
             }
         
         except json.JSONDecodeError as e:
@@ -319,6 +304,16 @@ class GeminiService:
                 "warning": "Using basic analysis due to API response format issues"
             }
         
+        except ProviderUnavailableError as e:
+            # Every key is cooling down - answer from the local fallback without calling Gemini
+            print(f"⚠️ Gemini unavailable ({e}), using fallback analysis")
+            fallback = self._generate_fallback_analysis(resume_text, target_domain)
+            return {
+                "success": True,
+                "data": fallback,
+                "warning": "Using basic analysis - Gemini API is temporarily rate limited. Please re-analyze later for detailed analysis."
+            }
+        
         except Exception as e:
             error_msg = str(e)
             # Check if it's an API key or quota error
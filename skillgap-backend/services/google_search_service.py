@@ -7,6 +7,13 @@ import os
 import requests
 from typing import Dict, Any, List
 from urllib.parse import quote_plus
+from services.http_client import get_http_client
+from services.search_cache_service import get_search_cache
+from services.metrics_service import track_dependency
+from services.skill_taxonomy import get_skill_taxonomy
+
+# Job boards included in every search, keyed by site filter
+JOB_BOARDS = ["linkedin.com", "indeed.com", "naukri.com", "glassdoor.com"]
 
 class GoogleJobSearchService:
     """Service for fetching job listings using Google Programmable Search Engine API"""
@@ -28,7 +35,7 @@ class GoogleJobSearchService:
         if not self.search_engine_id:
             raise ValueError("Search Engine ID not found. Set GOOGLE_SEARCH_ENGINE_ID environment variable.")
         
-        self.base_url = "https://www.googleapis.com/customsearch/v1"
+        self.base_url = os.getenv('GOOGLE_SEARCH_BASE_URL', "https://www.googleapis.com/customsearch/v1")
     
     def search_jobs(
         self,
@@ -36,7 +43,8 @@ class GoogleJobSearchService:
         skills: List[str] = None,
         location: str = "Remote",
         experience_level: str = "Entry Level",
-        num_results: int = 10
+        num_results: int = 10,
+        boards: List[str] = None
     ) -> Dict[str, Any]:
         """
         Search for jobs using Google Programmable Search Engine
@@ -47,6 +55,7 @@ class GoogleJobSearchService:
             location: Job location preference
             experience_level: Experience level (Fresher, Junior, Mid-Level, Senior)
             num_results: Number of results to return (max 10 per request)
+            boards: Job board domains to restrict the search to (default: JOB_BOARDS)
         
         Returns:
             Dictionary containing job search results
@@ -72,7 +81,7 @@ class GoogleJobSearchService:
             query_parts.append(exp_term)
             
             # Add job sites to search
-            site_filter = "site:linkedin.com OR site:indeed.com OR site:naukri.com OR site:glassdoor.com"
+            site_filter = " OR ".join(f"site:{board}" for board in (boards or JOB_BOARDS))
             
             # Construct final query
             query = f"{' '.join(query_parts)} jobs {location} {site_filter}"
@@ -88,7 +97,8 @@ class GoogleJobSearchService:
             }
             
             print(f"📡 Calling Google Search API...")
-            response = requests.get(self.base_url, params=params)
+            with track_dependency('google_search', 'search_jobs'):
+                response = get_http_client().get(self.base_url, params=params)
             print(f"📊 API Response Status: {response.status_code}")
             
             response.raise_for_status()
@@ -140,6 +150,66 @@ class GoogleJobSearchService:
                 "error": error_msg
             }
     
+    def search_jobs_many(self, searches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run several job searches concurrently
+        
+        Args:
+            searches: List of search_jobs keyword-argument dicts
+        
+        Returns:
+            search_jobs results in the same order as searches
+        """
+        results = get_http_client().map_concurrent(lambda kwargs: self.search_jobs(**kwargs), searches)
+        return [
+            r if isinstance(r, dict) else {"success": False, "error": f"Unexpected error: {str(r)}"}
+            for r in results
+        ]
+    
+    def search_jobs_per_board(
+        self,
+        job_title: str,
+        skills: List[str] = None,
+        location: str = "Remote",
+        experience_level: str = "Entry Level",
+        num_results: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Query every job board separately (concurrently) and merge the results
+        
+        Returns up to num_results jobs per board instead of num_results overall,
+        at the cost of one API call per board.
+        """
+        results = self.search_jobs_many([
+            {
+                "job_title": job_title,
+                "skills": skills,
+                "location": location,
+                "experience_level": experience_level,
+                "num_results": num_results,
+                "boards": [board]
+            }
+            for board in JOB_BOARDS
+        ])
+        
+        successful = [r for r in results if r.get('success')]
+        if not successful:
+            return results[0] if results else {"success": False, "error": "No job boards configured"}
+        
+        jobs, seen_links = [], set()
+        for result in successful:
+            for job in result.get('jobs', []):
+                if job['link'] not in seen_links:
+                    seen_links.add(job['link'])
+                    jobs.append(job)
+        
+        return {
+            "success": True,
+            "query": " | ".join(r['query'] for r in successful),
+            "totalResults": sum(int(r.get('totalResults') or 0) for r in successful),
+            "jobs": jobs
+        }
+    
     def _extract_source(self, display_link: str) -> str:
         """Extract job source from display link"""
         if 'linkedin' in display_link.lower():
@@ -172,14 +242,12 @@ class GoogleJobSearchService:
         """
         job_lower = job_description.lower()
         
-        # Check skill matches
-        skill_matches = 0
-        for skill in user_skills:
-            if skill.lower() in job_lower:
-                skill_matches += 1
+        # Check skill matches: the user's skills that the posting mentions (taxonomy skills by ID, others by name)
+        matcher = get_skill_taxonomy().matcher(user_skills)
+        skill_matches = matcher.matches(job_description)
         
         # Calculate skill match percentage
-        skill_score = (skill_matches / len(user_skills)) * 70 if user_skills else 0
+        skill_score = (skill_matches / len(matcher)) * 70 if len(matcher) else 0
         
         # Check domain match
         domain_score = 30 if user_domain.lower() in job_lower else 0
@@ -209,40 +277,56 @@ class GoogleJobSearchService:
             experience_level = user_profile.get('experienceLevel', 'Fresher')
             location = user_profile.get('location', 'Remote')
             
-            # Perform search
-            search_result = self.search_jobs(
-                job_title=job_title,
-                skills=skills,
-                location=location,
-                experience_level=experience_level,
-                num_results=10
+            # Perform search (one concurrent query per job board when JOB_SEARCH_PER_BOARD is set)
+            per_board = os.getenv('JOB_SEARCH_PER_BOARD', 'false').lower() == 'true'
+            search = self.search_jobs_per_board if per_board else self.search_jobs
+            # Only the top 3 skills shape the query, so users listing the same ones in the same order share a cached result
+            search_result, cache_status = get_search_cache().get_or_fetch(
+                'jobs',
+                (job_title, (skills or [])[:3], location, experience_level, per_board),
+                lambda: search(
+                    job_title=job_title,
+                    skills=skills,
+                    location=location,
+                    experience_level=experience_level,
+                    num_results=10
+                ),
+                should_cache=lambda result: result.get('success', False)
             )
+            print(f"🗄️ Job search cache: {cache_status}")
             
             if not search_result.get('success'):
                 return search_result
             
-            # Calculate match scores for each job
-            matched_jobs = []
-            for job in search_result.get('jobs', []):
-                job_text = f"{job['title']} {job['snippet']}"
-                match_score = self.calculate_job_match_score(
-                    job_text,
-                    skills,
-                    job_title
-                )
-                
-                matched_jobs.append({
-                    **job,
-                    'matchScore': match_score
-                })
-            
-            # Sort by match score
-            matched_jobs.sort(key=lambda x: x['matchScore'], reverse=True)
+            jobs = search_result.get('jobs', [])
+            ranker = None
+            if os.getenv('JOB_RANKING', 'embedding').lower() == 'embedding':
+                # Imported here so keyword ranking does not need NumPy
+                from services.job_ranking_service import get_job_ranker
+                ranker = get_job_ranker()
+            if ranker is not None and ranker.ready():
+                matched_jobs = ranker.rank(jobs, user_profile)
+            else:
+                # Keyword ranking (also while the embedding model loads or when it is not installed):
+                # skill and domain mentions in the title and snippet
+                matched_jobs = [
+                    {
+                        **job,
+                        'matchScore': self.calculate_job_match_score(
+                            f"{job['title']} {job['snippet']}",
+                            skills,
+                            job_title
+                        )
+                    }
+                    for job in jobs
+                ]
+                matched_jobs.sort(key=lambda x: x['matchScore'], reverse=True)
             
             return {
                 "success": True,
                 "totalJobs": len(matched_jobs),
-                "matchedJobs": matched_jobs
+                "matchedJobs": matched_jobs,
+                "cache": cache_status
             }
         
         except Exception as e:
@@ -0,0 +1,178 @@
+"""
+Shared Outbound HTTP Client
+
+One pooled requests.Session for every outbound call (Google Search, YouTube,
+resume downloads). Connections are kept alive and capped per host, every
+request has a timeout, transient failures are retried with jittered
+exponential backoff, and fan-out queries run concurrently on a bounded
+thread pool.
+"""
+
+import os
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Callable, Optional
+import requests
+from requests.adapters import HTTPAdapter
+
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class HttpClient:
+    """Pooled HTTP client with timeouts, jittered retries and concurrent fan-out"""
+
+    def __init__(
+        self,
+        timeout: float = None,
+        connect_timeout: float = None,
+        max_retries: int = None,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        pool_maxsize: int = None,
+        fanout_workers: int = None
+    ):
+        """
+        Args:
+            timeout: Read timeout in seconds (HTTP_TIMEOUT_SECONDS, default 10)
+            connect_timeout: Connect timeout in seconds (HTTP_CONNECT_TIMEOUT_SECONDS, default 3.05)
+            max_retries: Retries after the first attempt (HTTP_MAX_RETRIES, default 2)
+            backoff_base: First backoff ceiling in seconds, doubled per retry
+            backoff_max: Upper bound for a single backoff
+            pool_maxsize: Max open connections per host (HTTP_POOL_MAXSIZE, default 10)
+            fanout_workers: Threads used by get_many (HTTP_FANOUT_WORKERS, default 8)
+        """
+        self.timeout = timeout or float(os.getenv('HTTP_TIMEOUT_SECONDS', 10))
+        self.connect_timeout = connect_timeout or float(os.getenv('HTTP_CONNECT_TIMEOUT_SECONDS', 3.05))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv('HTTP_MAX_RETRIES', 2))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.pool_maxsize = pool_maxsize or int(os.getenv('HTTP_POOL_MAXSIZE', 10))
+        self.fanout_workers = fanout_workers or int(os.getenv('HTTP_FANOUT_WORKERS', 8))
+
+        self.session = requests.Session()
+        # pool_block makes pool_maxsize a hard per-host limit instead of a keep-alive hint
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=self.pool_maxsize, pool_block=True, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {"requests": 0, "retries": 0, "failures": 0}
+
+    def _count(self, name: str):
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Full-jitter exponential backoff, honouring a numeric Retry-After header"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def request(self, method: str, url: str, timeout=None, retries: int = None, **kwargs) -> requests.Response:
+        """
+        Send a request through the shared session
+
+        Connection errors, timeouts and 429/5xx responses are retried. The last
+        response is returned once retries are exhausted, so callers keep using
+        raise_for_status()/status_code as before.
+
+        Raises:
+            requests.exceptions.RequestException: If every attempt failed without a response
+        """
+        retries = self.max_retries if retries is None else retries
+        timeout = timeout or (self.connect_timeout, self.timeout)
+
+        for attempt in range(retries + 1):
+            self._count("requests")
+            try:
+                response = self.session.request(method, url, timeout=timeout, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= retries:
+                    self._count("failures")
+                    raise
+                self._count("retries")
+                time.sleep(self._backoff(attempt))
+                continue
+
+            if response.status_code in RETRY_STATUSES and attempt < retries:
+                self._count("retries")
+                delay = self._backoff(attempt, response)
+                response.close()
+                time.sleep(delay)
+                continue
+
+            if response.status_code >= 400:
+                self._count("failures")
+            return response
+
+    def get(self, url: str, params: Dict[str, Any] = None, **kwargs) -> requests.Response:
+        """GET with pooling, timeout and retries (same signature as requests.get)"""
+        return self.request('GET', url, params=params, **kwargs)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.fanout_workers, thread_name_prefix="http-fanout")
+            return self._executor
+
+    def map_concurrent(self, fn: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+        """
+        Run fn over items concurrently on the fan-out pool
+
+        Returns:
+            Results in input order; an item whose call raised yields the exception instead
+        """
+        if len(items) <= 1:
+            results = []
+            for item in items:
+                try:
+                    results.append(fn(item))
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        futures = [self._get_executor().submit(fn, item) for item in items]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def get_many(self, calls: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Issue several GETs concurrently
+
+        Args:
+            calls: List of {"url": ..., "params": ..., ...} keyword dicts for get()
+
+        Returns:
+            Responses (or exceptions) in the same order as calls
+        """
+        return self.map_concurrent(lambda call: self.get(**call), calls)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {**self._stats, "poolMaxsizePerHost": self.pool_maxsize, "fanoutWorkers": self.fanout_workers}
+
+
+# Singleton instance
+_http_client = None
+_http_client_lock = threading.Lock()
+
+def get_http_client() -> HttpClient:
+    """Get or create the shared HTTP client"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = HttpClient()
+    return _http_client
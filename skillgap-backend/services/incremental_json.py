@@ -0,0 +1,88 @@
+"""
+Incremental JSON Field Parser
+
+Parses a JSON object while it is still being streamed from an LLM and
+reports each top-level field as soon as its value is complete, so callers
+can forward e.g. the question text or the score before the rest of the
+object has been generated. Markdown code fences and any prose before the
+opening brace are skipped.
+"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+
+class IncrementalJSONParser:
+    """Feed text chunks, get back the top-level (key, value) pairs completed by each chunk"""
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member_start = None
+        self.fields: Dict[str, Any] = {}
+        self.done = False
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Consume the next chunk of model output
+
+        Returns:
+            Top-level fields whose values became complete in this chunk, in order
+        """
+        if self.done or not chunk:
+            return []
+
+        self._buffer += chunk
+        completed = []
+
+        while self._pos < len(self._buffer) and not self.done:
+            char = self._buffer[self._pos]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif self._depth == 0:
+                # Outside the object: skip fences / prose until the opening brace
+                if char == '{':
+                    self._depth = 1
+                    self._member_start = self._pos + 1
+            elif char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    completed.extend(self._close_member(self._pos))
+                    self.done = True
+            elif char == ',' and self._depth == 1:
+                completed.extend(self._close_member(self._pos))
+                self._member_start = self._pos + 1
+
+            self._pos += 1
+
+        return completed
+
+    def _close_member(self, end: int) -> List[Tuple[str, Any]]:
+        member = self._buffer[self._member_start:end].strip()
+        if not member:
+            return []
+        try:
+            parsed = json.loads("{" + member + "}")
+        except ValueError:
+            # Malformed member: leave it for the final full parse to reject
+            return []
+        self.fields.update(parsed)
+        return list(parsed.items())
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far"""
+        return self._buffer
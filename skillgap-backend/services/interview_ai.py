@@ -3,19 +3,29 @@ AI Engine using Google Gemini - Question Generation & Feedback for Interview Bot
 """
 
 import os
+import time
 import google.generativeai as genai
 from dotenv import load_dotenv
 import json
 
 load_dotenv()
 
+from services.provider_health import get_provider_health
+from services.gemini_client_pool import is_quota_error, gemini_transport_overrides
+from services.incremental_json import IncrementalJSONParser
+from services.metrics_service import track_dependency, observe_dependency
+
+PROVIDER = 'gemini-interview'
+PROVIDER_KEY = '#1'
+
 class InterviewAI:
     def __init__(self):
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             raise ValueError("GEMINI_API_KEY required in .env file")
         
-        genai.configure(api_key=api_key)
+        genai.configure(api_key=api_key, **gemini_transport_overrides())
+        self.health = get_provider_health()
         # Use gemini-1.5-flash (stable and widely available)
         try:
             self.model = genai.GenerativeModel('gemini-1.5-flash')
@@ -25,9 +35,124 @@ class InterviewAI:
             self.model = genai.GenerativeModel('gemini-pro')
             print("✅ Using Gemini Pro model")
     
+    def _generate(self, prompt):
+        """
+        Call Gemini through the provider circuit breaker
+        
+        Raises ProviderUnavailableError immediately while Gemini is cooling down,
+        so callers go straight to their fallback responses.
+        """
+        self.health.acquire(PROVIDER, [PROVIDER_KEY])
+        try:
+            with track_dependency('gemini', 'generate_content'):
+                response = self.model.generate_content(prompt)
+                text = response.text
+        except Exception as e:
+            self.health.record_failure(PROVIDER, PROVIDER_KEY, rate_limited=is_quota_error(e))
+            raise
+        self.health.record_success(PROVIDER, PROVIDER_KEY)
+        return text
+    
+    def _generate_stream(self, prompt):
+        """
+        Stream a Gemini response chunk by chunk through the provider circuit breaker
+        
+        Yields:
+            Text chunks as the model produces them
+        """
+        self.health.acquire(PROVIDER, [PROVIDER_KEY])
+        start = time.perf_counter()
+        outcome = 'ok'
+        try:
+            for chunk in self.model.generate_content(prompt, stream=True):
+                try:
+                    text = chunk.text
+                except ValueError:
+                    # Chunk without text parts (e.g. only safety ratings)
+                    continue
+                if text:
+                    yield text
+        except GeneratorExit:
+            # Client went away mid-stream: no verdict on the provider
+            self.health.release(PROVIDER, PROVIDER_KEY)
+            outcome = 'cancelled'
+            raise
+        except Exception as e:
+            self.health.record_failure(PROVIDER, PROVIDER_KEY, rate_limited=is_quota_error(e))
+            outcome = 'error'
+            raise
+        finally:
+            # Whole stream, first chunk to last, as seen by the client
+            observe_dependency('gemini', 'generate_content_stream', time.perf_counter() - start, outcome)
+        self.health.record_success(PROVIDER, PROVIDER_KEY)
+    
+    def _stream_json(self, prompt):
+        """
+        Stream a JSON response, reporting raw tokens and each top-level field once complete
+        
+        Yields:
+            ("token", {"text": ...}) and ("field", {"key": ..., "value": ...}) events
+        
+        Returns:
+            The fully parsed JSON object
+        """
+        parser = IncrementalJSONParser()
+        for text in self._generate_stream(prompt):
+            yield "token", {"text": text}
+            for key, value in parser.feed(text):
+                yield "field", {"key": key, "value": value}
+        return json.loads(self._extract_json(parser.text))
+    
+    @staticmethod
+    def _extract_json(text):
+        """Strip markdown code fences around a JSON response"""
+        text = text.strip()
+        if '```json' in text:
+            text = text.split('```json')[1].split('```')[0].strip()
+        elif '```' in text:
+            text = text.split('```')[1].split('```')[0].strip()
+        return text
+    
     def generate_next_question(self, context):
         """Generate next interview question using Gemini"""
+        try:
+            question_data = json.loads(self._extract_json(self._generate(self._question_prompt(context))))
+            return self._normalize_question(question_data)
+        except Exception as e:
+            print(f"Error generating question: {e}")
+            return self._fallback_question(context)
+    
+    def stream_next_question(self, context):
+        """
+        Streaming variant of generate_next_question
         
+        Yields:
+            ("token", ...) and ("field", ...) events while Gemini generates,
+            then ("done", question_data). On an error the question is built from
+            the fields already streamed once "question" has been sent (the
+            candidate is already reading it), otherwise it is the fallback question
+        """
+        streamed = {}
+        try:
+            stream = self._stream_json(self._question_prompt(context))
+            while True:
+                try:
+                    event, payload = next(stream)
+                except StopIteration as stop:
+                    question_data = stop.value
+                    break
+                if event == "field":
+                    streamed[payload["key"]] = payload["value"]
+                yield event, payload
+            yield "done", self._normalize_question(question_data)
+        except Exception as e:
+            print(f"Error streaming question: {e}")
+            if "question" in streamed:
+                yield "done", self._normalize_question(streamed)
+            else:
+                yield "done", self._fallback_question(context)
+    
+    def _question_prompt(self, context):
         job_title = context.get('job_title', 'Position')
         company = context.get('company', 'Company')
         question_count = context.get('question_count', 0)
@@ -62,42 +187,58 @@ Generate the next interview question. Return ONLY a JSON object with this exact
 }}
 
 Return ONLY the JSON object, no other text."""
-
-        try:
-            response = self.model.generate_content(prompt)
-            text = response.text.strip()
-            
-            # Extract JSON from response
-            if '```json' in text:
-                text = text.split('```json')[1].split('```')[0].strip()
-            elif '```' in text:
-                text = text.split('```')[1].split('```')[0].strip()
-            
-            question_data = json.loads(text)
-            
-            return {
-                "question": question_data.get("question", "Tell me about your experience."),
-                "category": question_data.get("category", "General"),
-                "difficulty": question_data.get("difficulty", "Medium"),
-                "reasoning": question_data.get("reasoning", "")
-            }
-            
-        except Exception as e:
-            print(f"Error generating question: {e}")
-            # Fallback questions based on question number
-            fallback_questions = [
-                {"question": "Tell me about yourself and your relevant experience.", "category": "Introduction", "difficulty": "Easy"},
-                {"question": f"Why do you want to work at {company}?", "category": "Motivation", "difficulty": "Easy"},
-                {"question": f"What skills do you have that make you suitable for the {job_title} role?", "category": "Technical", "difficulty": "Medium"},
-                {"question": "Describe a challenging situation you faced and how you handled it.", "category": "Behavioral", "difficulty": "Medium"},
-                {"question": "Where do you see yourself in 5 years?", "category": "Career Goals", "difficulty": "Easy"}
-            ]
-            idx = min(question_count, len(fallback_questions) - 1)
-            return fallback_questions[idx]
+        return prompt
+    
+    @staticmethod
+    def _normalize_question(question_data):
+        return {
+            "question": question_data.get("question", "Tell me about your experience."),
+            "category": question_data.get("category", "General"),
+            "difficulty": question_data.get("difficulty", "Medium"),
+            "reasoning": question_data.get("reasoning", "")
+        }
+    
+    @staticmethod
+    def _fallback_question(context):
+        """Fallback questions based on question number"""
+        job_title = context.get('job_title', 'Position')
+        company = context.get('company', 'Company')
+        question_count = context.get('question_count', 0)
+        fallback_questions = [
+            {"question": "Tell me about yourself and your relevant experience.", "category": "Introduction", "difficulty": "Easy"},
+            {"question": f"Why do you want to work at {company}?", "category": "Motivation", "difficulty": "Easy"},
+            {"question": f"What skills do you have that make you suitable for the {job_title} role?", "category": "Technical", "difficulty": "Medium"},
+            {"question": "Describe a challenging situation you faced and how you handled it.", "category": "Behavioral", "difficulty": "Medium"},
+            {"question": "Where do you see yourself in 5 years?", "category": "Career Goals", "difficulty": "Easy"}
+        ]
+        idx = min(question_count, len(fallback_questions) - 1)
+        return fallback_questions[idx]
     
     def evaluate_answer(self, question, answer, context):
         """Evaluate candidate's answer using Gemini"""
+        try:
+            evaluation = json.loads(self._extract_json(self._generate(self._evaluation_prompt(question, answer, context))))
+            return self._normalize_evaluation(evaluation)
+        except Exception as e:
+            print(f"Error evaluating answer: {e}")
+            return self._fallback_evaluation()
+    
+    def stream_evaluation(self, question, answer, context):
+        """
+        Streaming variant of evaluate_answer
         
+        Yields:
+            ("token", ...) and ("field", ...) events while Gemini generates,
+            then ("done", evaluation) - the fallback evaluation on any error
+        """
+        try:
+            evaluation = yield from self._stream_json(self._evaluation_prompt(question, answer, context))
+            yield "done", self._normalize_evaluation(evaluation)
+        except Exception as e:
+            print(f"Error streaming evaluation: {e}")
+            yield "done", self._fallback_evaluation()
+    
+    def _evaluation_prompt(self, question, answer, context):
         job_title = context.get('job_title', 'Position')
         company = context.get('company', 'Company')
         
@@ -133,43 +274,33 @@ Score Guidelines:
 - 0-2: Poor answer, major misunderstandings
 
 Return ONLY the JSON object, no other text."""
-
-        try:
-            response = self.model.generate_content(prompt)
-            text = response.text.strip()
-            
-            # Extract JSON from response
-            if '```json' in text:
-                text = text.split('```json')[1].split('```')[0].strip()
-            elif '```' in text:
-                text = text.split('```')[1].split('```')[0].strip()
-            
-            evaluation = json.loads(text)
-            
-            return {
-                "score": float(evaluation.get("score", 5.0)),
-                "interviewer_assessment": evaluation.get("interviewer_assessment", "Answer received."),
-                "what_question_tested": evaluation.get("what_question_tested", ""),
-                "specific_mistakes": evaluation.get("specific_mistakes", []),
-                "why_this_fails": evaluation.get("why_this_fails", ""),
-                "mentor_guidance": evaluation.get("mentor_guidance", ""),
-                "how_to_improve": evaluation.get("how_to_improve", []),
-                "model_answer": evaluation.get("model_answer", ""),
-                "feedback": evaluation.get("feedback", "Thank you for your answer.")
-            }
-            
-        except Exception as e:
-            print(f"Error evaluating answer: {e}")
-            # Fallback evaluation
-            return {
-                "score": 6.0,
-                "interviewer_assessment": "Thank you for your answer. Consider providing more specific examples and details.",
-                "feedback": "Answer received. Please continue.",
-                "specific_mistakes": [],
-                "how_to_improve": ["Provide more specific examples", "Be more detailed in your response"],
-                "what_question_tested": "Communication and technical knowledge",
-                "model_answer": "A strong answer would include specific examples and demonstrate clear understanding."
-            }
+        return prompt
+    
+    @staticmethod
+    def _normalize_evaluation(evaluation):
+        return {
+            "score": float(evaluation.get("score", 5.0)),
+            "interviewer_assessment": evaluation.get("interviewer_assessment", "Answer received."),
+            "what_question_tested": evaluation.get("what_question_tested", ""),
+            "specific_mistakes": evaluation.get("specific_mistakes", []),
+            "why_this_fails": evaluation.get("why_this_fails", ""),
+            "mentor_guidance": evaluation.get("mentor_guidance", ""),
+            "how_to_improve": evaluation.get("how_to_improve", []),
+            "model_answer": evaluation.get("model_answer", ""),
+            "feedback": evaluation.get("feedback", "Thank you for your answer.")
+        }
+    
+    @staticmethod
+    def _fallback_evaluation():
+        return {
+            "score": 6.0,
+            "interviewer_assessment": "Thank you for your answer. Consider providing more specific examples and details.",
+            "feedback": "Answer received. Please continue.",
+            "specific_mistakes": [],
+            "how_to_improve": ["Provide more specific examples", "Be more detailed in your response"],
+            "what_question_tested": "Communication and technical knowledge",
+            "model_answer": "A strong answer would include specific examples and demonstrate clear understanding."
+        }
     
     def generate_final_report(self, session_data):
         """Generate comprehensive final interview report"""
@@ -208,16 +339,7 @@ Based on the interview performance, generate a final assessment. Return ONLY a J
 Return ONLY the JSON object, no other text."""
 
         try:
-            response = self.model.generate_content(prompt)
-            text = response.text.strip()
-            
-            # Extract JSON from response
-            if '```json' in text:
-                text = text.split('```json')[1].split('```')[0].strip()
-            elif '```' in text:
-                text = text.split('```')[1].split('```')[0].strip()
-            
-            report = json.loads(text)
+            report = json.loads(self._extract_json(self._generate(prompt)))
             return report
             
         except Exception as e:
@@ -0,0 +1,252 @@
+"""
+Embedding Job Ranking
+
+Ranks job search results against a user's analyzed profile. Each job's score
+blends three signals:
+    similarity  - cosine similarity of sentence embeddings of the job
+                  (title + snippet) and the profile (domain, roles, skills)
+    skills      - share of the user's skills the posting mentions (a
+                  skill taxonomy SkillMatcher)
+    experience  - how close the posting's seniority is to the user's
+
+Embeddings come from a local sentence-transformer (JOB_RANKING_MODEL, default
+all-MiniLM-L6-v2), encoded in one batch per search. Job vectors are cached by
+link, so a posting returned to many users is encoded once. The model is
+loaded on a background thread (warm_up_async() at startup); until it is
+ready, or when sentence-transformers is not installed, ready() is False and
+callers keep using keyword scoring.
+"""
+
+import os
+import heapq
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+from services.keyword_scanner import KeywordScanner
+from services.metrics_service import track_dependency
+from services.skill_taxonomy import get_skill_taxonomy
+
+
+DEFAULT_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+# Blend weights
+WEIGHTS = {'similarity': 0.5, 'skills': 0.35, 'experience': 0.15}
+
+# Seniority ladder: 0 entry, 1 mid, 2 senior
+SENIORITY_SCANNER = KeywordScanner({
+    'intern': 0, 'internship': 0, 'fresher': 0, 'graduate': 0, 'entry level': 0, 'entry': 0, 'junior': 0,
+    'trainee': 0, '0-2 years': 0, 'mid level': 1, 'mid': 1, 'intermediate': 1, '3+ years': 1, '2-5 years': 1,
+    'senior': 2, 'lead': 2, 'principal': 2, 'staff': 2, 'architect': 2, '5+ years': 2, '7+ years': 2
+})
+# Fit when the posting gives no seniority cue
+UNKNOWN_SENIORITY_FIT = 0.75
+
+
+def seniority_level(text: str) -> Optional[int]:
+    """Highest seniority cue in the text (0 entry, 1 mid, 2 senior), or None"""
+    levels = SENIORITY_SCANNER.find(text or '')
+    return max(levels) if levels else None
+
+
+def experience_fit(user_level: Optional[int], job_level: Optional[int]) -> float:
+    """1.0 for the same level, 0.5 one step apart, 0.0 two steps apart"""
+    if job_level is None or user_level is None:
+        return UNKNOWN_SENIORITY_FIT
+    return 1.0 - abs(user_level - job_level) / 2
+
+
+class JobEmbeddingCache:
+    """Bounded LRU of normalized job vectors keyed by job link"""
+
+    def __init__(self, max_entries: int = None):
+        """
+        Args:
+            max_entries: LRU size bound (JOB_EMBEDDING_CACHE_SIZE, default 5000)
+        """
+        self.max_entries = max_entries or int(os.getenv('JOB_EMBEDDING_CACHE_SIZE', 5000))
+        self._entries: "OrderedDict[str, Tuple[str, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def digest(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+    def get(self, link: str, text: str) -> Optional[np.ndarray]:
+        """Cached vector for a link, unless the posting's text changed since it was encoded"""
+        with self._lock:
+            entry = self._entries.get(link)
+            if entry is None or entry[0] != self.digest(text):
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(link)
+            self._stats["hits"] += 1
+            return entry[1]
+
+    def put(self, link: str, text: str, vector: np.ndarray):
+        with self._lock:
+            self._entries[link] = (self.digest(text), vector)
+            self._entries.move_to_end(link)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "size": len(self._entries), "maxEntries": self.max_entries}
+
+
+class JobRanker:
+    """Blends embedding similarity, taxonomy skill overlap and experience fit"""
+
+    def __init__(self, model_name: str = None, cache: JobEmbeddingCache = None):
+        """
+        Args:
+            model_name: sentence-transformers model (JOB_RANKING_MODEL, default all-MiniLM-L6-v2)
+            cache: Job vector cache (a new JobEmbeddingCache by default)
+        """
+        self.model_name = model_name or os.getenv('JOB_RANKING_MODEL', DEFAULT_MODEL_NAME)
+        self.cache = cache or JobEmbeddingCache()
+        self._model = None
+        self._model_error = None
+        self._loader = None
+        self._loader_lock = threading.Lock()
+
+    def _load_model(self):
+        try:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name)
+            print(f"✅ Job ranking model loaded: {self.model_name}")
+        except Exception as e:
+            self._model_error = e
+            print(f"⚠️ Job ranking model {self.model_name} unavailable, using keyword scoring: {e}")
+
+    def warm_up_async(self) -> threading.Thread:
+        """Load the sentence-transformer on a background thread (once)"""
+        with self._loader_lock:
+            if self._loader is None:
+                self._loader = threading.Thread(target=self._load_model, name="job-ranking-model", daemon=True)
+                self._loader.start()
+        return self._loader
+
+    def ready(self) -> bool:
+        """
+        Whether embedding ranking can run now
+
+        Never blocks: the first call starts loading the model in the background
+        and requests keep using keyword scoring until it is loaded.
+        """
+        if self._model is not None:
+            return True
+        if self._model_error is None:
+            self.warm_up_async()
+        return False
+
+    def _encode(self, model, texts: List[str]) -> np.ndarray:
+        """Normalized float32 vectors in one batched forward pass"""
+        with track_dependency('sentence_transformer', 'encode'):
+            return model.encode(
+                texts,
+                batch_size=64,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            ).astype(np.float32)
+
+    def _job_vectors(self, model, links: List[str], texts: List[str]) -> np.ndarray:
+        """Job vectors from the cache, encoding only the postings not seen before"""
+        vectors: List[Optional[np.ndarray]] = [self.cache.get(link, text) for link, text in zip(links, texts)]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            encoded = self._encode(model, [texts[i] for i in missing])
+            for i, vector in zip(missing, encoded):
+                vectors[i] = vector
+                if links[i]:
+                    self.cache.put(links[i], texts[i], vector)
+        return np.vstack(vectors)
+
+    @staticmethod
+    def profile_text(user_profile: Dict[str, Any]) -> str:
+        parts = [
+            user_profile.get('interestedDomain') or '',
+            ', '.join(user_profile.get('recommendedRoles') or []),
+            user_profile.get('experienceLevel') or '',
+            ', '.join(user_profile.get('skillsSelected') or [])
+        ]
+        return '. '.join(part for part in parts if part)
+
+    def rank(self, jobs: List[Dict[str, Any]], user_profile: Dict[str, Any], top_k: int = None) -> List[Dict[str, Any]]:
+        """
+        Score jobs against a profile and return the best top_k, highest first
+
+        Args:
+            jobs: Search results with title, snippet and link
+            user_profile: interestedDomain, skillsSelected, experienceLevel (and optionally recommendedRoles)
+            top_k: Number of jobs to return (all when None)
+
+        Returns:
+            Jobs with matchScore (0-100) and matchBreakdown added
+
+        Raises:
+            RuntimeError: If the model is not loaded (check ready() first)
+        """
+        model = self._model
+        if model is None:
+            raise RuntimeError(f"Job ranking model {self.model_name} is not loaded")
+        if not jobs:
+            return []
+        texts = [f"{job.get('title', '')} {job.get('snippet', '')}" for job in jobs]
+
+        skill_matcher = get_skill_taxonomy().matcher(user_profile.get('skillsSelected') or [])
+        user_level = seniority_level(user_profile.get('experienceLevel') or '')
+
+        job_vectors = self._job_vectors(model, [job.get('link') or '' for job in jobs], texts)
+        profile_vector = self._encode(model, [self.profile_text(user_profile)])[0]
+        similarities = np.clip(job_vectors @ profile_vector, 0.0, 1.0)
+
+        scored = []
+        for i, (job, text) in enumerate(zip(jobs, texts)):
+            breakdown = {
+                'similarity': float(similarities[i]),
+                'skills': skill_matcher.matches(text) / len(skill_matcher) if len(skill_matcher) else 0.0,
+                'experience': experience_fit(user_level, seniority_level(text))
+            }
+            score = sum(WEIGHTS[name] * value for name, value in breakdown.items())
+            scored.append((score, -i, job, breakdown))
+
+        best = heapq.nlargest(top_k or len(scored), scored, key=lambda item: item[:2])
+        return [
+            {
+                **job,
+                'matchScore': min(100, int(round(score * 100))),
+                'matchBreakdown': {name: round(value, 3) for name, value in breakdown.items()}
+            }
+            for score, _, job, breakdown in best
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "model": self.model_name,
+            "embeddings": self._model is not None,
+            "modelError": str(self._model_error) if self._model_error else None,
+            "cache": self.cache.stats()
+        }
+
+
+# Singleton instance
+_job_ranker = None
+_job_ranker_lock = threading.Lock()
+
+def get_job_ranker() -> JobRanker:
+    """Get or create the job ranker singleton"""
+    global _job_ranker
+    if _job_ranker is None:
+        with _job_ranker_lock:
+            if _job_ranker is None:
+                _job_ranker = JobRanker()
+    return _job_ranker
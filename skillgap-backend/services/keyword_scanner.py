@@ -0,0 +1,143 @@
+"""
+Multi-Keyword Scanner
+
+Aho-Corasick automaton over word tokens: every keyword of a dictionary is
+found in one left-to-right pass over the text, so the cost of a scan depends
+on the length of the text and not on how many keywords there are.
+
+Text and keywords are split into the same lowercase [a-z0-9+#] tokens, which
+makes matching word-boundary aware for free: "ml" does not match inside
+"html", "java" does not match "javascript" and "node.js" matches "Node JS".
+Overlapping matches resolve leftmost-longest, so "machine learning engineer"
+yields "machine learning" and not also "learning".
+
+Example:
+    scanner = KeywordScanner({'senior': 'Senior', '5+ years': 'Senior', 'junior': 'Junior'})
+    scanner.find("Senior engineer, 5+ years of Python")   # ['Senior']
+"""
+
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+_TOKEN_RE = re.compile(r'[a-z0-9+#]+')
+
+
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Lowercase word tokens; punctuation other than + and # separates words"""
+    return tuple(_TOKEN_RE.findall(text.lower())) if text else ()
+
+
+class _Automaton:
+    """Immutable compiled automaton (goto, failure and output links per node)"""
+
+    __slots__ = ('goto', 'fail', 'out', 'out_link')
+
+    def __init__(self, keywords: Dict[Tuple[str, ...], Any]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.out: List[Optional[Tuple[int, Any]]] = [None]
+        for tokens, value in keywords.items():
+            node = 0
+            for token in tokens:
+                nxt = self.goto[node].get(token)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][token] = nxt
+                    self.goto.append({})
+                    self.out.append(None)
+                node = nxt
+            self.out[node] = (len(tokens), value)
+
+        # Breadth-first failure links; out_link points at the nearest proper suffix that ends a keyword
+        self.fail = [0] * len(self.goto)
+        self.out_link = [0] * len(self.goto)
+        queue = list(self.goto[0].values())
+        for node in queue:
+            for token, child in self.goto[node].items():
+                queue.append(child)
+                f = self.fail[node]
+                while f and token not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(token, 0)
+                self.fail[child] = target if target != child else 0
+                self.out_link[child] = target if self.out[target] else self.out_link[target]
+
+
+class KeywordScanner:
+    """Finds all keywords of a dictionary in a text in a single pass"""
+
+    def __init__(self, keywords: Union[Mapping[str, Any], Iterable[str]] = ()):
+        """
+        Args:
+            keywords: keyword -> value mapping (hashable values), or plain keywords (the value is the keyword)
+        """
+        self._keywords: Dict[Tuple[str, ...], Any] = {}
+        self._automaton: Optional[_Automaton] = None
+        self._lock = threading.Lock()
+        items = keywords.items() if isinstance(keywords, Mapping) else ((k, k) for k in keywords)
+        for keyword, value in items:
+            self.add(keyword, value)
+
+    def add(self, keyword: str, value: Any = None) -> bool:
+        """
+        Add a keyword (the first value added for a keyword wins)
+
+        The automaton is recompiled lazily on the next scan, so add keywords in
+        bulk where possible.
+
+        Returns:
+            True if the keyword was new
+        """
+        tokens = tokenize(keyword)
+        if not tokens or tokens in self._keywords:
+            return False
+        with self._lock:
+            if tokens in self._keywords:
+                return False
+            self._keywords[tokens] = keyword if value is None else value
+            self._automaton = None
+        return True
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def _compiled(self) -> _Automaton:
+        automaton = self._automaton
+        if automaton is None:
+            with self._lock:
+                if self._automaton is None:
+                    self._automaton = _Automaton(dict(self._keywords))
+                automaton = self._automaton
+        return automaton
+
+    def scan(self, text: str) -> List[Tuple[Any, int, int]]:
+        """
+        Every keyword occurrence, overlapping ones included
+
+        Returns:
+            (value, start token, end token) tuples ordered by end position
+        """
+        automaton = self._compiled()
+        goto, fail, out, out_link = automaton.goto, automaton.fail, automaton.out, automaton.out_link
+        matches = []
+        node = 0
+        for i, token in enumerate(tokenize(text)):
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+            hit = node if out[node] else out_link[node]
+            while hit:
+                length, value = out[hit]
+                matches.append((value, i + 1 - length, i + 1))
+                hit = out_link[hit]
+        return matches
+
+    def find(self, text: str) -> List[Any]:
+        """Distinct values of the keywords in the text, leftmost-longest, in order of first mention"""
+        found: Dict[Any, None] = {}
+        covered = 0
+        for value, start, end in sorted(self.scan(text), key=lambda m: (m[1], -m[2])):
+            if start >= covered:
+                found.setdefault(value)
+                covered = end
+        return list(found)
@@ -0,0 +1,176 @@
+"""
+LLM Response Cache Service
+
+Persistent, content-addressed cache for Gemini responses.
+Entries are keyed by a hash of the model name, prompt template version and
+normalized inputs, stored in a local SQLite file, and evicted by TTL and LRU.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, Any, Optional
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'cache', 'llm_cache.sqlite3')
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace and case so trivially different extractions share a key"""
+    return " ".join((text or "").split()).lower()
+
+
+class LLMResponseCache:
+    """SQLite-backed cache with TTL expiry, LRU eviction and hit/miss counters"""
+
+    def __init__(self, db_path: str = None, ttl_seconds: int = None, max_entries: int = None):
+        """
+        Initialize the cache store
+
+        Args:
+            db_path: SQLite file path (defaults to LLM_CACHE_PATH or cache/llm_cache.sqlite3)
+            ttl_seconds: Entry lifetime in seconds (defaults to LLM_CACHE_TTL_SECONDS or 7 days)
+            max_entries: Maximum number of entries kept (defaults to LLM_CACHE_MAX_ENTRIES or 5000)
+        """
+        self.db_path = db_path or os.getenv('LLM_CACHE_PATH', DEFAULT_CACHE_PATH)
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else int(os.getenv('LLM_CACHE_TTL_SECONDS', 7 * 24 * 3600))
+        self.max_entries = max_entries if max_entries is not None else int(os.getenv('LLM_CACHE_MAX_ENTRIES', 5000))
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        if self.db_path != ':memory:':
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        # One connection shared across Flask threads, serialized by self._lock
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache (last_access)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model_name: str, prompt_version: str, *parts: str) -> str:
+        """
+        Build a content-addressed cache key
+
+        Args:
+            model_name: LLM model identifier
+            prompt_version: Version tag of the prompt template
+            *parts: Inputs that determine the response (normalized before hashing)
+
+        Returns:
+            Hex sha256 digest
+        """
+        payload = json.dumps([model_name, prompt_version] + [normalize_text(p) for p in parts])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for key, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                self.evictions += 1
+                return None
+
+            self._conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(value)
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """Store value under key and evict least-recently-used entries over capacity"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, now)
+            )
+
+            count = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN "
+                    "(SELECT key FROM llm_cache ORDER BY last_access ASC LIMIT ?)",
+                    (overflow,)
+                )
+                self.evictions += overflow
+
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete all expired entries and return how many were removed"""
+        if not self.ttl_seconds:
+            return 0
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (cutoff,))
+            self._conn.commit()
+            self.evictions += cursor.rowcount
+            return cursor.rowcount
+
+    def clear(self):
+        """Remove every entry and reset counters"""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def size(self) -> int:
+        """Number of entries currently stored"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "size": self.size(),
+            "maxEntries": self.max_entries,
+            "ttlSeconds": self.ttl_seconds
+        }
+
+
+# Singleton instance
+_llm_cache = None
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get or create the LLM response cache singleton"""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache()
+    return _llm_cache
@@ -0,0 +1,345 @@
+"""
+Metrics Service
+
+Prometheus-style instrumentation without extra dependencies: counters,
+latency histograms and callback gauges in a process-wide registry, rendered
+in the Prometheus text exposition format (0.0.4) at GET /metrics.
+
+- every request is timed per method, blueprint, route template and status
+- outbound dependencies (MongoDB, Gemini, Google Search, YouTube, PDF
+  extraction) are timed with track_dependency()
+- gauges (interview sessions, cache sizes, ...) are read when scraped
+
+Settings (environment):
+    METRICS_ENABLED - "false" disables the middleware and the /metrics route (default true)
+"""
+
+import os
+import re
+import math
+import time
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# Seconds; spans fast Mongo lookups up to slow LLM generations
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+_NAME_RE = re.compile(r'^[a-zA-Z_:][a-zA-Z0-9_:]*$')
+
+
+BACKSLASH, NEWLINE = '\\', '\n'
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace(BACKSLASH, BACKSLASH * 2).replace(NEWLINE, BACKSLASH + 'n').replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[Any, ...]) -> str:
+    if not names:
+        return ''
+    return '{' + ','.join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + '}'
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    """Base for labelled metrics; one series per label-value tuple"""
+
+    type_name = ''
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = ()):
+        if not _NAME_RE.match(name):
+            raise ValueError(f"Invalid metric name: {name}")
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.label_names)
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation.replace(BACKSLASH, BACKSLASH * 2).replace(NEWLINE, BACKSLASH + 'n')}",
+            f"# TYPE {self.name} {self.type_name}"
+        ]
+
+    @abstractmethod
+    def samples(self) -> List[str]:
+        """Exposition lines for every series of this metric"""
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    type_name = 'counter'
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, k)} {_format_value(v)}" for k, v in values]
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket latency histogram"""
+
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [per-bucket counts (+Inf last), sum]
+        self._series: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """Observe the duration of the with-block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            series = sorted((k, list(counts), total) for k, (counts, total) in self._series.items())
+        lines = []
+        label_names = self.label_names + ('le',)
+        for key, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(label_names, key + (_format_value(bound),))} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Gauge(_Metric):
+    """
+    Point-in-time value read from a callback at scrape time
+
+    The callback returns a number, or a dict mapping label-value tuples to
+    numbers for labelled gauges. A failing callback drops the gauge from
+    that scrape instead of failing the whole exposition.
+    """
+
+    type_name = 'gauge'
+
+    def __init__(self, name: str, documentation: str, callback: Callable[[], Any], labels: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labels)
+        self.callback = callback
+
+    def samples(self) -> List[str]:
+        try:
+            value = self.callback()
+        except Exception as e:
+            print(f"⚠️ Gauge {self.name} unavailable: {e}")
+            return []
+        if value is None:
+            return []
+        if isinstance(value, dict):
+            return [
+                f"{self.name}{_format_labels(self.label_names, tuple(k) if isinstance(k, tuple) else (k,))} {_format_value(v)}"
+                for k, v in sorted(value.items())
+            ]
+        return [f"{self.name} {_format_value(value)}"]
+
+
+class MetricsRegistry:
+    """Named metrics of this process, rendered in registration order"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric_type, name: str, *args) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if not isinstance(existing, metric_type):
+                    raise ValueError(f"Metric {name} already registered as {existing.type_name}")
+                if metric_type is Gauge:
+                    # Re-registration (e.g. module reload) replaces the callback
+                    existing.callback = args[1]
+                return existing
+            metric = metric_type(name, *args)
+            self._metrics[name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labels: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labels)
+
+    def histogram(self, name: str, documentation: str, labels: Tuple[str, ...] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labels, buckets)
+
+    def gauge(self, name: str, documentation: str, callback: Callable[[], Any], labels: Tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, callback, labels)
+
+    def render(self) -> str:
+        """Text exposition of every metric"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            samples = metric.samples()
+            if samples or not isinstance(metric, Gauge):
+                lines.extend(metric.header())
+                lines.extend(samples)
+        return '\n'.join(lines) + '\n'
+
+
+# Singleton instance
+_metrics = None
+_metrics_lock = threading.Lock()
+
+def get_metrics() -> MetricsRegistry:
+    """Get or create the metrics registry singleton"""
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = MetricsRegistry()
+    return _metrics
+
+
+def _dependency_histogram() -> Histogram:
+    return get_metrics().histogram(
+        'dependency_call_duration_seconds',
+        'Latency of outbound dependency calls',
+        ('dependency', 'operation', 'outcome')
+    )
+
+
+def observe_dependency(dependency: str, operation: str, seconds: float, outcome: str = 'ok'):
+    """Record one dependency call that was timed by the caller"""
+    _dependency_histogram().observe(seconds, dependency=dependency, operation=operation, outcome=outcome)
+
+
+@contextmanager
+def track_dependency(dependency: str, operation: str) -> Iterator[None]:
+    """
+    Time an outbound call (outcome label is "error" when the block raises)
+
+    Example:
+        with track_dependency('gemini', 'generate_content'):
+            response = model.generate_content(prompt)
+    """
+    start = time.perf_counter()
+    outcome = 'ok'
+    try:
+        yield
+    except BaseException:
+        outcome = 'error'
+        raise
+    finally:
+        observe_dependency(dependency, operation, time.perf_counter() - start, outcome)
+
+
+def timed_dependency(dependency: str, operation: Optional[str] = None):
+    """Decorator form of track_dependency (operation defaults to the function name)"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with track_dependency(dependency, operation or func.__name__):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def init_app(app):
+    """
+    Install request timing middleware and the GET /metrics route
+
+    Routes are labelled by their URL rule template (/api/interview/<session_id>/answer),
+    never by the raw path, so label cardinality stays bounded.
+    """
+    if os.getenv('METRICS_ENABLED', 'true').lower() == 'false':
+        print("ℹ️ Metrics disabled (METRICS_ENABLED=false)")
+        return
+
+    from flask import Response, g, request
+
+    registry = get_metrics()
+    labels = ('method', 'blueprint', 'route', 'status')
+    duration = registry.histogram('http_request_duration_seconds', 'HTTP request latency by route', labels)
+    requests_total = registry.counter('http_requests_total', 'HTTP requests by route and status', labels)
+    in_progress = {'count': 0}
+    in_progress_lock = threading.Lock()
+    registry.gauge('http_requests_in_progress', 'Requests currently being handled', lambda: in_progress['count'])
+    _dependency_histogram()
+
+    @app.before_request
+    def _start_timer():
+        g._metrics_start = time.perf_counter()
+        with in_progress_lock:
+            in_progress['count'] += 1
+
+    @app.after_request
+    def _record_request(response):
+        # Streaming responses are measured up to the headers (time to first byte)
+        start = g.pop('_metrics_start', None)
+        if start is not None:
+            with in_progress_lock:
+                in_progress['count'] -= 1
+            rule = request.url_rule.rule if request.url_rule is not None else '<unmatched>'
+            values = {
+                'method': request.method,
+                'blueprint': request.blueprint or 'app',
+                'route': rule,
+                'status': response.status_code
+            }
+            duration.observe(time.perf_counter() - start, **values)
+            requests_total.inc(**values)
+        return response
+
+    @app.teardown_request
+    def _release_timer(exc):
+        # after_request is skipped when a view raises; keep the in-progress gauge honest
+        if g.pop('_metrics_start', None) is not None:
+            with in_progress_lock:
+                in_progress['count'] -= 1
+
+    @app.route('/metrics')
+    def metrics():
+        return Response(registry.render(), content_type=CONTENT_TYPE)
+
+    print("✓ Metrics enabled at /metrics")
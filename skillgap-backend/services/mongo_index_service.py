@@ -0,0 +1,155 @@
+"""
+MongoDB Index Manager
+
+Declares the indexes every backend collection needs and creates them
+idempotently at startup. Also audits the query shapes used by the routes
+with explain() and flags any that fall back to a collection scan (COLLSCAN).
+
+Run `python db_indexes.py --explain` for the diagnostics report.
+"""
+
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+from pymongo import ASCENDING
+from pymongo.database import Database
+from pymongo.errors import OperationFailure
+from services.mongodb_service import get_db
+
+
+# collection -> list of index specs (keys + create_index options)
+INDEX_SPECS: Dict[str, List[Dict[str, Any]]] = {
+    'auth_users': [
+        # Partial filters keep legacy documents without the field out of the unique constraint
+        {'keys': [('email', ASCENDING)], 'name': 'email_unique', 'unique': True,
+         'partialFilterExpression': {'email': {'$type': 'string'}}},
+        {'keys': [('aadhaar', ASCENDING)], 'name': 'aadhaar_unique', 'unique': True,
+         'partialFilterExpression': {'aadhaar': {'$type': 'string'}}},
+    ],
+    'requiredSkills': [
+        {'keys': [('role', ASCENDING)], 'name': 'role_unique', 'unique': True},
+    ],
+    'users': [
+        # Cohort skill gap: every user of a role
+        {'keys': [('role', ASCENDING)], 'name': 'role_1'},
+    ],
+    'skillGapResults': [
+        # Dropping a role's results when its required skills disappear
+        {'keys': [('role', ASCENDING)], 'name': 'role_1'},
+    ],
+    'analysisJobs': [
+        # claim_next: oldest queued job
+        {'keys': [('status', ASCENDING), ('createdAt', ASCENDING)], 'name': 'status_createdAt'},
+        # requeue_stale: active jobs without a recent heartbeat
+        {'keys': [('status', ASCENDING), ('heartbeatAt', ASCENDING)], 'name': 'status_heartbeatAt'},
+    ],
+    'interviewSessions': [
+        {'keys': [('expiresAt', ASCENDING)], 'name': 'expiresAt_1', 'expireAfterSeconds': 0},
+    ],
+}
+
+
+# Query shapes issued by the routes and services, audited by explain_query_shapes()
+QUERY_SHAPES: List[Dict[str, Any]] = [
+    {'name': 'register: email lookup', 'collection': 'auth_users', 'filter': {'email': 'probe@example.com'}},
+    {'name': 'register: aadhaar lookup', 'collection': 'auth_users', 'filter': {'aadhaar': '000000000000'}},
+    {'name': 'login: email lookup', 'collection': 'auth_users', 'filter': {'email': 'probe@example.com'}},
+    {'name': 'skill gap: required skills by role', 'collection': 'requiredSkills', 'filter': {'role': 'probe'}},
+    {'name': 'user by id', 'collection': 'users', 'filter': {'_id': 'probe'}},
+    {'name': 'skill gap cohort: users by role', 'collection': 'users', 'filter': {'role': 'probe'}},
+    {'name': 'skill gap results by user', 'collection': 'skillGapResults', 'filter': {'_id': 'probe'}},
+    {'name': 'skill gap results by role', 'collection': 'skillGapResults', 'filter': {'role': 'probe'}},
+    {'name': 'resume analysis by user', 'collection': 'resume_analysis', 'filter': {'_id': 'probe'}},
+    {'name': 'profile', 'collection': 'profiles', 'filter': {'_id': 'current_profile'}},
+    {'name': 'job queue: claim next', 'collection': 'analysisJobs', 'filter': {'status': 'queued'},
+     'sort': [('createdAt', ASCENDING)]},
+    {'name': 'job queue: stale sweep', 'collection': 'analysisJobs',
+     'filter': {'status': {'$in': ['extracting', 'analyzing', 'storing']}, 'heartbeatAt': {'$lt': datetime(2000, 1, 1)}}},
+    {'name': 'job by id', 'collection': 'analysisJobs', 'filter': {'_id': 'probe'}},
+    {'name': 'interview session by id', 'collection': 'interviewSessions',
+     'filter': {'_id': 'probe', 'expiresAt': {'$gt': datetime(2000, 1, 1)}}},
+]
+
+
+def ensure_indexes(db: Optional[Database] = None) -> Dict[str, List[str]]:
+    """
+    Create every declared index (no-op for indexes that already exist)
+
+    Failures (e.g. duplicate data blocking a unique index) are logged and do
+    not stop the remaining indexes from being created.
+
+    Returns:
+        collection -> names of indexes that are in place
+    """
+    db = db if db is not None else get_db()
+    created: Dict[str, List[str]] = {}
+
+    for collection_name, specs in INDEX_SPECS.items():
+        for spec in specs:
+            options = {k: v for k, v in spec.items() if k != 'keys'}
+            try:
+                name = db[collection_name].create_index(spec['keys'], **options)
+                created.setdefault(collection_name, []).append(name)
+            except OperationFailure as e:
+                print(f"⚠️ Could not create index {collection_name}.{spec.get('name')}: {e}")
+
+    total = sum(len(names) for names in created.values())
+    print(f"✅ MongoDB indexes ensured ({total} across {len(created)} collections)")
+    return created
+
+
+def _plan_stages(plan: Dict[str, Any]) -> List[str]:
+    """Flatten the stage names of a (possibly nested) winning plan"""
+    stages = [plan.get('stage')] if plan.get('stage') else []
+    for child_key in ('inputStage', 'queryPlan'):
+        if isinstance(plan.get(child_key), dict):
+            stages.extend(_plan_stages(plan[child_key]))
+    for child in plan.get('inputStages', []):
+        stages.extend(_plan_stages(child))
+    return stages
+
+
+def explain_query_shapes(db: Optional[Database] = None) -> List[Dict[str, Any]]:
+    """
+    Run explain() on every entry of QUERY_SHAPES
+
+    Returns:
+        One report per shape: name, collection, stages, index used and a collscan flag
+    """
+    db = db if db is not None else get_db()
+    report = []
+
+    for shape in QUERY_SHAPES:
+        cursor = db[shape['collection']].find(shape['filter'])
+        if shape.get('sort'):
+            cursor = cursor.sort(shape['sort'])
+        try:
+            explained = cursor.limit(1).explain()
+        except Exception as e:
+            report.append({**_shape_summary(shape), 'error': str(e), 'collscan': None})
+            continue
+
+        winning_plan = explained.get('queryPlanner', {}).get('winningPlan', {})
+        stages = _plan_stages(winning_plan)
+        index_names = _index_names(winning_plan)
+        report.append({
+            **_shape_summary(shape),
+            'stages': stages,
+            'indexes': index_names,
+            'collscan': 'COLLSCAN' in stages
+        })
+
+    return report
+
+
+def _shape_summary(shape: Dict[str, Any]) -> Dict[str, Any]:
+    return {'name': shape['name'], 'collection': shape['collection'], 'fields': sorted(shape['filter'])}
+
+
+def _index_names(plan: Dict[str, Any]) -> List[str]:
+    names = [plan['indexName']] if plan.get('indexName') else []
+    for child_key in ('inputStage', 'queryPlan'):
+        if isinstance(plan.get(child_key), dict):
+            names.extend(_index_names(plan[child_key]))
+    for child in plan.get('inputStages', []):
+        names.extend(_index_names(child))
+    return names
@@ -7,8 +7,33 @@ Replaces Firebase Firestore with MongoDB.
 
 import os
 from typing import Optional
-from pymongo import MongoClient
+from pymongo import MongoClient, monitoring
 from pymongo.database import Database
+from services.metrics_service import observe_dependency
+
+
+# Handshake/auth/heartbeat commands say nothing about query latency
+_UNTIMED_COMMANDS = {
+    'hello', 'ismaster', 'ping', 'buildinfo', 'saslstart', 'saslcontinue',
+    'authenticate', 'getnonce', 'endsessions', 'killcursors'
+}
+
+
+class MongoCommandTimer(monitoring.CommandListener):
+    """Records every MongoDB command in the dependency latency histogram"""
+
+    def started(self, event):
+        pass
+
+    def _observe(self, event, outcome: str):
+        if event.command_name.lower() not in _UNTIMED_COMMANDS:
+            observe_dependency('mongodb', event.command_name, event.duration_micros / 1e6, outcome)
+
+    def succeeded(self, event):
+        self._observe(event, 'ok')
+
+    def failed(self, event):
+        self._observe(event, 'error')
 
 
 _client: Optional[MongoClient] = None
@@ -40,7 +65,7 @@ def get_db() -> Database:
         )
 
     try:
-        _client = MongoClient(mongodb_uri)
+        _client = MongoClient(mongodb_uri, event_listeners=[MongoCommandTimer()])
         _db = _client[db_name]
         
         # Test the connection
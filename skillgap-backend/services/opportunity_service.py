@@ -1,7 +1,9 @@
 import os
-import requests
 import json
 from models import Opportunity
+from services.http_client import get_http_client
+from services.metrics_service import track_dependency
+from services.keyword_scanner import KeywordScanner
 from datetime import datetime
 
 class OpportunityService:
@@ -24,11 +26,15 @@ class OpportunityService:
         }
 
         try:
-            response = requests.get(OpportunityService.GOOGLE_SEARCH_URL, params=params)
+            with track_dependency('google_search', 'opportunities'):
+                search_url = os.getenv('GOOGLE_SEARCH_BASE_URL', OpportunityService.GOOGLE_SEARCH_URL)
+                response = get_http_client().get(search_url, params=params)
             response.raise_for_status()
             results = response.json().get('items', [])
             
             opportunities = []
+            # One scanner per search: each result is scanned once for all interest keywords
+            keyword_scanner = KeywordScanner(interest_keywords)
             for item in results:
                 opp_data = {
                     'id': item.get('cacheId', item.get('link')), # Use link as ID if cacheId missing
@@ -41,7 +47,7 @@ class OpportunityService:
                 }
                 
                 opp = Opportunity(opp_data)
-                opp.relevance_score = OpportunityService._calculate_relevance(opp, interest_keywords)
+                opp.relevance_score = OpportunityService._calculate_relevance(opp, keyword_scanner)
                 opportunities.append(opp)
             
             # Sort by relevance
@@ -65,12 +71,11 @@ class OpportunityService:
         return "Open"
 
     @staticmethod
-    def _calculate_relevance(opportunity, keywords):
+    def _calculate_relevance(opportunity, keyword_scanner):
         score = 50 # Base score
-        text = (opportunity.title + " " + opportunity.snippet).lower()
+        text = opportunity.title + " " + opportunity.snippet
         
-        for keyword in keywords:
-            if keyword.lower() in text:
-                score += 10
+        # +10 per distinct interest keyword mentioned
+        score += 10 * len(keyword_scanner.find(text))
         
         return min(score, 100)
@@ -0,0 +1,340 @@
+"""
+Prompt Budget Governor
+
+Keeps the resume text embedded in LLM prompts within a fixed token budget,
+so a 20-page CV or a scanned document full of OCR junk costs the same as a
+normal resume. The text is normalized (whitespace, repeated page
+headers/footers, boilerplate and junk lines), split into sections, and the
+sections are kept by rank - skills, experience, projects, education, then
+the rest - with deterministic truncation to the budget. Budget usage is
+recorded per call.
+"""
+
+import os
+import re
+import math
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Tuple
+
+
+# Section name -> heading keywords
+SECTION_HEADINGS: Dict[str, Tuple[str, ...]] = {
+    'skills': ('skills', 'technical skills', 'core competencies', 'competencies', 'technologies',
+               'tech stack', 'tools', 'expertise', 'key skills'),
+    'experience': ('experience', 'work experience', 'professional experience', 'employment',
+                   'employment history', 'work history', 'internships', 'internship'),
+    'projects': ('projects', 'personal projects', 'academic projects', 'key projects'),
+    'education': ('education', 'academic background', 'qualifications', 'academics'),
+    'summary': ('summary', 'professional summary', 'profile', 'objective', 'career objective', 'about me'),
+    'certifications': ('certifications', 'certificates', 'courses', 'training', 'achievements', 'awards'),
+    # Unranked sections: recognized only so their text is not filed under the previous heading
+    'other': ('hobbies', 'interests', 'hobbies and interests', 'publications', 'languages', 'volunteering',
+              'volunteer experience', 'extracurricular activities', 'activities', 'references',
+              'personal details', 'personal information', 'declaration', 'patents', 'conferences'),
+}
+
+# Ranked sections and the share of the budget each is guaranteed before leftovers are handed out by rank
+SECTION_SHARES: Dict[str, float] = {
+    'skills': 0.20,
+    'experience': 0.35,
+    'projects': 0.20,
+    'education': 0.10,
+    'summary': 0.05,
+    'certifications': 0.05,
+    'other': 0.05,
+}
+SECTION_RANK = list(SECTION_SHARES)
+
+BOILERPLATE_PATTERNS = [
+    re.compile(r'^\s*page\s+\d+(\s+of\s+\d+)?\s*$', re.IGNORECASE),
+    re.compile(r'^\s*\d+\s*/\s*\d+\s*$'),
+    re.compile(r'^\s*(curriculum vitae|resume|r[ée]sum[ée])\s*$', re.IGNORECASE),
+    re.compile(r'references (are )?available (up)?on request', re.IGNORECASE),
+    re.compile(r'^\s*i hereby declare', re.IGNORECASE),
+]
+
+TRUNCATION_MARKER = "[...]"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Local token estimate without a tokenizer
+
+    Words cost roughly one token per four characters (at least one), every
+    punctuation/symbol character one token - close to Gemini's counts for
+    English resumes and pessimistic for symbol-heavy junk.
+    """
+    tokens = 0
+    for piece in re.findall(r"\w+|[^\w\s]", text):
+        tokens += math.ceil(len(piece) / 4) if piece[0].isalnum() or piece[0] == '_' else 1
+    return tokens
+
+
+def _is_junk_line(line: str) -> bool:
+    """Lines that are mostly symbols (OCR noise, table borders, bullets without text)"""
+    visible = [c for c in line if not c.isspace()]
+    if not visible:
+        return False
+    alnum = sum(c.isalnum() for c in visible)
+    return alnum == 0 or (len(visible) >= 8 and alnum / len(visible) < 0.4)
+
+
+def normalize_resume_text(text: str) -> str:
+    """
+    Clean extracted resume text without changing its meaning
+
+    - strips control characters and collapses runs of spaces/tabs
+    - re-joins words hyphenated across line breaks
+    - drops junk lines, page numbers and boilerplate
+    - drops short lines repeated three or more times (page headers/footers)
+    - collapses blank-line runs
+    """
+    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', ' ', text.replace('\r\n', '\n').replace('\r', '\n'))
+    text = re.sub(r'(\w)-\n(\w)', r'\1\2', text)
+    lines = [re.sub(r'[ \t\u00a0]+', ' ', line).strip() for line in text.split('\n')]
+
+    repeated = {line for line, count in Counter(l for l in lines if l and len(l) <= 80).items() if count >= 3}
+
+    kept: List[str] = []
+    for line in lines:
+        if line and (line in repeated or _is_junk_line(line) or any(p.search(line) for p in BOILERPLATE_PATTERNS)):
+            continue
+        if not line and (not kept or not kept[-1]):
+            continue
+        kept.append(line)
+    return '\n'.join(kept).strip()
+
+
+def _heading_section(line: str) -> str:
+    """Section name if the line is a section heading, else ''"""
+    candidate = line.strip().rstrip(':').strip(' -|•*#').lower()
+    if not candidate or len(candidate.split()) > 4:
+        return ''
+    for section, headings in SECTION_HEADINGS.items():
+        if candidate in headings:
+            return section
+    return ''
+
+
+_HEADING_LIKE_RE = re.compile(r"^[A-Za-z][A-Za-z&/'’ -]*:?$")
+
+
+def _heading_style(line: str, standalone: bool) -> Tuple[str, bool]:
+    """
+    (case, standalone) of a line that looks like a heading, or () if it does not
+
+    Heading-like: at most 4 words, letters only, and either ALL CAPS or ending
+    with a colon. Title Case alone is not enough ("Built APIs" is a bullet).
+    """
+    candidate = line.strip().strip(' -|•*#')
+    words = candidate.rstrip(':').split()
+    if not words or len(words) > 4 or not _HEADING_LIKE_RE.match(candidate):
+        return ()
+    letters = [c for c in candidate if c.isalpha()]
+    if len(letters) >= 2 and all(c.isupper() for c in letters):
+        return 'upper', standalone
+    if candidate.endswith(':') and words[0][0].isupper():
+        return 'title', standalone
+    return ()
+
+
+def split_sections(text: str) -> List[Tuple[str, str]]:
+    """
+    Split normalized resume text into (section, text) blocks in document order
+
+    Text before the first heading (name, contact details) and under unknown
+    headings is filed as 'other'. Besides the 'other' headings listed in
+    SECTION_HEADINGS, an unknown heading is a heading-like line (see
+    _heading_style) written like a recognized heading of the same document -
+    same case and, like it, standing after a blank line or not - so company
+    names and job titles inside a section are not mistaken for headings. A
+    section that appears twice yields two blocks.
+    """
+    lines = text.split('\n')
+    standalone = [i == 0 or not lines[i - 1].strip() for i in range(len(lines))]
+    sections = [_heading_section(line) for line in lines]
+    # Styles of the recognized headings; a colon is optional there (the heading is already known)
+    known_styles = {
+        _heading_style(line.rstrip(':') + ':', standalone[i]) for i, line in enumerate(lines) if sections[i]
+    } - {()}
+
+    blocks: List[Tuple[str, List[str]]] = [('other', [])]
+    for i, line in enumerate(lines):
+        section = sections[i]
+        if not section and known_styles and _heading_style(line, standalone[i]) in known_styles:
+            section = 'other'
+        if section:
+            blocks.append((section, [line]))
+        else:
+            blocks[-1][1].append(line)
+    return [(name, '\n'.join(lines).strip()) for name, lines in blocks if '\n'.join(lines).strip()]
+
+
+def _truncate(text: str, budget: int) -> str:
+    """Longest prefix of whole lines (then whole words) within the token budget"""
+    if budget <= 0:
+        return ''
+    kept: List[str] = []
+    used = 0
+    for line in text.split('\n'):
+        cost = estimate_tokens(line) + 1
+        if used + cost <= budget:
+            kept.append(line)
+            used += cost
+            continue
+        # Partial last line, cut at a word boundary
+        words: List[str] = []
+        for word in line.split(' '):
+            cost = estimate_tokens(word)
+            if used + cost > budget:
+                break
+            words.append(word)
+            used += cost
+        if words:
+            kept.append(' '.join(words))
+        break
+    return '\n'.join(kept).rstrip()
+
+
+@dataclass
+class BudgetResult:
+    """Resume text fitted to a budget, with the accounting of what was kept"""
+    text: str
+    budget_tokens: int
+    original_tokens: int
+    normalized_tokens: int
+    used_tokens: int
+    truncated: bool
+    sections: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def usage(self) -> Dict[str, Any]:
+        return {
+            "budgetTokens": self.budget_tokens,
+            "originalTokens": self.original_tokens,
+            "normalizedTokens": self.normalized_tokens,
+            "usedTokens": self.used_tokens,
+            "truncated": self.truncated,
+            "sections": self.sections
+        }
+
+
+class PromptBudget:
+    """Fits resume text to a token budget and records per-call usage"""
+
+    def __init__(self, resume_budget_tokens: int = None, history_size: int = 1000):
+        """
+        Args:
+            resume_budget_tokens: Token budget for the resume part of the analysis prompt
+                (RESUME_PROMPT_TOKEN_BUDGET, default 6000)
+            history_size: Number of recent calls kept for percentile stats
+        """
+        self.resume_budget_tokens = resume_budget_tokens or int(os.getenv('RESUME_PROMPT_TOKEN_BUDGET', 6000))
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._truncated_calls = 0
+        self._original = deque(maxlen=history_size)
+        self._used = deque(maxlen=history_size)
+
+    def fit_resume(self, resume_text: str, budget_tokens: int = None) -> BudgetResult:
+        """
+        Normalize resume text and cut it down to the budget, keeping the highest-ranked sections
+
+        Each section present first gets up to its guaranteed share of the budget;
+        whatever is left goes to the cut sections in rank order. Sections are
+        emitted in their original order, with a marker where text was cut.
+        The result is deterministic for a given text and budget.
+        """
+        budget = budget_tokens or self.resume_budget_tokens
+        original_tokens = estimate_tokens(resume_text)
+        normalized = normalize_resume_text(resume_text)
+        normalized_tokens = estimate_tokens(normalized)
+
+        if normalized_tokens <= budget:
+            result = BudgetResult(normalized, budget, original_tokens, normalized_tokens, normalized_tokens, False)
+            self._record(result)
+            return result
+
+        blocks = split_sections(normalized)
+        costs = [estimate_tokens(text) + 1 for _, text in blocks]
+        present = {name for name, _ in blocks}
+        allowance = [0] * len(blocks)
+
+        # Phase 1: guaranteed shares, split between the blocks of a section in document order
+        for section in SECTION_RANK:
+            if section not in present:
+                continue
+            share = int(budget * SECTION_SHARES[section])
+            for i, (name, _) in enumerate(blocks):
+                if name == section:
+                    allowance[i] = min(costs[i], share)
+                    share -= allowance[i]
+
+        # Phase 2: leftovers by rank
+        remaining = budget - sum(allowance)
+        for section in SECTION_RANK:
+            for i, (name, _) in enumerate(blocks):
+                if name == section and remaining > 0 and allowance[i] < costs[i]:
+                    extra = min(costs[i] - allowance[i], remaining)
+                    allowance[i] += extra
+                    remaining -= extra
+
+        parts: List[str] = []
+        sections: Dict[str, Dict[str, int]] = {}
+        for (name, text), cost, allowed in zip(blocks, costs, allowance):
+            kept = text if allowed >= cost else _truncate(text, allowed - estimate_tokens(TRUNCATION_MARKER) - 1)
+            if kept and kept != text:
+                kept = f"{kept}\n{TRUNCATION_MARKER}"
+            if kept:
+                parts.append(kept)
+            stats = sections.setdefault(name, {"originalTokens": 0, "keptTokens": 0})
+            stats["originalTokens"] += cost
+            stats["keptTokens"] += estimate_tokens(kept) + 1 if kept else 0
+
+        fitted = '\n\n'.join(parts)
+        result = BudgetResult(fitted, budget, original_tokens, normalized_tokens, estimate_tokens(fitted), True, sections)
+        self._record(result)
+        return result
+
+    def _record(self, result: BudgetResult):
+        with self._lock:
+            self._calls += 1
+            self._truncated_calls += result.truncated
+            self._original.append(result.original_tokens)
+            self._used.append(result.used_tokens)
+
+    @staticmethod
+    def _percentile(values: List[int], pct: float) -> int:
+        if not values:
+            return 0
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(math.ceil(pct / 100 * len(ordered))) - 1)]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            original, used = list(self._original), list(self._used)
+            return {
+                "budgetTokens": self.resume_budget_tokens,
+                "calls": self._calls,
+                "truncatedCalls": self._truncated_calls,
+                "originalTokensP50": self._percentile(original, 50),
+                "originalTokensP99": self._percentile(original, 99),
+                "usedTokensP50": self._percentile(used, 50),
+                "usedTokensP99": self._percentile(used, 99),
+                "usedTokensMax": max(used, default=0)
+            }
+
+
+# Singleton instance
+_prompt_budget = None
+_prompt_budget_lock = threading.Lock()
+
+def get_prompt_budget() -> PromptBudget:
+    """Get or create the prompt budget singleton"""
+    global _prompt_budget
+    if _prompt_budget is None:
+        with _prompt_budget_lock:
+            if _prompt_budget is None:
+                _prompt_budget = PromptBudget()
+    return _prompt_budget
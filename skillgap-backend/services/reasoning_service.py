@@ -1,6 +1,7 @@
 import os
 import google.generativeai as genai
 import json
+from services.metrics_service import track_dependency
 
 class ReasoningService:
     @staticmethod
@@ -47,7 +48,8 @@ class ReasoningService:
         """
 
         try:
-            response = model.generate_content(prompt)
+            with track_dependency('gemini', 'reasoning'):
+                response = model.generate_content(prompt)
             # Clean up response if it contains markdown code blocks
             text = response.text
             if text.startswith('```json'):
@@ -0,0 +1,102 @@
+"""
+Resume Analysis Pipeline
+
+Runs the full resume analysis flow (PDF text extraction, Gemini analysis,
+MongoDB write) outside of the request thread. Each stage is reported through
+an optional callback so the job queue can track progress and timings.
+"""
+
+from datetime import datetime
+from typing import Dict, Any, Callable, Optional
+from services.mongodb_service import get_db
+from services.gemini_service import get_gemini_service
+from services.resume_text_extractor import get_resume_text_extractor
+
+
+class ResumeAnalysisService:
+    """Stage-by-stage resume analysis used by the background job workers"""
+
+    @staticmethod
+    def extract_resume_text(resume_url: str) -> str:
+        """
+        Extract text from a resume URL
+
+        Uses the shared ResumeTextExtractor, so re-analysing an unchanged
+        resume reuses the cached text instead of re-parsing the PDF.
+
+        Args:
+            resume_url: Resume URL as returned by /api/resume/upload
+
+        Returns:
+            Extracted resume text
+        """
+        result = get_resume_text_extractor().extract_resume_url(resume_url)
+        if result.get('cached'):
+            print("⚡ Resume text cache hit - skipped PDF parsing")
+        if result.get('truncated'):
+            print(f"⚠️ Resume truncated to {result['pages']} of {result['totalPages']} page(s)")
+        return result['text']
+
+    @staticmethod
+    def store_analysis(user_id: str, analysis_result: Dict[str, Any]):
+        """
+        Persist a completed analysis on the user document
+
+        Args:
+            user_id: The user ID
+            analysis_result: Result dictionary returned by GeminiService.analyze_resume
+        """
+        db = get_db()
+        # The analysis is not a skill gap input (see skill_gap_results_service), so no refresh is needed
+        db.users.update_one(
+            {'_id': user_id},
+            {'$set': {
+                'geminiAnalysis': analysis_result['data'],
+                'analysisDate': datetime.utcnow().isoformat(),
+                'analysisFallback': 'warning' in analysis_result  # Flag if fallback was used
+            }},
+            upsert=True
+        )
+
+    @staticmethod
+    def run(
+        user_id: str,
+        resume_url: str,
+        target_domain: str = "General",
+        on_stage: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the complete analysis pipeline
+
+        Args:
+            user_id: The user ID
+            resume_url: Resume URL to analyze
+            target_domain: Target job domain
+            on_stage: Called with "extracting", "analyzing" and "storing" as each stage begins
+
+        Returns:
+            {"analysis": ..., "warning": ...} on success
+
+        Raises:
+            Exception: If extraction or analysis fails
+        """
+        notify = on_stage or (lambda stage: None)
+
+        notify("extracting")
+        resume_text = ResumeAnalysisService.extract_resume_text(resume_url)
+        print(f"✅ Extracted {len(resume_text)} characters from PDF")
+        if len(resume_text) < 100:
+            print(f"⚠️ WARNING: Resume text is very short ({len(resume_text)} chars)")
+
+        notify("analyzing")
+        analysis_result = get_gemini_service().analyze_resume(resume_text, target_domain)
+        if not analysis_result.get('success'):
+            raise Exception(f"AI analysis failed: {analysis_result.get('error', 'Unknown error')}")
+
+        notify("storing")
+        ResumeAnalysisService.store_analysis(user_id, analysis_result)
+
+        return {
+            "analysis": analysis_result['data'],
+            "warning": analysis_result.get('warning')
+        }
@@ -0,0 +1,301 @@
+"""
+Resume Text Extractor
+
+Single place where resume PDFs are turned into text. Extracted text is cached
+by the file's sha256 (next to the uploaded file, or in uploads/.text_cache for
+downloaded resumes), so re-analysing an unchanged resume never re-parses the
+PDF. Large PDFs are split into page ranges and extracted across a process
+pool, and page/character caps truncate oversized documents early.
+"""
+
+import os
+import json
+import hashlib
+import threading
+import multiprocessing
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional
+import PyPDF2
+from services.http_client import get_http_client
+from services.metrics_service import timed_dependency
+
+
+UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'uploads')
+REMOTE_CACHE_DIR = os.path.join(UPLOAD_FOLDER, '.text_cache')
+
+# Bump when extraction output changes so cached text is regenerated
+EXTRACTOR_VERSION = 1
+
+
+class ResumeTooLargeError(ValueError):
+    """Raised when a resume file exceeds the configured size limit"""
+
+
+class UnsafeResumePathError(ValueError):
+    """Raised when a resume path resolves outside the folder it must stay in"""
+
+
+def resolve_inside(root: str, path: str) -> str:
+    """
+    Real path of path (relative to root, or absolute), refusing anything outside root
+
+    Raises:
+        UnsafeResumePathError: If ../ segments or symlinks lead out of root
+    """
+    real_root = os.path.realpath(root)
+    real_path = os.path.realpath(os.path.join(real_root, path))
+    if os.path.commonpath([real_root, real_path]) != real_root:
+        raise UnsafeResumePathError(f"Resume path is outside {root}: {path}")
+    return real_path
+
+
+def _extract_page_range(pdf_bytes: bytes, start: int, end: int) -> List[str]:
+    """Extract pages [start, end) - module level so it can run in a worker process"""
+    reader = PyPDF2.PdfReader(BytesIO(pdf_bytes))
+    return [(reader.pages[i].extract_text() or "") for i in range(start, end)]
+
+
+class ResumeTextExtractor:
+    """Cached, capped and page-parallel PDF text extraction"""
+
+    def __init__(
+        self,
+        max_bytes: int = None,
+        max_pages: int = None,
+        max_chars: int = None,
+        parallel_page_threshold: int = None,
+        workers: int = None
+    ):
+        """
+        Args:
+            max_bytes: Reject files larger than this (RESUME_MAX_BYTES, default 10 MB)
+            max_pages: Only the first max_pages pages are read (RESUME_MAX_PAGES, default 20)
+            max_chars: Text is truncated to this many characters (RESUME_MAX_CHARS, default 50000)
+            parallel_page_threshold: PDFs with at least this many pages use the process pool
+                (RESUME_PARALLEL_PAGE_THRESHOLD, default 8)
+            workers: Process pool size (RESUME_EXTRACT_WORKERS, default min(4, CPU count))
+        """
+        self.max_bytes = max_bytes or int(os.getenv('RESUME_MAX_BYTES', 10 * 1024 * 1024))
+        self.max_pages = max_pages or int(os.getenv('RESUME_MAX_PAGES', 20))
+        self.max_chars = max_chars or int(os.getenv('RESUME_MAX_CHARS', 50000))
+        self.parallel_page_threshold = parallel_page_threshold or int(os.getenv('RESUME_PARALLEL_PAGE_THRESHOLD', 8))
+        self.workers = workers or int(os.getenv('RESUME_EXTRACT_WORKERS', min(4, os.cpu_count() or 1)))
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    # ------------------------------------------------------------------
+    # Extraction
+    # ------------------------------------------------------------------
+
+    def iter_pages(self, pdf_bytes: bytes) -> Iterator[str]:
+        """
+        Yield page texts in order, stopping at the page or character cap
+
+        Args:
+            pdf_bytes: Raw PDF content
+
+        Yields:
+            Text of each page (the last one may be truncated)
+        """
+        reader = PyPDF2.PdfReader(BytesIO(pdf_bytes))
+        remaining = self.max_chars
+        for page in reader.pages[:self.max_pages]:
+            text = page.extract_text() or ""
+            if len(text) >= remaining:
+                yield text[:remaining]
+                return
+            remaining -= len(text) + 1  # +1 for the page separator
+            yield text
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                # Not fork: the server process runs worker, heartbeat and pymongo monitor threads,
+                # and a forked child can inherit one of their locks held and deadlock
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+            return self._pool
+
+    def _extract_parallel(self, pdf_bytes: bytes, page_count: int) -> List[str]:
+        chunk = max(1, -(-page_count // self.workers))
+        ranges = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+        pool = self._get_pool()
+        futures = [pool.submit(_extract_page_range, pdf_bytes, start, end) for start, end in ranges]
+        pages: List[str] = []
+        for future in futures:
+            pages.extend(future.result())
+        return pages
+
+    @timed_dependency('pdf_extraction', 'extract')
+    def extract_bytes(self, pdf_bytes: bytes) -> Dict[str, Any]:
+        """
+        Extract text from PDF bytes without consulting the cache
+
+        Returns:
+            {"text": ..., "pages": pages read, "totalPages": ..., "truncated": bool}
+        """
+        if len(pdf_bytes) > self.max_bytes:
+            raise ResumeTooLargeError(
+                f"Resume is {len(pdf_bytes) // 1024} KB, the limit is {self.max_bytes // 1024} KB"
+            )
+
+        total_pages = len(PyPDF2.PdfReader(BytesIO(pdf_bytes)).pages)
+        page_count = min(total_pages, self.max_pages)
+
+        if page_count >= self.parallel_page_threshold and self.workers > 1:
+            try:
+                pages = self._extract_parallel(pdf_bytes, page_count)
+            except Exception as e:
+                print(f"⚠️ Parallel PDF extraction failed, falling back to sequential: {e}")
+                pages = list(self.iter_pages(pdf_bytes))
+        else:
+            pages = list(self.iter_pages(pdf_bytes))
+
+        text = "\n".join(pages).strip()
+        truncated = total_pages > self.max_pages or len(text) > self.max_chars
+        if len(text) > self.max_chars:
+            text = text[:self.max_chars]
+
+        return {"text": text, "pages": len(pages), "totalPages": total_pages, "truncated": truncated}
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _sha256(pdf_bytes: bytes) -> str:
+        return hashlib.sha256(pdf_bytes).hexdigest()
+
+    def _cache_key(self, digest: str) -> str:
+        return f"{digest}:{EXTRACTOR_VERSION}:{self.max_pages}:{self.max_chars}"
+
+    def _read_cache(self, cache_path: str, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('key') == key:
+                return cached
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _write_cache(self, cache_path: str, key: str, result: Dict[str, Any]):
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({**result, 'key': key}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠️ Could not cache resume text: {e}")
+
+    def _extract_cached(self, pdf_bytes: bytes, cache_path: str) -> Dict[str, Any]:
+        key = self._cache_key(self._sha256(pdf_bytes))
+        cached = self._read_cache(cache_path, key)
+        if cached is not None:
+            self.cache_hits += 1
+            cached.pop('key', None)
+            return {**cached, 'cached': True}
+
+        self.cache_misses += 1
+        result = self.extract_bytes(pdf_bytes)
+        self._write_cache(cache_path, key, result)
+        return {**result, 'cached': False}
+
+    # ------------------------------------------------------------------
+    # Entry points
+    # ------------------------------------------------------------------
+
+    def extract_file(self, file_path: str, root: str = UPLOAD_FOLDER) -> Dict[str, Any]:
+        """
+        Extract text from a local PDF, cached next to it as <file>.text.json
+
+        Args:
+            file_path: PDF path, absolute or relative to root
+            root: Folder the PDF must resolve into (the uploads folder by default)
+
+        Returns:
+            Extraction result dict (see extract_bytes) plus "cached"
+
+        Raises:
+            UnsafeResumePathError: If the path resolves outside root
+        """
+        file_path = resolve_inside(root, file_path)
+        if os.path.getsize(file_path) > self.max_bytes:
+            raise ResumeTooLargeError(f"Resume file exceeds {self.max_bytes // 1024} KB: {file_path}")
+        with open(file_path, 'rb') as f:
+            pdf_bytes = f.read()
+        return self._extract_cached(pdf_bytes, f"{file_path}.text.json")
+
+    @timed_dependency('pdf_extraction', 'download')
+    def download(self, pdf_url: str, timeout: float = 30) -> bytes:
+        """Download a PDF, aborting as soon as it exceeds max_bytes"""
+        response = get_http_client().get(pdf_url, stream=True, timeout=timeout)
+        response.raise_for_status()
+        declared = int(response.headers.get('content-length') or 0)
+        if declared > self.max_bytes:
+            raise ResumeTooLargeError(f"Resume download exceeds {self.max_bytes // 1024} KB")
+
+        buffer = BytesIO()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            buffer.write(chunk)
+            if buffer.tell() > self.max_bytes:
+                response.close()
+                raise ResumeTooLargeError(f"Resume download exceeds {self.max_bytes // 1024} KB")
+        return buffer.getvalue()
+
+    def extract_url(self, pdf_url: str) -> Dict[str, Any]:
+        """
+        Download and extract a remote PDF, cached in uploads/.text_cache by content hash
+
+        Returns:
+            Extraction result dict (see extract_bytes) plus "cached"
+        """
+        pdf_bytes = self.download(pdf_url)
+        cache_path = os.path.join(REMOTE_CACHE_DIR, f"{self._sha256(pdf_bytes)}.text.json")
+        return self._extract_cached(pdf_bytes, cache_path)
+
+    def extract_resume_url(self, resume_url: str) -> Dict[str, Any]:
+        """
+        Extract text from a resume URL as returned by /api/resume/upload
+
+        Local upload URLs (localhost) are read straight from the uploads folder,
+        external URLs (e.g. Firebase Storage) are downloaded.
+        """
+        if 'localhost' in resume_url or '127.0.0.1' in resume_url:
+            # URL format: http://localhost:5000/api/files/resumes/{userId}/{filename}
+            url_parts = resume_url.split('/files/')
+            if len(url_parts) == 2:
+                # The URL comes from the client: never read (or cache next to) files outside uploads/
+                local_file_path = resolve_inside(UPLOAD_FOLDER, url_parts[1])
+                if not os.path.exists(local_file_path):
+                    raise FileNotFoundError(f"Resume file not found: {local_file_path}")
+                return self.extract_file(local_file_path)
+
+        return self.extract_url(resume_url)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.cache_hits + self.cache_misses
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hitRate": round(self.cache_hits / total, 3) if total else 0.0,
+            "maxPages": self.max_pages,
+            "maxChars": self.max_chars,
+            "workers": self.workers
+        }
+
+
+# Singleton instance
+_resume_text_extractor = None
+
+def get_resume_text_extractor() -> ResumeTextExtractor:
+    """Get or create the resume text extractor singleton"""
+    global _resume_text_extractor
+    if _resume_text_extractor is None:
+        _resume_text_extractor = ResumeTextExtractor()
+    return _resume_text_extractor
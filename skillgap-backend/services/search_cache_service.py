@@ -0,0 +1,190 @@
+"""
+Search Result Cache
+
+Process-wide cache for external search results (Google job search, YouTube
+videos) shared by every user. Keys are normalized queries, so users with the
+same domain/skills/location/experience share one entry. Entries past their
+per-source TTL are still served while a background thread refreshes them
+(stale-while-revalidate); only entries past the stale window are fetched
+synchronously.
+"""
+
+import os
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, Optional, Tuple
+
+
+DEFAULT_TTLS = {
+    'jobs': int(os.getenv('SEARCH_CACHE_TTL_JOBS', 6 * 60 * 60)),
+    'youtube': int(os.getenv('SEARCH_CACHE_TTL_YOUTUBE', 24 * 60 * 60)),
+}
+
+
+def normalize_query_part(part: Any) -> str:
+    """
+    Lowercase, trim and collapse whitespace; sequences are normalized element-wise
+
+    Lists and tuples keep their order (it can show in the cached result, e.g. the
+    job search's query string); sets are sorted. Callers whose results do not
+    depend on order sort the part themselves.
+    """
+    if isinstance(part, (set, frozenset)):
+        return "|".join(sorted(normalize_query_part(p) for p in part))
+    if isinstance(part, (list, tuple)):
+        return "|".join(normalize_query_part(p) for p in part)
+    return " ".join(str(part if part is not None else "").lower().split())
+
+
+class SearchResultCache:
+    """Bounded LRU cache with per-source TTLs and stale-while-revalidate"""
+
+    def __init__(
+        self,
+        ttls: Dict[str, int] = None,
+        stale_seconds: int = None,
+        max_entries: int = None,
+        refresh_workers: int = 2
+    ):
+        """
+        Args:
+            ttls: Fresh lifetime per source in seconds (see DEFAULT_TTLS)
+            stale_seconds: How long past the TTL an entry may still be served (SEARCH_CACHE_STALE_SECONDS, default 1 day)
+            max_entries: LRU size bound across all sources (SEARCH_CACHE_MAX_ENTRIES, default 2000)
+            refresh_workers: Background refresh threads
+        """
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.stale_seconds = stale_seconds if stale_seconds is not None else int(os.getenv('SEARCH_CACHE_STALE_SECONDS', 24 * 60 * 60))
+        self.max_entries = max_entries or int(os.getenv('SEARCH_CACHE_MAX_ENTRIES', 2000))
+
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._refresher = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="search-cache-refresh")
+        self._stats = {"hits": 0, "staleHits": 0, "misses": 0, "refreshes": 0, "refreshErrors": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(source: str, parts: Iterable[Any]) -> str:
+        normalized = "\x1f".join(normalize_query_part(p) for p in parts)
+        return f"{source}:{hashlib.sha256(normalized.encode('utf-8')).hexdigest()}"
+
+    def _ttl(self, source: str) -> int:
+        return self.ttls.get(source, 60 * 60)
+
+    def _store(self, key: str, value: Any):
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _refresh(self, key: str, fetch: Callable[[], Any], should_cache: Callable[[Any], bool]):
+        try:
+            value = fetch()
+            if should_cache(value):
+                self._store(key, value)
+            self._stats["refreshes"] += 1
+        except Exception as e:
+            self._stats["refreshErrors"] += 1
+            print(f"⚠️ Background search refresh failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get_or_fetch(
+        self,
+        source: str,
+        parts: Iterable[Any],
+        fetch: Callable[[], Any],
+        should_cache: Callable[[Any], bool] = lambda value: True
+    ) -> Tuple[Any, str]:
+        """
+        Return a cached result, fetching or refreshing it as needed
+
+        Args:
+            source: Result source ("jobs", "youtube") - selects the TTL
+            parts: Query parts that identify the result; normalized into the key
+            fetch: Zero-argument callable performing the real API call
+            should_cache: Predicate deciding whether a fetched value is cacheable (e.g. not an error)
+
+        Returns:
+            (value, status) where status is "hit", "stale" or "miss"
+        """
+        key = self.make_key(source, parts)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = now - entry[0]
+                ttl = self._ttl(source)
+                if age < ttl:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return entry[1], "hit"
+                if age < ttl + self.stale_seconds:
+                    self._entries.move_to_end(key)
+                    self._stats["staleHits"] += 1
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        self._refresher.submit(self._refresh, key, fetch, should_cache)
+                    return entry[1], "stale"
+                del self._entries[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Concurrent misses for the same query wait for one fetch instead of all calling the API
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and time.time() - entry[0] < self._ttl(source):
+                    self._stats["hits"] += 1
+                    return entry[1], "hit"
+                self._stats["misses"] += 1
+            try:
+                value = fetch()
+                if should_cache(value):
+                    self._store(key, value)
+                return value, "miss"
+            finally:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+
+    def invalidate(self, source: Optional[str] = None):
+        """Drop all entries, or only those of one source"""
+        with self._lock:
+            if source is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k.startswith(f"{source}:")]:
+                    del self._entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["staleHits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hitRate": round((self._stats["hits"] + self._stats["staleHits"]) / lookups, 3) if lookups else 0.0,
+                "size": len(self._entries),
+                "maxEntries": self.max_entries,
+                "ttlSeconds": dict(self.ttls),
+                "staleSeconds": self.stale_seconds
+            }
+
+
+# Singleton instance
+_search_cache = None
+_search_cache_lock = threading.Lock()
+
+def get_search_cache() -> SearchResultCache:
+    """Get or create the search result cache singleton"""
+    global _search_cache
+    if _search_cache is None:
+        with _search_cache_lock:
+            if _search_cache is None:
+                _search_cache = SearchResultCache()
+    return _search_cache
@@ -0,0 +1,244 @@
+"""
+Materialized Skill Gap Results
+
+Keeps one precomputed skill gap analysis per user in the 'skillGapResults'
+collection, so /api/skill-gap/analysis/<user_id> is a single _id lookup
+instead of two reads and a recomputation on every dashboard load.
+
+A result depends on the user's USER_INPUT_FIELDS (skills, role, name) and
+on the role's required skills. Writers that touch those inputs refresh the
+result (required-skills seeding a whole role at a time, through the
+vectorized cohort engine); writers of other user fields (profile updates,
+stored resume analyses) leave it alone. Each input carries a version stamp
+that is bumped on every input write ('skillsVersion' on users, 'version' on
+requiredSkills); a result records the stamps it was computed from and a
+refresh never overwrites a result computed from newer inputs, so concurrent
+refreshes cannot leave a stale analysis behind.
+
+No API route writes user skills, roles or names today (seed_data and direct
+database edits do), so `python rebuild_skill_gaps.py` must be run after any
+such write that does not go through touches_user_inputs().
+"""
+
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from services.mongodb_service import get_db
+from services.skill_gap_service import SkillGapService
+
+
+RESULTS_COLLECTION = 'skillGapResults'
+
+# Version stamp fields on the input documents
+USER_VERSION_FIELD = 'skillsVersion'
+REQUIRED_VERSION_FIELD = 'version'
+
+# User fields a skill gap analysis is computed from
+USER_INPUT_FIELDS = frozenset({'skills', 'role', 'name'})
+
+_USER_PROJECTION = {'_id': 1, 'name': 1, 'role': 1, 'skills': 1, USER_VERSION_FIELD: 1}
+
+DUPLICATE_KEY = 11000
+
+
+def touches_user_inputs(fields: Iterable[str]) -> bool:
+    """Whether a write of these user fields (dotted paths allowed) changes skill gap inputs"""
+    return any(field.split('.')[0] in USER_INPUT_FIELDS for field in fields)
+
+
+def bump_user_version() -> Dict[str, Any]:
+    """Update fragment recording a change to a user's skill gap inputs (merge into update_one)"""
+    return {'$inc': {USER_VERSION_FIELD: 1}}
+
+
+def bump_required_version() -> Dict[str, Any]:
+    """Update fragment recording a change to a role's required skills"""
+    return {'$inc': {REQUIRED_VERSION_FIELD: 1}}
+
+
+class SkillGapResultsStore:
+    """Materialized per-user skill gap analyses with version-guarded refreshes"""
+
+    def __init__(self, db=None, enabled: bool = None):
+        """
+        Args:
+            db: Database handle (defaults to get_db())
+            enabled: Serve analyses from the collection (SKILL_GAP_MATERIALIZED, default true)
+        """
+        self._db = db
+        self.enabled = enabled if enabled is not None else os.getenv('SKILL_GAP_MATERIALIZED', 'true').lower() == 'true'
+
+    @property
+    def collection(self):
+        return (self._db if self._db is not None else get_db())[RESULTS_COLLECTION]
+
+    def get(self, user_id: str) -> Dict[str, Any]:
+        """
+        Skill gap analysis for a user: the materialized result, computed and stored on a miss
+
+        Raises:
+            ValueError: If the user or the required skills of their role are missing
+        """
+        if not self.enabled:
+            return SkillGapService.calculate_skill_gap(user_id)
+        doc = self.collection.find_one({'_id': user_id}, {'analysis': 1})
+        if doc is not None:
+            return doc['analysis']
+        return self.refresh(user_id)
+
+    def refresh(self, user_id: str) -> Dict[str, Any]:
+        """
+        Recompute and store one user's analysis from the current inputs
+
+        Raises:
+            ValueError: If the user or the required skills of their role are missing
+                (any stored result is removed)
+        """
+        db = self._db if self._db is not None else get_db()
+        user = db.users.find_one({'_id': user_id}, _USER_PROJECTION)
+        if not user:
+            self.collection.delete_one({'_id': user_id})
+            raise ValueError(f"User {user_id} not found")
+
+        role = user.get('role')
+        required = db.requiredSkills.find_one({'role': role})
+        if not required:
+            self.collection.delete_one({'_id': user_id})
+            raise ValueError(f"Required skills for role {role} not found")
+
+        analysis = {
+            'user_info': {'user_id': user_id, 'name': user.get('name'), 'role': role},
+            **SkillGapService.compute_skill_gaps(user.get('skills', {}), required.get('skills', {}))
+        }
+        try:
+            self.collection.update_one(*self._guarded_upsert(user, required, analysis), upsert=True)
+        except DuplicateKeyError:
+            pass  # a refresh from newer inputs got there first
+        return analysis
+
+    def invalidate(self, user_id: str):
+        """
+        Bring a user's result up to date after one of its inputs changed
+
+        Best effort: the caller's write already succeeded, so failures only log
+        and drop the stored result (the next read recomputes it).
+        """
+        if not self.enabled:
+            return
+        try:
+            self.refresh(user_id)
+        except ValueError:
+            pass  # no analysis possible yet (no role or required skills); refresh removed the old one
+        except Exception as e:
+            print(f"⚠️ Skill gap refresh failed for {user_id}: {e}")
+            try:
+                self.collection.delete_one({'_id': user_id})
+            except Exception:
+                pass
+
+    def refresh_role(self, role: str) -> Dict[str, int]:
+        """
+        Recompute every user of a role in one vectorized pass and store the results
+
+        Returns:
+            Counts of results written and skipped (newer result already stored)
+        """
+        # Imported here so per-user refreshes do not need NumPy
+        from services.cohort_skill_gap_service import CohortGaps
+
+        db = self._db if self._db is not None else get_db()
+        required = db.requiredSkills.find_one({'role': role})
+        users = list(db.users.find({'role': role}, _USER_PROJECTION))
+        if not required:
+            removed = self.collection.delete_many({'role': role}).deleted_count
+            return {'written': 0, 'skipped': 0, 'removed': removed}
+        if not users:
+            return {'written': 0, 'skipped': 0, 'removed': 0}
+
+        cohort = CohortGaps(users, required.get('skills', {}))
+        operations = [
+            UpdateOne(*self._guarded_upsert(user, required, cohort.user_result(row)), upsert=True)
+            for row, user in enumerate(users)
+        ]
+        skipped = 0
+        try:
+            self.collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            errors = e.details.get('writeErrors', [])
+            if any(error.get('code') != DUPLICATE_KEY for error in errors):
+                raise
+            skipped = len(errors)
+        return {'written': len(operations) - skipped, 'skipped': skipped, 'removed': 0}
+
+    def rebuild(self, roles: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Recompute the collection role by role
+
+        Args:
+            roles: Only these roles; when omitted every role is rebuilt and results
+                that no role produced any more (deleted users, roles without
+                required skills) are removed
+
+        Returns:
+            Per-role counts and the number of orphaned results removed
+        """
+        db = self._db if self._db is not None else get_db()
+        started = datetime.utcnow()
+        full = roles is None
+        if full:
+            roles = sorted((set(db.requiredSkills.distinct('role')) | set(db.users.distinct('role'))) - {None})
+
+        per_role = {}
+        for role in roles:
+            per_role[role] = self.refresh_role(role)
+            print(f"   ✓ {role}: {per_role[role]['written']} result(s) written")
+
+        # Anything this rebuild did not touch is an orphan; that includes results
+        # guarded by a stamp newer than their user's (a user document recreated
+        # from scratch), which are then recomputed on the next read
+        orphans = 0
+        if full:
+            orphans = self.collection.delete_many({'computedAt': {'$lt': started}}).deleted_count
+        return {'roles': per_role, 'orphansRemoved': orphans}
+
+    @staticmethod
+    def _guarded_upsert(user: Dict[str, Any], required: Dict[str, Any], analysis: Dict[str, Any]):
+        """
+        (filter, update) storing an analysis unless the stored one came from newer inputs
+
+        The filter only matches a result computed from the same or older
+        stamps; otherwise the upsert turns into an insert that fails on _id.
+        """
+        user_version = user.get(USER_VERSION_FIELD, 0)
+        required_version = required.get(REQUIRED_VERSION_FIELD, 0)
+        role = user.get('role')
+        query = {
+            '_id': user['_id'],
+            'userVersion': {'$lte': user_version},
+            '$or': [{'role': {'$ne': role}}, {'requiredVersion': {'$lte': required_version}}]
+        }
+        update = {'$set': {
+            'role': role,
+            'analysis': analysis,
+            'userVersion': user_version,
+            'requiredVersion': required_version,
+            'computedAt': datetime.utcnow()
+        }}
+        return query, update
+
+
+# Singleton instance
+_results_store = None
+_results_store_lock = threading.Lock()
+
+def get_skill_gap_results() -> SkillGapResultsStore:
+    """Get or create the materialized skill gap results singleton"""
+    global _results_store
+    if _results_store is None:
+        with _results_store_lock:
+            if _results_store is None:
+                _results_store = SkillGapResultsStore()
+    return _results_store
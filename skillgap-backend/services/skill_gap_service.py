@@ -8,6 +8,7 @@ gap analysis with status categorization.
 
 from typing import Dict, List, Any
 from services.mongodb_service import get_db
+from services.skill_taxonomy import get_skill_taxonomy, SkillKey
 
 
 class SkillGapService:
@@ -45,13 +46,43 @@ class SkillGapService:
         
         required_skills = required_data.get('skills', {})
         
+        return {
+            'user_info': {
+                'user_id': user_id,
+                'name': user_data.get('name'),
+                'role': user_role
+            },
+            **SkillGapService.compute_skill_gaps(user_skills, required_skills)
+        }
+
+    @staticmethod
+    def compute_skill_gaps(user_skills: Dict[str, int], required_skills: Dict[str, int]) -> Dict[str, Any]:
+        """
+        Compare skill levels against a role's requirements (pure, no database access).
+        
+        Args:
+            user_skills: Skill name -> user's level
+            required_skills: Skill name -> level required by the role
+            
+        Returns:
+            Dictionary containing skill_gaps (largest gap first), match_percentage,
+            readiness_score and summary
+        """
+        # Match on taxonomy keys, so a profile's "NodeJS" covers a role's "Node.js"
+        # (names outside the taxonomy compare by their normalized spelling)
+        taxonomy = get_skill_taxonomy()
+        user_levels: Dict[SkillKey, int] = {}
+        for skill_name, level in user_skills.items():
+            key = taxonomy.key(skill_name)
+            user_levels[key] = max(level, user_levels.get(key, level))
+        
         # Calculate gaps for each required skill
         skill_gaps = []
         total_gap = 0
         total_required = 0
         
         for skill_name, required_level in required_skills.items():
-            user_level = user_skills.get(skill_name, 0)  # Default to 0 if user doesn't have the skill
+            user_level = user_levels.get(taxonomy.key(skill_name), 0)  # Default to 0 if user doesn't have the skill
             gap = required_level - user_level
             
             # Determine gap status based on gap value
@@ -91,11 +122,6 @@ class SkillGapService:
         readiness_score = max(0, min(100, match_percentage - penalty))
         
         return {
-            'user_info': {
-                'user_id': user_id,
-                'name': user_data.get('name'),
-                'role': user_role
-            },
             'skill_gaps': sorted(skill_gaps, key=lambda x: x['gap'], reverse=True),
             'match_percentage': match_percentage,
             'readiness_score': round(readiness_score, 2),
@@ -0,0 +1,388 @@
+"""
+Skill Taxonomy
+
+Canonical skills with their aliases, mapped to small integer IDs so every
+matcher compares the same thing: "Node.js", "nodejs" and "node js" are all
+skill 'Node.js', and a profile, a role's requirements or a job posting is
+just a set of IDs (or an int bitset of them). Aliases are only synonyms and
+spellings; distinct tools that belong together ("Keras" and "TensorFlow",
+"Jenkins" and "CI/CD") are separate skills linked by RELATED_SKILLS, which
+never counts as having the skill itself.
+
+Names and text are compared as token sequences: text is lowercased and split
+into [a-z0-9+#] runs, so "Node.js", "node js" and "NodeJS" all read as Node.js,
+and short aliases like "ml" or "js" only match whole words. Free text is read
+in one pass of a KeywordScanner holding every alias, compiled once. Aliases
+that are everyday words ("Go", "Spring") resolve as names but are not matched
+in text. Skill names that are not in the table (free-text skills from
+profiles or resumes) get no ID and are never added to the shared table:
+key() compares them by their normalized name, and a SkillMatcher matches a
+profile's own names in a posting without one user's "C" or "Cooking" ever
+matching in everybody's resumes and job postings.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+try:
+    from services.keyword_scanner import KeywordScanner, tokenize
+except ImportError:  # interview bot layout: the shared modules sit side by side
+    from keyword_scanner import KeywordScanner, tokenize
+
+# (canonical name, category, aliases) - the canonical name is always an alias too
+SKILLS: List[Tuple[str, str, List[str]]] = [
+    # Languages
+    ('Python', 'language', ['python3', 'python 3']),
+    ('Java', 'language', ['core java', 'java se', 'java ee']),
+    ('JavaScript', 'language', ['js', 'ecmascript', 'es6']),
+    ('TypeScript', 'language', ['ts']),
+    ('C++', 'language', ['cpp', 'c plus plus']),
+    ('C#', 'language', ['csharp', 'c sharp']),
+    ('Go', 'language', ['golang']),
+    ('Rust', 'language', []),
+    ('Kotlin', 'language', []),
+    ('Swift', 'language', []),
+    ('Ruby', 'language', []),
+    ('PHP', 'language', []),
+    ('Scala', 'language', []),
+    ('R', 'language', ['r programming', 'r language']),
+    ('Solidity', 'language', []),
+    ('HTML', 'web', ['html5']),
+    ('CSS', 'web', ['css3']),
+    ('Sass', 'web', ['scss']),
+    ('SQL', 'database', ['sql queries', 't-sql', 'pl/sql']),
+    # Web and backend frameworks
+    ('React', 'web', ['react.js', 'reactjs', 'react js']),
+    ('Angular', 'web', ['angularjs', 'angular.js']),
+    ('Vue', 'web', ['vue.js', 'vuejs']),
+    ('Node.js', 'web', ['node', 'nodejs', 'node js']),
+    ('Express', 'web', ['express.js', 'expressjs']),
+    ('Django', 'web', []),
+    ('Flask', 'web', []),
+    ('FastAPI', 'web', ['fast api']),
+    ('Spring', 'web', ['spring boot', 'springboot']),
+    ('Hibernate', 'web', []),
+    ('REST APIs', 'web', ['api', 'apis', 'rest', 'rest api', 'restful', 'restful apis', 'web services']),
+    ('GraphQL', 'web', []),
+    ('Frontend Development', 'web', ['frontend', 'front end', 'front-end development', 'ui development']),
+    ('Backend Development', 'web', ['backend', 'back end', 'back-end development', 'server-side development']),
+    ('Web Development', 'web', ['web dev', 'full stack', 'full-stack', 'fullstack']),
+    ('Responsive Design', 'web', []),
+    ('Mobile Development', 'mobile', ['mobile app development', 'ios/android']),
+    ('Android', 'mobile', ['android development']),
+    ('iOS', 'mobile', ['ios development']),
+    ('Flutter', 'mobile', []),
+    ('React Native', 'mobile', []),
+    # Data and databases
+    ('Databases', 'database', ['database', 'dbms', 'rdbms']),
+    ('MySQL', 'database', []),
+    ('PostgreSQL', 'database', ['postgres']),
+    ('MongoDB', 'database', ['mongo']),
+    ('Redis', 'database', []),
+    ('Kafka', 'data', ['apache kafka']),
+    ('Spark', 'data', ['apache spark', 'pyspark']),
+    ('Airflow', 'data', ['apache airflow']),
+    ('Data Analysis', 'data', ['data analytics', 'analytics']),
+    ('Data Science', 'data', []),
+    ('Data Pipelines', 'data', ['data pipeline', 'etl', 'data engineering']),
+    ('Data Visualization', 'data', ['visualization']),
+    ('Tableau', 'data', []),
+    ('Power BI', 'data', ['powerbi']),
+    ('Data Cleaning', 'data', ['data wrangling']),
+    ('Statistics', 'data', ['statistical analysis']),
+    ('Excel', 'data', ['microsoft excel', 'ms excel']),
+    ('Pandas', 'data', []),
+    ('NumPy', 'data', []),
+    # Machine learning and AI
+    ('Machine Learning', 'ml', ['ml', 'ml algorithms']),
+    ('Artificial Intelligence', 'ml', ['ai']),
+    ('Deep Learning', 'ml', ['dl']),
+    ('Neural Networks', 'ml', ['neural network']),
+    ('NLP', 'ml', ['natural language processing']),
+    ('Computer Vision', 'ml', ['cv']),
+    ('TensorFlow', 'ml', ['tensor flow']),
+    ('Keras', 'ml', []),
+    ('PyTorch', 'ml', ['torch']),
+    ('scikit-learn', 'ml', ['sklearn', 'scikit learn']),
+    ('Regression', 'ml', []),
+    ('Classification', 'ml', []),
+    ('Feature Engineering', 'ml', []),
+    ('Model Deployment', 'ml', ['mlops']),
+    # Cloud and DevOps
+    ('Cloud Computing', 'cloud', ['cloud', 'aws/azure/gcp']),
+    ('AWS', 'cloud', ['amazon web services']),
+    ('Azure', 'cloud', ['microsoft azure']),
+    ('GCP', 'cloud', ['google cloud', 'google cloud platform']),
+    ('Docker', 'devops', []),
+    ('Containerization', 'devops', ['containers']),
+    ('Kubernetes', 'devops', ['k8s']),
+    ('Terraform', 'devops', []),
+    ('CI/CD', 'devops', ['ci cd', 'continuous integration', 'continuous delivery']),
+    ('Jenkins', 'devops', []),
+    ('GitHub Actions', 'devops', []),
+    ('DevOps', 'devops', []),
+    ('Linux', 'devops', []),
+    ('Unix', 'devops', []),
+    ('Microservices', 'devops', ['microservice', 'microservices architecture']),
+    ('Monitoring', 'devops', ['observability']),
+    ('Automation', 'devops', []),
+    ('Git', 'tool', ['version control', 'git version control']),
+    ('GitHub', 'tool', []),
+    ('GitLab', 'tool', []),
+    # Engineering practice
+    ('System Design', 'practice', ['systems design', 'server architecture', 'architecture']),
+    ('Distributed Systems', 'practice', []),
+    ('Scalability', 'practice', []),
+    ('Algorithms', 'practice', ['data structures', 'data structures and algorithms', 'dsa']),
+    ('Agile', 'practice', []),
+    ('Scrum', 'practice', []),
+    ('Kanban', 'practice', []),
+    ('Testing', 'practice', ['unit testing', 'test automation', 'qa']),
+    ('Blockchain', 'practice', ['web3']),
+    ('Smart Contracts', 'practice', ['smart contract']),
+    # Security
+    ('Security', 'security', ['cybersecurity', 'cyber security', 'information security']),
+    ('Network Security', 'security', []),
+    ('Penetration Testing', 'security', ['pentesting', 'pen testing']),
+    ('Cryptography', 'security', ['encryption']),
+    ('Compliance', 'security', []),
+    # Soft skills
+    ('Communication', 'soft', ['communication skills', 'verbal communication', 'written communication']),
+    ('Leadership', 'soft', ['team leadership']),
+    ('Teamwork', 'soft', ['collaboration', 'team player']),
+    ('Problem Solving', 'soft', ['problem-solving', 'problem solving skills']),
+    ('Analytical Thinking', 'soft', ['analytical', 'analytical skills', 'critical thinking']),
+    ('Time Management', 'soft', []),
+]
+
+TECH_CATEGORIES = frozenset({
+    'language', 'web', 'mobile', 'database', 'data', 'ml', 'cloud', 'devops', 'tool', 'practice', 'security'
+})
+
+# Distinct skills that belong together (tool -> broader skills): a Keras user
+# is not at any TensorFlow level, but a keyword search for deep learning
+# tools should still notice Keras
+RELATED_SKILLS: Dict[str, List[str]] = {
+    'Sass': ['CSS'],
+    'Tableau': ['Data Visualization'],
+    'Power BI': ['Data Visualization'],
+    'Keras': ['TensorFlow', 'Deep Learning'],
+    'Containerization': ['Docker'],
+    'Jenkins': ['CI/CD'],
+    'GitHub Actions': ['CI/CD'],
+    'Unix': ['Linux'],
+    'GitHub': ['Git'],
+    'GitLab': ['Git'],
+    'Scrum': ['Agile'],
+    'Kanban': ['Agile'],
+}
+
+# Aliases that are also everyday words: they resolve as skill names ("Go" in a
+# profile) but are not matched in free text ("go to market")
+NAME_ONLY_ALIASES = frozenset({
+    'go', 'r', 'ts', 'cv', 'dl', 'qa', 'rest', 'spring', 'express', 'swift', 'rust', 'ruby',
+    'automation', 'monitoring', 'architecture', 'analytics', 'containers', 'analytical'
+})
+
+SkillKey = Union[int, Tuple[str, ...]]
+
+
+def popcount(mask: int) -> int:
+    """Number of skills in a bitset"""
+    return bin(mask).count('1')
+
+
+class SkillTaxonomy:
+    """Alias -> skill ID table with bitset helpers"""
+
+    def __init__(
+        self,
+        skills: List[Tuple[str, str, List[str]]] = None,
+        related: Dict[str, List[str]] = None
+    ):
+        """
+        Args:
+            skills: (canonical name, category, aliases) rows; defaults to SKILLS
+            related: Skill -> related skills (by canonical name); defaults to RELATED_SKILLS
+        """
+        self._ids: Dict[Tuple[str, ...], int] = {}
+        self._scanner = KeywordScanner()
+        self._names: List[str] = []
+        self._categories: List[str] = []
+        for name, category, aliases in (skills or SKILLS):
+            skill_id = self._add(name, category)
+            for alias in aliases:
+                self._add_alias(alias, skill_id)
+
+        # Symmetric: expanding CSS finds Sass, expanding Sass finds CSS
+        self._related: List[int] = [0] * len(self._names)
+        for name, others in (RELATED_SKILLS if related is None else related).items():
+            for other in others:
+                a, b = self._ids[tokenize(name)], self._ids[tokenize(other)]
+                self._related[a] |= 1 << b
+                self._related[b] |= 1 << a
+
+    def _add(self, name: str, category: str) -> int:
+        skill_id = len(self._names)
+        self._names.append(name)
+        self._categories.append(category)
+        self._add_alias(name, skill_id)
+        return skill_id
+
+    def _add_alias(self, alias: str, skill_id: int):
+        """Register an alias; everyday-word aliases resolve as names but are not matched in free text"""
+        tokens = tokenize(alias)
+        if tokens:
+            self._ids.setdefault(tokens, skill_id)
+            if ' '.join(tokens) not in NAME_ONLY_ALIASES:
+                self._scanner.add(alias, skill_id)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def lookup(self, name: str) -> Optional[int]:
+        """ID of a skill name or alias, or None if unknown"""
+        return self._ids.get(tokenize(name))
+
+    def key(self, name: str) -> SkillKey:
+        """
+        Comparison key of a skill name: its ID, or its normalized tokens when it
+        is not in the table (so "Figma" and "figma" still compare equal)
+        """
+        tokens = tokenize(name)
+        skill_id = self._ids.get(tokens)
+        return tokens if skill_id is None else skill_id
+
+    def name(self, skill_id: int) -> str:
+        """Canonical display name of a skill"""
+        return self._names[skill_id]
+
+    def category(self, skill_id: int) -> str:
+        return self._categories[skill_id]
+
+    def ids(self, names: Iterable[str]) -> Set[int]:
+        """IDs of the skill names that are in the table (unknown and blank names are skipped)"""
+        ids = set()
+        for name in names:
+            if isinstance(name, str):
+                skill_id = self.lookup(name)
+                if skill_id is not None:
+                    ids.add(skill_id)
+        return ids
+
+    def find_in_text(self, text: str) -> List[int]:
+        """
+        IDs of table skills mentioned in free text, in order of first mention
+
+        One pass of the alias scanner; the longest alias wins at each position,
+        so "machine learning engineer" is Machine Learning only.
+        """
+        return self._scanner.find(text)
+
+    def canonical(self, names: Iterable[str]) -> List[str]:
+        """
+        Canonical names for skill names, duplicates removed, order kept
+
+        Names not in the table keep their first spelling.
+        """
+        seen: Dict[SkillKey, str] = {}
+        for name in names:
+            if isinstance(name, str) and name.strip():
+                key = self.key(name)
+                if key not in seen:
+                    seen[key] = self._names[key] if isinstance(key, int) else name.strip()
+        return list(seen.values())
+
+    def related_mask(self, mask: int) -> int:
+        """Bitset of the skills related to any skill in mask (one hop, mask itself excluded)"""
+        related = 0
+        for skill_id in self.ids_from_mask(mask):
+            related |= self._related[skill_id]
+        return related & ~mask
+
+    @staticmethod
+    def mask(ids: Iterable[int]) -> int:
+        """Bitset with one bit per skill ID"""
+        mask = 0
+        for skill_id in ids:
+            mask |= 1 << skill_id
+        return mask
+
+    @staticmethod
+    def ids_from_mask(mask: int) -> List[int]:
+        ids = []
+        while mask:
+            low = mask & -mask
+            ids.append(low.bit_length() - 1)
+            mask ^= low
+        return ids
+
+    def mask_of(self, names: Iterable[str]) -> int:
+        """Bitset of the skill names that are in the table"""
+        return self.mask(self.ids(names))
+
+    def text_mask(self, text: str) -> int:
+        """Bitset of the skills mentioned in free text"""
+        return self.mask(self.find_in_text(text))
+
+    def matcher(self, names: Iterable[str]) -> 'SkillMatcher':
+        """A SkillMatcher for one profile's skill names"""
+        return SkillMatcher(self, names)
+
+
+class SkillMatcher:
+    """
+    One profile's skills, counted in many texts (job postings)
+
+    Table skills are matched as bitsets against the shared scanner. Names the
+    shared scanner does not read (names not in the table and everyday-word
+    aliases such as "Go") are matched as whole words by a scanner compiled for
+    this profile only, so a user's own "Figma" is found in a posting that
+    names it without Figma matching anywhere else.
+    """
+
+    def __init__(self, taxonomy: SkillTaxonomy, names: Iterable[str]):
+        self.taxonomy = taxonomy
+        self.mask = 0
+        self._own = KeywordScanner()
+        custom: Set[Tuple[str, ...]] = set()
+        for name in names:
+            if not isinstance(name, str) or not tokenize(name):
+                continue
+            key = taxonomy.key(name)
+            if isinstance(key, int):
+                self.mask |= 1 << key
+                if ' '.join(tokenize(name)) in NAME_ONLY_ALIASES:
+                    self._own.add(name, key)
+            else:
+                custom.add(key)
+                self._own.add(name, key)
+        self.count = popcount(self.mask) + len(custom)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def matches(self, text: str) -> int:
+        """How many of the profile's skills the text mentions"""
+        found = self.mask & self.taxonomy.text_mask(text)
+        custom = 0
+        for key in self._own.find(text):
+            if isinstance(key, int):
+                found |= 1 << key
+            else:
+                custom += 1
+        return popcount(found) + custom
+
+
+# Singleton instance
+_skill_taxonomy = None
+_skill_taxonomy_lock = threading.Lock()
+
+def get_skill_taxonomy() -> SkillTaxonomy:
+    """Get or create the skill taxonomy singleton"""
+    global _skill_taxonomy
+    if _skill_taxonomy is None:
+        with _skill_taxonomy_lock:
+            if _skill_taxonomy is None:
+                _skill_taxonomy = SkillTaxonomy()
+    return _skill_taxonomy
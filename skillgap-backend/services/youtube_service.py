@@ -6,15 +6,18 @@ Uses YouTube Data API v3 to search for skill-based learning content.
 """
 
 import os
-import requests
 from typing import List, Dict, Optional
+from services.http_client import get_http_client
+from services.search_cache_service import get_search_cache
+from services.metrics_service import track_dependency
+from services.skill_taxonomy import get_skill_taxonomy, TECH_CATEGORIES
 
 class YouTubeService:
     """Service for fetching educational videos from YouTube"""
     
     def __init__(self):
         self.api_key = os.getenv('GOOGLE_SEARCH_API_KEY')
-        self.base_url = 'https://www.googleapis.com/youtube/v3'
+        self.base_url = os.getenv('YOUTUBE_API_BASE_URL', 'https://www.googleapis.com/youtube/v3')
         
     def get_educational_videos(self, resume_analysis: Dict, max_results: int = 3) -> List[Dict]:
         """
@@ -57,6 +60,7 @@ class YouTubeService:
             List of skill keywords
         """
         skills = []
+        taxonomy = get_skill_taxonomy()
         
         try:
             # Check for skills in various possible fields
@@ -79,18 +83,14 @@ class YouTubeService:
                 
                 # Look for skills in summary text
                 if 'summary' in analysis and isinstance(analysis['summary'], str):
-                    # Extract potential skills from summary
-                    summary_lower = analysis['summary'].lower()
-                    common_skills = ['python', 'java', 'javascript', 'react', 'node.js', 
-                                   'sql', 'aws', 'docker', 'kubernetes', 'machine learning',
-                                   'data science', 'web development', 'mobile development']
-                    for skill in common_skills:
-                        if skill in summary_lower and skill not in skills:
-                            skills.append(skill)
+                    # Extract technical skills mentioned in the summary
+                    skills.extend(
+                        taxonomy.name(skill_id) for skill_id in taxonomy.find_in_text(analysis['summary'])
+                        if taxonomy.category(skill_id) in TECH_CATEGORIES
+                    )
             
-            # Clean and deduplicate skills
-            skills = [s.strip() for s in skills if s and isinstance(s, str)]
-            skills = list(dict.fromkeys(skills))  # Remove duplicates while preserving order
+            # Canonical names, one per skill ("GitHub" and "Git" are the same search)
+            skills = taxonomy.canonical(s for s in skills if s and isinstance(s, str))
             
         except Exception as e:
             print(f"⚠️ Error extracting skills: {str(e)}")
@@ -99,7 +99,7 @@ class YouTubeService:
     
     def _search_youtube_videos(self, query: str, max_results: int) -> List[Dict]:
         """
-        Search YouTube for educational videos
+        Search YouTube for educational videos (served from the shared search cache when possible)
         
         Args:
             query: Search query string
@@ -108,11 +108,38 @@ class YouTubeService:
         Returns:
             List of video objects
         """
+        if not self.api_key:
+            print("⚠️ YouTube API key not found in environment")
+            return self._get_fallback_videos()
+        
         try:
-            if not self.api_key:
-                print("⚠️ YouTube API key not found in environment")
-                return self._get_fallback_videos()
+            # Word order does not change the results, so "react python" and "python react" share an entry
+            videos, cache_status = get_search_cache().get_or_fetch(
+                'youtube',
+                (sorted(query.lower().split()), max_results),
+                lambda: self._fetch_youtube_videos(query, max_results),
+                should_cache=lambda result: result is not None
+            )
+            if cache_status != 'miss':
+                print(f"🗄️ YouTube cache {cache_status} for query: {query}")
+        except Exception as e:
+            print(f"❌ Error searching YouTube: {str(e)}")
+            videos = None
+        
+        return videos if videos is not None else self._get_fallback_videos()
+    
+    def _fetch_youtube_videos(self, query: str, max_results: int) -> Optional[List[Dict]]:
+        """
+        Call the YouTube Data API search endpoint
+        
+        Args:
+            query: Search query string
+            max_results: Number of results to fetch
             
+        Returns:
+            List of video objects, or None if the API call failed
+        """
+        try:
             # YouTube Data API search endpoint
             search_url = f"{self.base_url}/search"
             
@@ -128,7 +155,8 @@ class YouTubeService:
                 'safeSearch': 'strict'
             }
             
-            response = requests.get(search_url, params=params, timeout=10)
+            with track_dependency('youtube', 'search'):
+                response = get_http_client().get(search_url, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -149,11 +177,11 @@ class YouTubeService:
                 return videos
             else:
                 print(f"⚠️ YouTube API returned status {response.status_code}")
-                return self._get_fallback_videos()
+                return None
                 
         except Exception as e:
             print(f"❌ Error searching YouTube: {str(e)}")
-            return self._get_fallback_videos()
+            return None
     
     def _get_fallback_videos(self) -> List[Dict]:
         """
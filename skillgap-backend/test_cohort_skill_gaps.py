@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized cohort skill gap analysis
+
+Run with: python -m pytest test_cohort_skill_gaps.py (or python test_cohort_skill_gaps.py)
+"""
+
+from services.cohort_skill_gap_service import CohortGaps
+from services.skill_gap_service import SkillGapService
+
+REQUIRED_SKILLS = {
+    'Python': 8,
+    'Node.js': 6,
+    'Machine Learning': 9,
+    'Docker': 5,
+    'SQL': 4,
+    'Quantum Basketweaving': 3,
+}
+
+USERS = [
+    {'_id': 'u1', 'name': 'All set', 'skills': {'Python': 9, 'Node.js': 7, 'Machine Learning': 9, 'Docker': 6, 'SQL': 5, 'Quantum Basketweaving': 3}},
+    {'_id': 'u2', 'name': 'Aliases', 'skills': {'python3': 6, 'NodeJS': 2, 'ML': 8, 'postgres': 4}},
+    {'_id': 'u3', 'name': 'Duplicate aliases', 'skills': {'NodeJS': 2, 'node.js': 5, 'Node': 3, 'Py': 1, 'Python': 4}},
+    {'_id': 'u4', 'name': 'Custom names', 'skills': {'quantum  basketweaving': 2, 'Underwater Welding': 9}},
+    {'_id': 'u5', 'name': 'Nothing yet', 'skills': {}},
+    {'_id': 'u6', 'name': 'No skills field'},
+    {'_id': 'u7', 'name': 'Mixed', 'skills': {'Docker': 1, 'Kubernetes': 8, 'SQL': 9, 'machine-learning': 3}},
+]
+
+
+def without_user_info(result):
+    return {k: v for k, v in result.items() if k != 'user_info'}
+
+
+def test_user_results_match_the_per_user_computation():
+    cohort = CohortGaps(USERS, REQUIRED_SKILLS)
+    for row, user in enumerate(USERS):
+        expected = SkillGapService.compute_skill_gaps(user.get('skills') or {}, REQUIRED_SKILLS)
+        assert without_user_info(cohort.user_result(row)) == expected, user['name']
+
+
+def test_parity_holds_for_roles_with_aliased_or_empty_requirements():
+    for required in ({'NodeJS': 5, 'Node.js': 7, 'C++': 6}, {'Python': 0}, {}):
+        cohort = CohortGaps(USERS, required)
+        for row, user in enumerate(USERS):
+            expected = SkillGapService.compute_skill_gaps(user.get('skills') or {}, required)
+            assert without_user_info(cohort.user_result(row)) == expected, (required, user['name'])
+
+
+def test_user_info_and_order():
+    cohort = CohortGaps(USERS, REQUIRED_SKILLS)
+    assert cohort.user_result(0)['user_info'] == {'user_id': 'u1', 'name': 'All set', 'role': None}
+    readiness = [cohort.user_result(int(row))['readiness_score'] for row in cohort.order(descending=True)]
+    assert readiness == sorted(readiness, reverse=True)
+    assert readiness[0] == 100
+
+
+if __name__ == "__main__":
+    test_user_results_match_the_per_user_computation()
+    test_parity_holds_for_roles_with_aliased_or_empty_requirements()
+    test_user_info_and_order()
+    print("✅ Cohort skill gap tests passed")
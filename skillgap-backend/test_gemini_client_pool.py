@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Tests for Gemini error classification in the client pool
+
+Run with: python -m pytest test_gemini_client_pool.py (or python test_gemini_client_pool.py)
+"""
+
+from google.api_core import exceptions as api_exceptions
+
+from services.gemini_client_pool import is_quota_error, is_request_error
+
+
+def test_errors_are_classified_by_type_and_status():
+    assert is_quota_error(api_exceptions.ResourceExhausted("Resource has been exhausted"))
+    assert is_quota_error(api_exceptions.TooManyRequests("slow down"))
+    assert is_request_error(api_exceptions.InvalidArgument("bad prompt"))
+    assert is_request_error(api_exceptions.BadRequest("bad request"))
+
+
+def test_digits_in_messages_do_not_change_the_class():
+    # A 400 whose message mentions 429 tokens, a 503 asking to retry in 400ms
+    assert not is_quota_error(api_exceptions.InvalidArgument("prompt has 429 tokens too many"))
+    assert not is_request_error(api_exceptions.ServiceUnavailable("retry in 400ms"))
+    assert not is_quota_error(api_exceptions.ServiceUnavailable("retry in 429ms"))
+    assert not is_request_error(RuntimeError("read 4000 bytes"))
+
+
+def test_untyped_errors_fall_back_to_the_message():
+    assert is_quota_error(RuntimeError("429 Too Many Requests"))
+    assert is_quota_error(RuntimeError("You exceeded your current quota"))
+    assert is_request_error(RuntimeError("400 Request contains an invalid argument"))
+    assert not is_quota_error(RuntimeError("connection reset"))
+
+
+if __name__ == "__main__":
+    test_errors_are_classified_by_type_and_status()
+    test_digits_in_messages_do_not_change_the_class()
+    test_untyped_errors_fall_back_to_the_message()
+    print("✅ Gemini client pool tests passed")
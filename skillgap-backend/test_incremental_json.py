@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental JSON field parser used to stream LLM answers
+
+Run with: python -m pytest test_incremental_json.py (or python test_incremental_json.py)
+"""
+
+import json
+
+from services.incremental_json import IncrementalJSONParser
+
+
+def feed_in_chunks(text, size):
+    parser = IncrementalJSONParser()
+    events = []
+    for i in range(0, len(text), size):
+        events.extend(parser.feed(text[i:i + size]))
+    return parser, events
+
+
+def test_fenced_output_with_prose_is_parsed():
+    text = 'Sure, here it is:\n```json\n{"question": "Why Python?", "category": "Technical"}\n```\n'
+    for size in (1, 3, 7, len(text)):
+        parser, events = feed_in_chunks(text, size)
+        assert events == [('question', 'Why Python?'), ('category', 'Technical')]
+        assert parser.done
+
+
+def test_fields_are_reported_as_soon_as_they_complete():
+    parser = IncrementalJSONParser()
+    assert parser.feed('{"question": "Tell me') == []
+    assert parser.feed(' about yourself", "difficulty"') == [('question', 'Tell me about yourself')]
+    assert parser.feed(': "Easy"}') == [('difficulty', 'Easy')]
+
+
+def test_escaped_quotes_braces_and_commas_inside_strings():
+    value = 'He said "hi, {there}" \\ and left'
+    text = json.dumps({'question': value, 'score': 7})
+    parser, events = feed_in_chunks(text, 2)
+    assert events == [('question', value), ('score', 7)]
+
+
+def test_nested_arrays_and_objects_are_one_field():
+    data = {'strengths': ['a, b', ['c', {'d': [1, 2]}]], 'meta': {'x': {'y': '}'}}, 'score': 8}
+    parser, events = feed_in_chunks(json.dumps(data), 5)
+    assert events == list(data.items())
+    assert parser.fields == data
+
+
+def test_text_after_the_object_is_ignored():
+    parser = IncrementalJSONParser()
+    assert parser.feed('{"a": 1} {"b": 2}') == [('a', 1)]
+    assert parser.feed('{"c": 3}') == []
+    assert parser.fields == {'a': 1}
+
+
+if __name__ == "__main__":
+    test_fenced_output_with_prose_is_parsed()
+    test_fields_are_reported_as_soon_as_they_complete()
+    test_escaped_quotes_braces_and_commas_inside_strings()
+    test_nested_arrays_and_objects_are_one_field()
+    test_text_after_the_object_is_ignored()
+    print("✅ Incremental JSON parser tests passed")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for the skill signal of embedding job ranking
+
+Uses a constant-vector stand-in for the sentence-transformer, so only the
+skill overlap and experience fit decide the order.
+
+Run with: python -m pytest test_job_ranking.py (or python test_job_ranking.py)
+"""
+
+import numpy as np
+
+from services.job_ranking_service import JobRanker
+from services.google_search_service import GoogleJobSearchService
+
+
+class ConstantModel:
+    """Encodes every text to the same unit vector"""
+
+    def encode(self, texts, **kwargs):
+        return np.ones((len(texts), 4), dtype=np.float32) / 2
+
+
+PROFILE = {
+    'interestedDomain': 'Product Design',
+    'experienceLevel': 'Mid level',
+    'skillsSelected': ['Figma', 'Salesforce', 'Keras', 'Python']
+}
+
+JOBS = [
+    {'title': 'Designer', 'snippet': 'Python scripting a plus', 'link': 'https://example.com/1'},
+    {'title': 'Product Designer', 'snippet': 'Figma, Salesforce, Keras and Python', 'link': 'https://example.com/2'},
+    {'title': 'Designer', 'snippet': 'Figma and Python', 'link': 'https://example.com/3'},
+    {'title': 'TensorFlow Engineer', 'snippet': 'TensorFlow models', 'link': 'https://example.com/4'},
+]
+
+
+def ranker():
+    ranker = JobRanker()
+    ranker._model = ConstantModel()
+    return ranker
+
+
+def keyword_order(jobs, profile):
+    service = GoogleJobSearchService.__new__(GoogleJobSearchService)
+    scores = [
+        service.calculate_job_match_score(f"{job['title']} {job['snippet']}", profile['skillsSelected'], profile['interestedDomain'])
+        for job in jobs
+    ]
+    return [jobs[i]['link'] for i in sorted(range(len(jobs)), key=lambda i: -scores[i])]
+
+
+def test_custom_skills_count_in_the_skill_signal():
+    ranked = ranker().rank(JOBS, PROFILE)
+    by_link = {job['link']: job['matchBreakdown']['skills'] for job in ranked}
+    assert by_link['https://example.com/2'] == 1.0
+    assert by_link['https://example.com/3'] == 0.5
+    # Keras is related to TensorFlow, not the same skill
+    assert by_link['https://example.com/4'] == 0.0
+
+
+def test_custom_skill_profiles_are_not_ranked_below_the_keyword_path():
+    ranked = [job['link'] for job in ranker().rank(JOBS, PROFILE)]
+    assert ranked == keyword_order(JOBS, PROFILE)
+
+
+if __name__ == "__main__":
+    test_custom_skills_count_in_the_skill_signal()
+    test_custom_skill_profiles_are_not_ranked_below_the_keyword_path()
+    print("✅ Job ranking tests passed")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass multi-keyword scanner
+
+Run with: python -m pytest test_keyword_scanner.py (or python test_keyword_scanner.py)
+"""
+
+from services.keyword_scanner import KeywordScanner
+
+
+def test_longest_match_wins_over_overlaps():
+    scanner = KeywordScanner(['machine learning', 'learning', 'machine learning engineer', 'engineer'])
+    assert scanner.find("Hiring a machine learning engineer") == ['machine learning engineer']
+    assert scanner.find("machine learning and deep learning") == ['machine learning', 'learning']
+    # scan() still reports every overlapping occurrence
+    assert len(scanner.scan("machine learning engineer")) == 4
+
+
+def test_matches_respect_word_boundaries():
+    scanner = KeywordScanner({'ml': 'ML', 'java': 'Java', 'node.js': 'Node.js', 'c++': 'C++', 'c#': 'C#'})
+    assert scanner.find("HTML and CSS") == []
+    assert scanner.find("JavaScript, TypeScript") == []
+    assert scanner.find("Java 17, ML pipelines") == ['Java', 'ML']
+    assert scanner.find("Built APIs in Node JS") == ['Node.js']
+    assert scanner.find("C# and C++ but not C") == ['C#', 'C++']
+
+
+def test_values_are_distinct_in_order_of_first_mention():
+    scanner = KeywordScanner({'senior': 'Senior', '5+ years': 'Senior', 'junior': 'Junior'})
+    assert scanner.find("Junior role, senior mentor, 5+ years") == ['Junior', 'Senior']
+
+
+def test_keywords_added_later_are_found():
+    scanner = KeywordScanner(['python'])
+    assert scanner.find("Python and Go") == ['python']
+    assert scanner.add('go')
+    assert not scanner.add('Go')
+    assert len(scanner) == 2
+    assert scanner.find("Python and Go") == ['python', 'go']
+
+
+if __name__ == "__main__":
+    test_longest_match_wins_over_overlaps()
+    test_matches_respect_word_boundaries()
+    test_values_are_distinct_in_order_of_first_mention()
+    test_keywords_added_later_are_found()
+    print("✅ Keyword scanner tests passed")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for resume section splitting in the prompt budget governor
+
+Run with: python -m pytest test_prompt_budget.py (or python test_prompt_budget.py)
+"""
+
+from services.prompt_budget import PromptBudget, split_sections
+
+
+UPPERCASE_RESUME = """Jane Doe
+jane@example.com
+
+SKILLS
+Python, SQL, Docker
+
+PUBLICATIONS
+A very long list of papers
+
+EXPERIENCE
+Software Engineer
+GOOGLE
+Built APIs
+
+EDUCATION
+BSc Computer Science
+
+MUSIC & THEATRE
+Guitar, drama club"""
+
+TITLE_CASE_RESUME = """Jane Doe
+
+Experience
+Software Engineer
+Acme Corp
+
+Built APIs
+
+Hobbies
+Chess
+
+Education
+BSc
+
+Open Source Work:
+lib-x maintainer"""
+
+
+def test_unknown_uppercase_headings_start_other_blocks():
+    blocks = split_sections(UPPERCASE_RESUME)
+    assert [name for name, _ in blocks] == ['other', 'skills', 'other', 'experience', 'education', 'other']
+    assert blocks[2][1].startswith('PUBLICATIONS')
+    assert blocks[5][1].startswith('MUSIC & THEATRE')
+    # An all-caps company name inside a section is not a heading (it does not stand after a blank line)
+    assert 'GOOGLE' in blocks[3][1]
+
+
+def test_title_case_lines_need_a_known_heading_or_a_colon():
+    blocks = split_sections(TITLE_CASE_RESUME)
+    assert [name for name, _ in blocks] == ['other', 'experience', 'other', 'education', 'other']
+    assert 'Built APIs' in blocks[1][1]
+    assert blocks[2][1].startswith('Hobbies')
+    assert blocks[4][1].startswith('Open Source Work:')
+
+
+def test_unknown_section_does_not_use_the_previous_sections_share():
+    resume = "SKILLS\nPython, SQL\n\nPUBLICATIONS\n" + "\n".join(f"Paper number {i} on databases" for i in range(400))
+    result = PromptBudget(resume_budget_tokens=300).fit_resume(resume)
+    assert result.sections['skills']['keptTokens'] == result.sections['skills']['originalTokens']
+    assert result.sections['other']['keptTokens'] < result.sections['other']['originalTokens']
+
+
+if __name__ == "__main__":
+    test_unknown_uppercase_headings_start_other_blocks()
+    test_title_case_lines_need_a_known_heading_or_a_colon()
+    test_unknown_section_does_not_use_the_previous_sections_share()
+    print("✅ Prompt budget tests passed")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for reusing speculative interview questions
+
+Run with: python -m pytest test_question_prefetch.py (or python test_question_prefetch.py)
+"""
+
+import threading
+
+from services.question_prefetch import QuestionPrefetcher
+
+
+def prefetcher():
+    return QuestionPrefetcher(max_workers=1, wait_seconds=2, ttl_seconds=60, enabled=True)
+
+
+def question(text="Design a rate limiter", difficulty="Medium"):
+    return lambda: {'question': text, 'difficulty': difficulty}
+
+
+def test_same_band_is_a_hit():
+    p = prefetcher()
+    p.prefetch('s1', 3, 6.0, question())
+    assert p.take('s1', 3, 6.5)['question'] == "Design a rate limiter"
+    assert p.stats()['hits'] == 1
+    # Claimed once: a second take has nothing left
+    assert p.take('s1', 3, 6.5) is None
+    assert p.stats()['misses'] == 1
+
+
+def test_neighbouring_band_keeps_a_fitting_difficulty():
+    p = prefetcher()
+    # standard -> advanced: a medium question still suits both
+    p.prefetch('s1', 3, 6.0, question(difficulty="Medium"))
+    assert p.take('s1', 3, 8.0) is not None
+    assert p.stats()['adjusted'] == 1
+
+
+def test_band_change_with_unfitting_difficulty_is_stale():
+    p = prefetcher()
+    # standard -> advanced, but an easy question no longer fits
+    p.prefetch('s1', 3, 6.0, question(difficulty="Easy"))
+    assert p.take('s1', 3, 8.0) is None
+    # standard -> expert is two bands away, whatever the difficulty
+    p.prefetch('s2', 3, 6.0, question(difficulty="Hard"))
+    assert p.take('s2', 3, 9.5) is None
+    assert p.stats()['stale'] == 2
+
+
+def test_wrong_question_number_is_stale():
+    p = prefetcher()
+    p.prefetch('s1', 3, 6.0, question())
+    assert p.take('s1', 4, 6.0) is None
+    assert p.stats()['stale'] == 1
+
+
+def test_already_asked_question_is_rejected():
+    p = prefetcher()
+    p.prefetch('s1', 3, 6.0, question("Design a rate limiter"))
+    assert p.take('s1', 3, 6.0, asked=["  design a RATE limiter "]) is None
+    assert p.stats()['stale'] == 1
+
+
+def test_failed_and_slow_generations_fall_back():
+    p = QuestionPrefetcher(max_workers=1, wait_seconds=0.05, ttl_seconds=60, enabled=True)
+
+    def broken():
+        raise RuntimeError("LLM down")
+
+    p.prefetch('s1', 3, 6.0, broken)
+    assert p.take('s1', 3, 6.0) is None
+    assert p.stats()['errors'] == 1
+
+    release = threading.Event()
+    p.prefetch('s2', 3, 6.0, lambda: release.wait(5) and {'question': 'late'})
+    assert p.take('s2', 3, 6.0) is None
+    release.set()
+    assert p.stats()['timeouts'] == 1
+
+
+def test_superseded_and_cancelled_prefetches_are_dropped():
+    p = prefetcher()
+    p.prefetch('s1', 3, 6.0, question("first"))
+    p.prefetch('s1', 3, 6.0, question("second"))
+    assert p.take('s1', 3, 6.0)['question'] == "second"
+    p.prefetch('s1', 4, 6.0, question())
+    p.cancel('s1')
+    assert p.take('s1', 4, 6.0) is None
+    assert p.stats()['cancelled'] == 2
+
+
+if __name__ == "__main__":
+    test_same_band_is_a_hit()
+    test_neighbouring_band_keeps_a_fitting_difficulty()
+    test_band_change_with_unfitting_difficulty_is_stale()
+    test_wrong_question_number_is_stale()
+    test_already_asked_question_is_rejected()
+    test_failed_and_slow_generations_fall_back()
+    test_superseded_and_cancelled_prefetches_are_dropped()
+    print("✅ Question prefetch tests passed")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Check that the modules shared with the interview bot have not diverged
+
+The backend's services/ copies are the source of truth; the interview bot
+keeps byte-identical copies next to its own modules (they import each other
+with a try/except on the `services.` prefix). Edit the backend copy, then
+copy it over.
+
+Run with: python -m pytest test_shared_modules.py (or python test_shared_modules.py)
+"""
+
+import os
+
+BACKEND_SERVICES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'services')
+INTERVIEW_BOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'interview_bot-main')
+
+SHARED_MODULES = [
+    'keyword_scanner.py',
+    'provider_health.py',
+    'question_prefetch.py',
+    'request_profiler.py',
+    'session_store.py',
+    'skill_taxonomy.py',
+]
+
+
+def diverged_modules():
+    """Shared modules whose interview bot copy differs from the backend one"""
+    diverged = []
+    for name in SHARED_MODULES:
+        with open(os.path.join(BACKEND_SERVICES, name), 'rb') as f:
+            source = f.read()
+        with open(os.path.join(INTERVIEW_BOT, name), 'rb') as f:
+            copy = f.read()
+        if source != copy:
+            diverged.append(name)
+    return diverged
+
+
+def test_shared_modules_are_identical():
+    diverged = diverged_modules()
+    assert not diverged, (
+        f"interview_bot-main copies differ from skillgap-backend/services: {', '.join(diverged)} "
+        f"(copy the backend version over)"
+    )
+
+
+if __name__ == "__main__":
+    test_shared_modules_are_identical()
+    print("✅ Shared modules are in sync")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for skill name matching on the skill taxonomy
+
+Run with: python -m pytest test_skill_taxonomy.py (or python test_skill_taxonomy.py)
+"""
+
+from services.skill_taxonomy import SkillTaxonomy, get_skill_taxonomy
+from services.skill_gap_service import SkillGapService
+
+
+def test_custom_skills_match_posting_text():
+    """Skills outside the table count when a posting names them, like table skills"""
+    matcher = get_skill_taxonomy().matcher(['Python', 'Figma', 'Salesforce', 'Keras'])
+    assert len(matcher) == 4
+    assert matcher.matches("We need Python, Figma, Salesforce and Keras") == 4
+    assert matcher.matches("We need Python and Keras") == 2
+    # Whole words only, as for table skills
+    assert matcher.matches("Figmatic tooling") == 0
+
+
+def test_custom_skills_stay_out_of_shared_matching():
+    taxonomy = get_skill_taxonomy()
+    size = len(taxonomy)
+    taxonomy.matcher(['Cooking'])
+    assert taxonomy.canonical(['Cooking', 'cooking']) == ['Cooking']
+    assert len(taxonomy) == size
+    assert taxonomy.find_in_text("Cooking for the team") == []
+
+
+def test_related_tools_are_not_the_same_skill():
+    taxonomy = get_skill_taxonomy()
+    assert taxonomy.mask_of(['Keras']) & taxonomy.text_mask("TensorFlow engineer") == 0
+    assert taxonomy.related_mask(taxonomy.mask_of(['Git'])) & taxonomy.mask_of(['GitHub'])
+    gaps = SkillGapService.compute_skill_gaps({'Keras': 8, 'Jenkins': 7}, {'TensorFlow': 8, 'CI/CD': 7})
+    assert [gap['user_level'] for gap in gaps['skill_gaps']] == [0, 0]
+
+
+def test_skill_gaps_compare_unknown_names_by_spelling():
+    """Names outside the table still match a role's identical name, however many have been seen"""
+    gaps = SkillGapService.compute_skill_gaps(
+        {'Figma': 7, 'nodejs': 6, 'Go': 5},
+        {'figma': 7, 'Node.js': 6, 'golang': 5}
+    )
+    assert [gap['user_level'] for gap in gaps['skill_gaps']] == [7, 6, 5]
+    assert gaps['match_percentage'] == 100.0
+
+
+def test_related_skills_must_name_table_skills():
+    try:
+        SkillTaxonomy(related={'Figma': ['CSS']})
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("expected an unknown related skill to be rejected")
+
+
+if __name__ == "__main__":
+    test_custom_skills_match_posting_text()
+    test_custom_skills_stay_out_of_shared_matching()
+    test_related_tools_are_not_the_same_skill()
+    test_skill_gaps_compare_unknown_names_by_spelling()
+    test_related_skills_must_name_table_skills()
+    print("✅ Skill taxonomy tests passed")
@@ -0,0 +1,40 @@
+"""
+Resume Analysis Worker
+
+Runs resume analysis jobs from the MongoDB queue in a process separate from
+the web server. Start as many of these as needed:
+
+    python worker.py --concurrency 4
+
+Set ANALYSIS_WORKERS_IN_PROCESS=0 for the web server when running dedicated workers.
+"""
+
+import argparse
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from services.analysis_job_service import AnalysisWorkerPool, get_analysis_job_queue
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SkillBridge resume analysis worker")
+    parser.add_argument('--concurrency', type=int, default=2, help="Number of worker threads")
+    parser.add_argument('--poll-interval', type=float, default=1.0, help="Seconds between polls when idle")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("SkillBridge Resume Analysis Worker")
+    print("=" * 70)
+
+    pool = AnalysisWorkerPool(get_analysis_job_queue(), concurrency=args.concurrency, poll_interval=args.poll_interval)
+    pool.start()
+    try:
+        pool.join()
+    except KeyboardInterrupt:
+        print("\n🛑 Stopping workers...")
+        pool.stop()
+
+
+if __name__ == '__main__':
+    main()
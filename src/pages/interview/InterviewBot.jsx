@@ -15,6 +15,47 @@ import '../../styles/InterviewBot.css';
 // API Configuration
 const API_BASE_URL = 'http://localhost:5000/api';
 
+// Read a text/event-stream response, calling onEvent(event, data) per event.
+// Resolves with the data of the final "done" event.
+const readEventStream = async (response, onEvent) => {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let result = null;
+
+    for (;;) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const raw = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+
+            let event = 'message';
+            let data = '';
+            raw.split('\n').forEach(line => {
+                if (line.startsWith('event:')) event = line.slice(6).trim();
+                else if (line.startsWith('data:')) data += line.slice(5).trim();
+            });
+            const payload = data ? JSON.parse(data) : null;
+            if (event === 'done') result = payload;
+            onEvent?.(event, payload);
+        }
+    }
+    return result;
+};
+
+// Fetch a streaming endpoint; early errors (404, completed, validation) come back as plain JSON
+const fetchStream = async (url, options, onEvent) => {
+    const response = await fetch(url, options);
+    if (!(response.headers.get('Content-Type') || '').includes('text/event-stream')) {
+        return response.json();
+    }
+    return readEventStream(response, onEvent);
+};
+
 const InterviewBot = () => {
     const navigate = useNavigate();
     const location = useLocation();
@@ -110,12 +151,11 @@ const InterviewBot = () => {
         }
     };
 
-    const getNextQuestion = async (sessionId) => {
+    const getNextQuestion = async (sessionId, onEvent) => {
         try {
-            const response = await fetch(`${API_BASE_URL}/interview/${sessionId}/question`);
-            const data = await response.json();
+            const data = await fetchStream(`${API_BASE_URL}/interview/${sessionId}/question/stream`, {}, onEvent);
 
-            if (!data.success) {
+            if (!data?.success) {
                 throw new Error(data.error || 'Failed to get question');
             }
 
@@ -126,9 +166,34 @@ const InterviewBot = () => {
         }
     };
 
-    const submitAnswer = async (sessionId, questionData, answer) => {
+    // Fetch the next question, showing it in the chat as soon as its text has streamed in
+    const loadQuestion = async (sessionId) => {
+        let questionNumber = null;
+        let shown = false;
+        const showQuestion = (text) => {
+            shown = true;
+            setChatMessages(prev => [...prev, {
+                type: 'bot',
+                text,
+                timestamp: new Date(),
+                questionNumber
+            }]);
+        };
+
+        const question = await getNextQuestion(sessionId, (event, payload) => {
+            if (event === 'start') questionNumber = payload.question_number;
+            if (event === 'field' && payload.key === 'question' && !shown) showQuestion(payload.value);
+        });
+        if (!shown) {
+            questionNumber = question.question_number;
+            showQuestion(question.question);
+        }
+        return question;
+    };
+
+    const submitAnswer = async (sessionId, questionData, answer, onEvent) => {
         try {
-            const response = await fetch(`${API_BASE_URL}/interview/${sessionId}/answer`, {
+            const data = await fetchStream(`${API_BASE_URL}/interview/${sessionId}/answer/stream`, {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -137,11 +202,9 @@ const InterviewBot = () => {
                     question_data: questionData,
                     answer: answer
                 })
-            });
-
-            const data = await response.json();
+            }, onEvent);
 
-            if (!data.success) {
+            if (!data?.success) {
                 throw new Error(data.error || 'Failed to submit answer');
             }
 
@@ -391,17 +454,9 @@ const InterviewBot = () => {
             // Get first question after a delay
             setTimeout(async () => {
                 try {
-                    const question = await getNextQuestion(sessionData.session_id);
+                    const question = await loadQuestion(sessionData.session_id);
                     setCurrentQuestion(question);
                     setCurrentQuestionIndex(0);
-
-                    const questionMessage = {
-                        type: 'bot',
-                        text: question.question,
-                        timestamp: new Date(),
-                        questionNumber: question.question_number
-                    };
-                    setChatMessages(prev => [...prev, questionMessage]);
                     setIsLoading(false);
                 } catch {
                     setApiError('Failed to load question');
@@ -458,17 +513,9 @@ const InterviewBot = () => {
             setTimeout(async () => {
                 try {
                     setIsBotSpeaking(true);
-                    const nextQuestion = await getNextQuestion(sessionId);
+                    const nextQuestion = await loadQuestion(sessionId);
                     setCurrentQuestion(nextQuestion);
                     setCurrentQuestionIndex(prev => prev + 1);
-
-                    const questionMessage = {
-                        type: 'bot',
-                        text: nextQuestion.question,
-                        timestamp: new Date(),
-                        questionNumber: nextQuestion.question_number
-                    };
-                    setChatMessages(prev => [...prev, questionMessage]);
                     setIsBotSpeaking(false);
                 } catch {
                     // No more questions or error - complete interview
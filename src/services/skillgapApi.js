@@ -134,13 +134,26 @@ export const uploadResumeAPI = async (file, userId) => {
  * Analyze resume using Gemini API
  * @param {Object} data - Contains userId and resumeURL
  */
-export const analyzeResumeAPI = async (data) => {
+export const analyzeResumeAPI = async (data, { pollIntervalMs = 1000, timeoutMs = 180000 } = {}) => {
     try {
-        const response = await api.post('/ai/analyze-resume', data);
-        return response.data;
+        // The backend queues the analysis and returns a job id; poll until it is stored or failed
+        const queued = await api.post('/ai/analyze-resume', data);
+        const { jobId } = queued.data;
+        const deadline = Date.now() + timeoutMs;
+
+        while (Date.now() < deadline) {
+            const response = await api.get(`/ai/analyze-resume/${jobId}`);
+            const job = response.data;
+            if (job.status === 'stored' || job.status === 'failed') {
+                return job;
+            }
+            await new Promise((resolve) => setTimeout(resolve, pollIntervalMs));
+        }
+
+        throw { success: false, error: "Resume analysis is taking longer than expected. Please check back shortly." };
     } catch (error) {
         console.error("Error analyzing resume:", error);
-        throw error.response?.data || { message: "Resume analysis failed" };
+        throw error.response?.data || (error.error ? error : { message: "Resume analysis failed" });
     }
 };
 